@@ -9,31 +9,46 @@ Run this file to start the GUI application.
 import sys
 import os
 
-# Hide console window on Windows
-if sys.platform == "win32":
-    import ctypes
-    ctypes.windll.user32.ShowWindow(ctypes.windll.kernel32.GetConsoleWindow(), 0)
-
 # Add src directory to Python path
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(current_dir)  # Go up one level from launchers
 src_dir = os.path.join(project_root, 'src')
 sys.path.insert(0, src_dir)
 
-try:
-    from gui.main_window import main
-    
-    if __name__ == "__main__":
-        main()
-except ImportError as e:
-    import tkinter as tk
-    from tkinter import messagebox
-    root = tk.Tk()
-    root.withdraw()
-    messagebox.showerror("Import Error", f"Failed to import GUI components:\n{e}")
-except Exception as e:
+
+def _hide_console():
+    """Hide the console window on Windows; there is none to hide under pythonw."""
+    if sys.platform != "win32":
+        return
+    try:
+        import ctypes
+        ctypes.windll.user32.ShowWindow(ctypes.windll.kernel32.GetConsoleWindow(), 0)
+    except Exception:
+        pass
+
+
+def _fatal(title, message):
+    """Show an error dialog on a throwaway hidden root, then exit."""
     import tkinter as tk
     from tkinter import messagebox
     root = tk.Tk()
     root.withdraw()
-    messagebox.showerror("Error", f"An error occurred:\n{e}") 
\ No newline at end of file
+    messagebox.showerror(title, message)
+    root.destroy()
+    sys.exit(1)
+
+
+def _launch():
+    """Import the GUI on demand, then start it."""
+    from gui.main_window import main
+    main()
+
+
+if __name__ == "__main__":
+    _hide_console()
+    try:
+        _launch()
+    except ImportError as e:
+        _fatal("Import Error", f"Failed to import GUI components:\n{e}")
+    except Exception as e:
+        _fatal("Error", f"An error occurred:\n{e}")
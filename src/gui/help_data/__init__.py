@@ -0,0 +1 @@
+# API setup guide step contents, loaded on demand by gui.help_window
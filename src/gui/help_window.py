@@ -7,11 +7,230 @@ This module provides help windows for API setup guidance and documentation viewi
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
+from tkinter import font as tkfont
 import os
 import webbrowser
 import subprocess
-import platform
+import sys
 from pathlib import Path
+import re
+import functools
+import gc
+from importlib import resources
+
+# Docs are resolved against the project root so the help works from any CWD
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+_DOCS_DIR = _PROJECT_ROOT / 'docs'
+_DOCS = {
+    'documentation': _DOCS_DIR / 'DOCUMENTATION.md',
+    'gui_guide': _DOCS_DIR / 'GUI_GUIDE.md',
+    'file_naming': _DOCS_DIR / 'FILE_NAMING_EXAMPLES.md',
+    'credentials': _DOCS_DIR / 'CREDENTIALS_SETUP.md',
+    'readme': _PROJECT_ROOT / 'README.md',
+}
+
+
+def _spawn_detached(*command):
+    """Start a helper process without waiting for it, so the Tk main loop never blocks"""
+    subprocess.Popen(command, start_new_session=True, stdin=subprocess.DEVNULL,
+                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+# Resolve the platform's "open with default application" command once
+if sys.platform == "win32":
+    _open_with_system = os.startfile  # already returns immediately
+elif sys.platform == "darwin":
+    _open_with_system = lambda path: _spawn_detached("open", path)
+else:  # Linux
+    _open_with_system = lambda path: _spawn_detached("xdg-open", path)
+
+# Markdown line classification: one match per line decides heading/fence/bullet
+_LINE_RE = re.compile(r'(?P<h1># )|(?P<h2>## )|(?P<fence>```)|(?P<bullet>\s*[-*] )')
+# First characters that can start a non-plain line (bullets may be indented)
+_SPECIAL_PREFIX = frozenset('#-*` \t')
+
+_WELCOME_TEXT = """Welcome to LinkedIn Job Tracker Help Center!
+
+Select a help category from the left panel to get started:
+
+🔧 API Setup Guide - Step-by-step instructions for setting up Gmail API
+📖 User Documentation - Complete user guide and features
+🎯 GUI Guide - How to use the graphical interface
+📁 File Naming Examples - Understanding output file naming
+🔍 Troubleshooting - Common issues and solutions
+
+Quick Start:
+1. First, set up your Gmail API credentials using the API Setup Guide
+2. Review the User Documentation to understand all features
+3. Use the GUI Guide to learn the interface
+4. Check File Naming Examples to understand output files
+
+Need immediate help? Check the troubleshooting section for common issues.
+"""
+
+_TROUBLESHOOT_TEXT = """🔍 Troubleshooting Common Issues
+
+1. Authentication Issues:
+   - Error: "credentials.json not found"
+   - Solution: Run the API Setup Guide to create credentials
+   
+2. No Emails Found:
+   - Check that Gmail labels are set up correctly: LinkedIn/Applied, LinkedIn/Viewed, LinkedIn/Rejected
+   - Verify emails are labeled properly in Gmail
+   
+3. Parsing Errors:
+   - Check that emails are from LinkedIn (not other job sites)
+   - Verify email format hasn't changed
+   
+4. Permission Denied:
+   - Ensure Gmail API is enabled in Google Cloud Console
+   - Check OAuth consent screen is configured
+   
+5. GUI Not Responding:
+   - Processing large amounts of emails takes time
+   - Check console output for progress
+   
+6. Output File Issues:
+   - Ensure you have write permissions to the output directory
+   - Check that the file isn't open in another application
+
+For more detailed troubleshooting, check the DOCUMENTATION.md file.
+"""
+
+_STATIC_TEXTS = {'welcome': _WELCOME_TEXT, 'troubleshooting': _TROUBLESHOOT_TEXT}
+
+# Help category buttons: (label, kind) where kind is dispatched by HelpWindow._dispatch
+_HELP_ENTRIES = [
+    ("🔧 API Setup Guide", 'api'),
+    ("📖 User Documentation", 'md:documentation'),
+    ("🎯 GUI Guide", 'md:gui_guide'),
+    ("📁 File Naming Examples", 'md:file_naming'),
+    ("🔍 Troubleshooting", 'text:troubleshooting'),
+]
+
+
+def _parse_markdown(content):
+    """Convert markdown text into a list of (tag, text) segments; tag is None for plain text"""
+    tokens = []
+    if content and not content.endswith('\n'):
+        content += '\n'
+    # Lines keep their terminator, so most segments are slices of the source with no re-concatenation
+    for line in content.splitlines(keepends=True):
+        # Plain prose is the common case: skip classification when the line
+        # can't be a heading, fence or bullet and has no inline code
+        if line[:1] not in _SPECIAL_PREFIX and '`' not in line:
+            tokens.append((None, line))
+            continue
+        match = _LINE_RE.match(line)
+        kind = match.lastgroup if match else None
+        if kind == 'h1':
+            tokens.append(('heading1', line[2:]))
+        elif kind == 'h2':
+            tokens.append(('heading2', line[3:]))
+        elif kind == 'fence':
+            continue  # Skip code block markers
+        elif kind == 'bullet':
+            tokens.append((None, '  • ' + line[match.end():].strip() + '\n'))
+        elif '`' in line:
+            # Handle inline code: every other backtick-separated part is code,
+            # so a stray backtick (e.g. an indented fence) is dropped rather than shown
+            body = line.rstrip('\n')
+            for i, part in enumerate(body.split('`')):
+                if part:
+                    tokens.append(('code' if i % 2 else None, part))
+            tokens.append((None, line[len(body):]))
+        else:
+            tokens.append((None, line))
+    return tokens
+
+
+# Named fonts for the help content tags, created once per Tk interpreter
+_FONTS = {}
+
+
+def _get_fonts(widget):
+    """Return the shared tag fonts, creating them on first use (needs a live Tk root)"""
+    fonts = _FONTS.get(widget.tk)
+    if fonts is None:
+        fonts = {
+            'heading1': tkfont.Font(root=widget, family="Helvetica", size=14, weight="bold"),
+            'heading2': tkfont.Font(root=widget, family="Helvetica", size=12, weight="bold"),
+            'code': tkfont.Font(root=widget, family="Consolas", size=9),
+            'important': tkfont.Font(root=widget, family="Helvetica", size=10, weight="bold"),
+        }
+        _FONTS[widget.tk] = fonts
+    return fonts
+
+
+def _emit_chunks(tokens, chunk=200):
+    """Yield Text.insert argument lists covering roughly `chunk` lines each"""
+    args = []
+    lines = 0
+    for tag, text in tokens:
+        args.append(text)
+        args.append(tag or ())
+        if text.endswith('\n'):
+            lines += 1
+            if lines >= chunk:
+                yield args
+                args = []
+                lines = 0
+    if args:
+        yield args
+
+
+@functools.lru_cache(maxsize=8)
+def _load_and_parse(file_path, mtime):
+    """Read and tokenize a markdown file; mtime is part of the key so edits are picked up"""
+    return _parse_markdown(Path(file_path).read_text(encoding='utf-8'))
+
+
+@functools.lru_cache(maxsize=None)
+def _read_step_text(step):
+    """Load the API setup text for a step tab from the bundled help_data resources (read once per process)"""
+    return resources.files('gui.help_data').joinpath(f'step{step}.txt').read_text(encoding='utf-8')
+
+
+def _file_stamp(path):
+    """Cheap change marker for a file: (mtime, size), or None if it's missing"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime, st.st_size)
+
+
+def _read_doc(path):
+    """Return the text of a documentation file, or None if it doesn't exist"""
+    try:
+        return path.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        return None
+
+
+# Number of open help windows holding the GC freeze; only the first freezes
+# and only the last one to close unfreezes
+_gc_freeze_holders = 0
+
+
+def _hold_gc_freeze(window):
+    """Move the freshly built widget tree out of the collector's scan set until `window` closes"""
+    global _gc_freeze_holders
+    if _gc_freeze_holders == 0:
+        gc.collect()
+        gc.freeze()
+    _gc_freeze_holders += 1
+    
+    def on_destroy(event):
+        global _gc_freeze_holders
+        if event.widget is not window:
+            return  # <Destroy> also fires for every child widget
+        _gc_freeze_holders -= 1
+        if _gc_freeze_holders == 0:
+            gc.unfreeze()
+    
+    window.bind("<Destroy>", on_destroy, add="+")
+
 
 class HelpWindow:
     """Main help window with different help sections"""
@@ -30,7 +249,17 @@ class HelpWindow:
         # Center the window
         self.window.geometry("+%d+%d" % (parent.winfo_rootx() + 50, parent.winfo_rooty() + 50))
         
+        # One pre-rendered text pane per help category, raised on demand
+        self._panes = {}
+        self.content_text = None
+        # Pending idle-time render jobs, keyed by the pane they fill
+        self._render_jobs = {}
+        # What is currently shown, and the (mtime, size) each markdown pane was rendered from
+        self._current_kind = None
+        self._doc_stamps = {}
+        
         self.setup_ui()
+        self.window.bind("<Destroy>", self._on_destroy, add="+")
         
     def setup_ui(self):
         """Set up the help window UI"""
@@ -52,20 +281,9 @@ class HelpWindow:
         left_frame.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 10))
         
         # Help buttons
-        ttk.Button(left_frame, text="🔧 API Setup Guide", 
-                  command=self.show_api_setup, width=20).pack(pady=5, fill=tk.X)
-        
-        ttk.Button(left_frame, text="📖 User Documentation", 
-                  command=self.show_documentation, width=20).pack(pady=5, fill=tk.X)
-        
-        ttk.Button(left_frame, text="🎯 GUI Guide", 
-                  command=self.show_gui_guide, width=20).pack(pady=5, fill=tk.X)
-        
-        ttk.Button(left_frame, text="📁 File Naming Examples", 
-                  command=self.show_file_naming, width=20).pack(pady=5, fill=tk.X)
-        
-        ttk.Button(left_frame, text="🔍 Troubleshooting", 
-                  command=self.show_troubleshooting, width=20).pack(pady=5, fill=tk.X)
+        for label, kind in _HELP_ENTRIES:
+            ttk.Button(left_frame, text=label, command=lambda k=kind: self._dispatch(k),
+                      width=20).pack(pady=5, fill=tk.X)
         
         # Separator
         ttk.Separator(left_frame, orient='horizontal').pack(fill=tk.X, pady=10)
@@ -81,20 +299,9 @@ class HelpWindow:
         right_frame = ttk.LabelFrame(sections_frame, text="Help Content", padding="10")
         right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
         
-        # Content display area
-        self.content_text = scrolledtext.ScrolledText(right_frame, wrap=tk.WORD, 
-                                                     font=("Consolas", 10))
-        self.content_text.pack(fill=tk.BOTH, expand=True)
-        
-        # Configure text tags for formatting
-        self.content_text.tag_configure("heading1", font=("Helvetica", 14, "bold"), 
-                                       foreground="#2c3e50")
-        self.content_text.tag_configure("heading2", font=("Helvetica", 12, "bold"), 
-                                       foreground="#34495e")
-        self.content_text.tag_configure("code", font=("Consolas", 9), 
-                                       background="#f8f9fa", foreground="#e74c3c")
-        self.content_text.tag_configure("important", font=("Helvetica", 10, "bold"), 
-                                       foreground="#e67e22")
+        # Content display area: category panes are stacked here and raised in turn
+        self._pane_host = ttk.Frame(right_frame)
+        self._pane_host.pack(fill=tk.BOTH, expand=True)
         
         # Bottom buttons
         button_frame = ttk.Frame(main_frame)
@@ -104,160 +311,149 @@ class HelpWindow:
                   command=self.window.destroy).pack(side=tk.RIGHT)
         
         # Show initial content
-        self.show_welcome()
-    
-    def show_welcome(self):
-        """Show welcome message"""
-        content = """Welcome to LinkedIn Job Tracker Help Center!
-
-Select a help category from the left panel to get started:
-
-🔧 API Setup Guide - Step-by-step instructions for setting up Gmail API
-📖 User Documentation - Complete user guide and features
-🎯 GUI Guide - How to use the graphical interface
-📁 File Naming Examples - Understanding output file naming
-🔍 Troubleshooting - Common issues and solutions
-
-Quick Start:
-1. First, set up your Gmail API credentials using the API Setup Guide
-2. Review the User Documentation to understand all features
-3. Use the GUI Guide to learn the interface
-4. Check File Naming Examples to understand output files
-
-Need immediate help? Check the troubleshooting section for common issues.
-"""
-        self.display_content(content)
-    
-    def show_api_setup(self):
-        """Show API setup guidance"""
-        APISetupWindow(self.window)
+        self._dispatch('text:welcome')
+        
+        _hold_gc_freeze(self.window)
     
-    def show_documentation(self):
-        """Show user documentation"""
-        self.load_markdown_file("docs/DOCUMENTATION.md")
+    def _dispatch(self, kind):
+        """Show the help content for a `_HELP_ENTRIES` kind ('api', 'md:<doc>' or 'text:<name>')"""
+        source, _, key = kind.partition(':')
+        if source == 'api':
+            APISetupWindow(self.window)
+            return
+        
+        pane = self._panes.get(kind)
+        if pane is not None and not self._file_changed(kind):
+            if kind != self._current_kind:
+                self.content_text = pane
+                self._current_kind = kind
+                pane.frame.tkraise()
+            return
+        
+        # First visit or the document changed on disk: (re)fill the pane
+        if pane is None:
+            pane = self._panes[kind] = self._create_pane()
+        self.content_text = pane
+        self._current_kind = kind
+        if source == 'md':
+            self._doc_stamps[kind] = _file_stamp(_DOCS[key])
+            self._show_doc(key)
+        else:
+            self.display_content(_STATIC_TEXTS[key])
+        pane.frame.tkraise()
     
-    def show_gui_guide(self):
-        """Show GUI guide"""
-        self.load_markdown_file("docs/GUI_GUIDE.md")
+    def _file_changed(self, kind):
+        """Whether the markdown file behind `kind` differs from what its pane shows"""
+        source, _, key = kind.partition(':')
+        if source != 'md':
+            return False
+        return _file_stamp(_DOCS[key]) != self._doc_stamps.get(kind)
     
-    def show_file_naming(self):
-        """Show file naming examples"""
-        self.load_markdown_file("docs/FILE_NAMING_EXAMPLES.md")
+    def _create_pane(self):
+        """Create a formatted text pane stacked in the content area"""
+        # Undo tracking is off: content is only ever replaced wholesale, so the
+        # undo stack and its separators would just be bookkeeping on every insert
+        pane = scrolledtext.ScrolledText(self._pane_host, wrap=tk.WORD, 
+                                         font=("Consolas", 10),
+                                         undo=False, autoseparators=False)
+        pane.place(x=0, y=0, relwidth=1, relheight=1)
+        
+        # Configure text tags for formatting
+        fonts = _get_fonts(self.window)
+        pane.tag_configure("heading1", font=fonts['heading1'], 
+                           foreground="#2c3e50")
+        pane.tag_configure("heading2", font=fonts['heading2'], 
+                           foreground="#34495e")
+        pane.tag_configure("code", font=fonts['code'], 
+                           background="#f8f9fa", foreground="#e74c3c")
+        pane.tag_configure("important", font=fonts['important'], 
+                           foreground="#e67e22")
+        return pane
     
-    def show_troubleshooting(self):
-        """Show troubleshooting information"""
-        content = """🔍 Troubleshooting Common Issues
-
-1. Authentication Issues:
-   - Error: "credentials.json not found"
-   - Solution: Run the API Setup Guide to create credentials
-   
-2. No Emails Found:
-   - Check that Gmail labels are set up correctly: LinkedIn/Applied, LinkedIn/Viewed, LinkedIn/Rejected
-   - Verify emails are labeled properly in Gmail
-   
-3. Parsing Errors:
-   - Check that emails are from LinkedIn (not other job sites)
-   - Verify email format hasn't changed
-   
-4. Permission Denied:
-   - Ensure Gmail API is enabled in Google Cloud Console
-   - Check OAuth consent screen is configured
-   
-5. GUI Not Responding:
-   - Processing large amounts of emails takes time
-   - Check console output for progress
-   
-6. Output File Issues:
-   - Ensure you have write permissions to the output directory
-   - Check that the file isn't open in another application
-
-For more detailed troubleshooting, check the DOCUMENTATION.md file.
-"""
-        self.display_content(content)
+    def _show_doc(self, key):
+        """Show one of the bundled markdown documents by key"""
+        self.load_markdown_file(_DOCS[key])
     
     def load_markdown_file(self, file_path):
-        """Load and display a markdown file"""
+        """Load and display a markdown file, reusing parsed tokens if the file is unchanged"""
         try:
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                self.display_markdown_content(content)
-            else:
-                self.display_content(f"Documentation file not found: {file_path}")
+            tokens = _load_and_parse(file_path, os.stat(file_path).st_mtime)
+            self._render_tokens(tokens)
+        except FileNotFoundError:
+            self.display_content(f"Documentation file not found: {file_path}")
         except Exception as e:
             self.display_content(f"Error loading documentation: {e}")
     
     def display_markdown_content(self, content):
         """Display markdown content with basic formatting"""
-        self.content_text.delete(1.0, tk.END)
-        
-        lines = content.split('\n')
-        for line in lines:
-            if line.startswith('# '):
-                self.content_text.insert(tk.END, line[2:] + '\n', 'heading1')
-            elif line.startswith('## '):
-                self.content_text.insert(tk.END, line[3:] + '\n', 'heading2')
-            elif line.startswith('```'):
-                continue  # Skip code block markers
-            elif line.strip().startswith('- ') or line.strip().startswith('* '):
-                self.content_text.insert(tk.END, '  • ' + line.strip()[2:] + '\n')
-            elif '`' in line:
-                # Handle inline code
-                parts = line.split('`')
-                for i, part in enumerate(parts):
-                    if i % 2 == 0:
-                        self.content_text.insert(tk.END, part)
-                    else:
-                        self.content_text.insert(tk.END, part, 'code')
-                self.content_text.insert(tk.END, '\n')
-            else:
-                self.content_text.insert(tk.END, line + '\n')
+        self._render_tokens(_parse_markdown(content))
+    
+    def _render_tokens(self, tokens):
+        """Insert parsed (tag, text) segments into the current pane.
+
+        The first chunk is inserted right away; the rest are inserted on idle
+        ticks so large documents don't block the event loop.
+        """
+        pane = self.content_text
+        self._cancel_render(pane)
+        pane.delete(1.0, tk.END)
+        
+        self._render_next_chunk(pane, _emit_chunks(tokens))
+        pane.mark_set("insert", "1.0")
+    
+    def _render_next_chunk(self, pane, chunks):
+        """Insert one chunk of pending markdown into `pane` and reschedule until done"""
+        self._render_jobs.pop(pane, None)
+        args = next(chunks, None)
+        if args is None:
+            return
+        # Tk's insert accepts alternating text/tag-list pairs, so a whole chunk
+        # goes across to Tcl in a single call instead of one call per segment
+        pane.insert(tk.END, *args)
+        self._render_jobs[pane] = self.window.after_idle(self._render_next_chunk, pane, chunks)
+    
+    def _cancel_render(self, pane):
+        """Drop any markdown chunks still waiting to be inserted into `pane`"""
+        job = self._render_jobs.pop(pane, None)
+        if job is not None:
+            self.window.after_cancel(job)
+    
+    def _on_destroy(self, event):
+        """Cancel pending render jobs so none runs against the destroyed panes"""
+        if event.widget is not self.window:
+            return  # <Destroy> also fires for every child widget
+        for pane in list(self._render_jobs):
+            self._cancel_render(pane)
     
     def display_content(self, content):
-        """Display plain text content"""
-        self.content_text.delete(1.0, tk.END)
-        self.content_text.insert(1.0, content)
+        """Display plain text content in the current pane"""
+        pane = self.content_text
+        self._cancel_render(pane)
+        pane.delete(1.0, tk.END)
+        pane.insert(1.0, content)
+        pane.mark_set("insert", "1.0")
     
     def open_readme(self):
         """Open README.md file"""
-        readme_path = "README.md"
-        if os.path.exists(readme_path):
-            self.open_file(readme_path)
+        readme_path = _DOCS['readme']
+        if readme_path.exists():
+            self.open_path(readme_path)
         else:
             messagebox.showerror("Error", "README.md not found")
     
     def open_docs_folder(self):
         """Open documentation folder"""
-        docs_path = "docs"
-        if os.path.exists(docs_path):
-            self.open_folder(docs_path)
+        if _DOCS_DIR.is_dir():
+            self.open_path(_DOCS_DIR)
         else:
             messagebox.showerror("Error", "Documentation folder not found")
     
-    def open_file(self, file_path):
-        """Open a file with the default system application"""
-        try:
-            if platform.system() == "Windows":
-                os.startfile(file_path)
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.run(["open", file_path])
-            else:  # Linux
-                subprocess.run(["xdg-open", file_path])
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not open file: {e}")
-    
-    def open_folder(self, folder_path):
-        """Open a folder with the default system file manager"""
+    def open_path(self, path):
+        """Open a file or folder with the default system application"""
         try:
-            if platform.system() == "Windows":
-                os.startfile(folder_path)
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.run(["open", folder_path])
-            else:  # Linux
-                subprocess.run(["xdg-open", folder_path])
+            _open_with_system(path)
         except Exception as e:
-            messagebox.showerror("Error", f"Could not open folder: {e}")
+            messagebox.showerror("Error", f"Could not open {path}: {e}")
 
 
 class APISetupWindow:
@@ -291,118 +487,20 @@ class APISetupWindow:
         title_label.pack(pady=(0, 20))
         
         # Step-by-step notebook
-        notebook = ttk.Notebook(main_frame)
-        notebook.pack(fill=tk.BOTH, expand=True)
-        
-        # Step 1: Google Cloud Console
-        step1_frame = ttk.Frame(notebook, padding="15")
-        notebook.add(step1_frame, text="Step 1: Google Cloud Console")
-        
-        step1_content = """1. Create a Google Cloud Project
-
-• Go to Google Cloud Console: https://console.cloud.google.com/
-• Click "Select a project" → "New Project"
-• Enter project name (e.g., "LinkedIn Job Tracker")
-• Click "Create"
-
-2. Enable Gmail API
-
-• In the left sidebar, go to "APIs & Services" → "Library"
-• Search for "Gmail API"
-• Click on "Gmail API" and click "Enable"
-
-3. Create Credentials
-
-• Go to "APIs & Services" → "Credentials"
-• Click "Create Credentials" → "OAuth client ID"
-• If prompted, configure the OAuth consent screen first
-• Choose "Desktop application" as application type
-• Name it (e.g., "LinkedIn Job Tracker")
-• Click "Create"
-
-4. Download Credentials
-
-• Click the download button (⬇) next to your OAuth client
-• Save the file as "credentials.json" in your project root folder
-"""
+        self.notebook = ttk.Notebook(main_frame)
+        self.notebook.pack(fill=tk.BOTH, expand=True)
         
-        step1_text = scrolledtext.ScrolledText(step1_frame, wrap=tk.WORD, height=20)
-        step1_text.pack(fill=tk.BOTH, expand=True)
-        step1_text.insert(1.0, step1_content)
-        step1_text.config(state=tk.DISABLED)
+        # Step-by-step tabs; only the first is populated up front, the rest on first view
+        self._step_frames = []
+        self._populated = set()
         
-        # Step 2: Gmail Labels
-        step2_frame = ttk.Frame(notebook, padding="15")
-        notebook.add(step2_frame, text="Step 2: Gmail Labels")
+        for title in ("Step 1: Google Cloud Console", "Step 2: Gmail Labels", "Step 3: First Run"):
+            frame = ttk.Frame(self.notebook, padding="15")
+            self.notebook.add(frame, text=title)
+            self._step_frames.append(frame)
         
-        step2_content = """Set up Gmail Labels for LinkedIn Notifications
-
-1. Open Gmail in your web browser
-2. In the left sidebar, scroll down to "Labels"
-3. Click "Create new label"
-4. Create the following label structure:
-
-Required Labels:
-• LinkedIn (parent label)
-  • LinkedIn/Applied (child label)
-  • LinkedIn/Viewed (child label)
-  • LinkedIn/Rejected (child label)
-
-How to create nested labels:
-• For parent: Type "LinkedIn"
-• For child: Type "LinkedIn/Applied" (the "/" creates nesting)
-
-5. Apply labels to your LinkedIn emails:
-• When you receive a LinkedIn job application confirmation, label it "LinkedIn/Applied"
-• When you get a "viewed" notification, label it "LinkedIn/Viewed"
-• When you get a rejection, label it "LinkedIn/Rejected"
-
-Pro tip: Set up Gmail filters to automatically apply these labels based on email content!
-"""
-        
-        step2_text = scrolledtext.ScrolledText(step2_frame, wrap=tk.WORD, height=20)
-        step2_text.pack(fill=tk.BOTH, expand=True)
-        step2_text.insert(1.0, step2_content)
-        step2_text.config(state=tk.DISABLED)
-        
-        # Step 3: First Run
-        step3_frame = ttk.Frame(notebook, padding="15")
-        notebook.add(step3_frame, text="Step 3: First Run")
-        
-        step3_content = """First Time Setup
-
-1. File Placement
-• Ensure "credentials.json" is in your project root folder
-• The file should be in the same directory as this GUI application
-
-2. First Authentication
-• Run the LinkedIn Job Tracker application
-• Click "Start Processing"
-• A web browser will open asking for permissions
-• Sign in with your Google account
-• Grant permissions to access Gmail
-• The browser will show "The authentication flow has completed"
-
-3. Token Storage
-• After successful authentication, a "token.json" file will be created
-• This file stores your authentication token for future use
-• Keep this file secure and don't share it
-
-4. Test the Setup
-• Try running the application with a small date range first
-• Check that it can find your labeled emails
-• Verify the output CSV file is generated correctly
-
-Troubleshooting:
-• If you get "credentials.json not found" error, check file location
-• If browser doesn't open, check your firewall settings
-• If no emails found, verify your Gmail labels are set up correctly
-"""
-        
-        step3_text = scrolledtext.ScrolledText(step3_frame, wrap=tk.WORD, height=20)
-        step3_text.pack(fill=tk.BOTH, expand=True)
-        step3_text.insert(1.0, step3_content)
-        step3_text.config(state=tk.DISABLED)
+        self._populate_step(0)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         
         # Action buttons
         button_frame = ttk.Frame(main_frame)
@@ -419,27 +517,43 @@ Troubleshooting:
         
         ttk.Button(button_frame, text="Close", 
                   command=self.window.destroy).pack(side=tk.RIGHT)
+        
+        _hold_gc_freeze(self.window)
+    
+    def _on_tab_changed(self, event):
+        """Populate the newly selected step tab the first time it is shown"""
+        self._populate_step(self.notebook.index(self.notebook.select()))
+    
+    def _populate_step(self, index):
+        """Build the text widget for a step tab if it hasn't been built yet"""
+        if index in self._populated:
+            return
+        self._populated.add(index)
+        
+        step_text = scrolledtext.ScrolledText(self._step_frames[index], wrap=tk.WORD, height=20,
+                                              undo=False, autoseparators=False)
+        step_text.pack(fill=tk.BOTH, expand=True)
+        step_text.insert(1.0, _read_step_text(index + 1))
+        step_text.config(state=tk.DISABLED)
     
     def show_credentials_setup(self):
         """Show the credentials setup documentation"""
-        creds_path = "docs/CREDENTIALS_SETUP.md"
-        if os.path.exists(creds_path):
-            try:
-                with open(creds_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Create a new window to display the content
-                doc_window = tk.Toplevel(self.window)
-                doc_window.title("Credentials Setup Documentation")
-                doc_window.geometry("800x600")
-                
-                text_widget = scrolledtext.ScrolledText(doc_window, wrap=tk.WORD, 
-                                                       font=("Consolas", 10))
-                text_widget.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-                text_widget.insert(1.0, content)
-                text_widget.config(state=tk.DISABLED)
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Could not load credentials setup: {e}")
-        else:
-            messagebox.showerror("Error", "Credentials setup documentation not found") 
\ No newline at end of file
+        try:
+            content = _read_doc(_DOCS['credentials'])
+            if content is None:
+                messagebox.showerror("Error", "Credentials setup documentation not found")
+                return
+            
+            # Create a new window to display the content
+            doc_window = tk.Toplevel(self.window)
+            doc_window.title("Credentials Setup Documentation")
+            doc_window.geometry("800x600")
+            
+            text_widget = scrolledtext.ScrolledText(doc_window, wrap=tk.WORD, 
+                                                   font=("Consolas", 10))
+            text_widget.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+            text_widget.insert(1.0, content)
+            text_widget.config(state=tk.DISABLED)
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not load credentials setup: {e}")
@@ -0,0 +1,69 @@
+"""
+Log line classification for the GUI console
+
+These functions run once for every line the parser prints while the GUI is
+redirecting stdout, so they are kept free of GUI state and do as little work
+as possible per call.
+"""
+
+import re
+
+# google-re2 matches in linear time; the progress patterns fall back to re without it
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
+# Log colour tag by keyword. Each branch looks ahead over the whole message and
+# branches are tried in order, so an error keyword wins over success, and so on.
+_TAG_RE = re.compile(
+    r'(?=.*?(?:error|failed|exception))(?P<error>)'
+    r'|(?=.*?(?:success|completed|done|finished))(?P<success>)'
+    r'|(?=.*?warn)(?P<warning>)'
+    r'|(?=.*?(?:processing|found|fetching|authenticating))(?P<info>)',
+    re.IGNORECASE | re.DOTALL)
+
+# Lines matching any of these are progress updates (tqdm bars, page fetches, ...).
+# Patterns are bucketed under a substring every match must contain, so ordinary
+# log lines are rejected with a few `in` checks before any regex runs. Each
+# bucket is compiled into one alternation so a candidate line takes one search.
+_PROGRESS_BUCKETS = [(marker, _re_engine.compile('|'.join(f'(?:{p})' for p in patterns)))
+                     for marker, patterns in (
+    ('%', (
+        r'Processing.*?(\d+%)',
+        r'\d+%\|[█▉▊▋▌▍▎▏#\s]*\|',  # tqdm progress bar pattern
+        r'Processing.*?:\s*\d+%\|',  # tqdm with description and bar
+        r'Processing.*?Messages:\s*\d+%',
+        r'^\s*\d+%\|',  # Simple tqdm percentage with bar
+        r'Processing Applied:\s*\d+%\|',  # tqdm with Applied description
+        r'Processing LinkedIn/\w+:\s*\d+%\|',  # tqdm with LinkedIn labels
+        r'^\s*\d+%\|[█▉▊▋▌▍▎▏#\s]*\|\s*\d+/\d+\s*\[',  # Complete tqdm bar
+    )),
+    ('/', (
+        r'Processing Applied.*?(\d+)/(\d+)',
+        r'Processing LinkedIn.*?(\d+)/(\d+)',
+        r'^\s*\d+/\d+\s*\[\d+:\d+<\d+:\d+',  # tqdm format with time
+        r'^\s*\d+/\d+\s*\[\d+:\d+<\d+:\d+,\s*[\d.]+it/s\]',  # Full tqdm pattern
+    )),
+    ('it', (
+        r'^\s*\d+it\s*\[\d+:\d+',  # tqdm iterations
+        r'^\s*\d+it\s*\[\d+:\d+,\s*[\d.]+it/s\]',  # tqdm iterations with rate
+    )),
+    ('Fetching page', (r'Fetching page \d+',)),
+    ('Retrieved ', (r'Retrieved \d+ messages so far',)),
+    ('emails to process', (r'Found \d+ .* emails to process',)),
+)]
+
+
+def classify_tag(message):
+    """Return the console colour tag for a log message ('' if none applies)"""
+    match = _TAG_RE.match(message)
+    return match.lastgroup if match else ''
+
+
+def is_progress_line(text):
+    """Check if text is a progress update that should replace the previous line"""
+    for marker, pattern in _PROGRESS_BUCKETS:
+        if marker in text and pattern.search(text):
+            return True
+    return False
@@ -16,15 +16,60 @@ import platform
 from datetime import datetime, timedelta
 from tkinter import font
 import re
+import time
+import queue
+import collections
 
-# Add the parent directory to the path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Launchers put src/ on sys.path and import this as gui.main_window; only a direct
+# `python src/gui/main_window.py` run needs the parent directory added here
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.auth import authenticate
 from parsers.linkedin.processor import process_gmail_labels_to_csv, LABELS
 from utils.date_utils import get_date_range_query, get_date_range_description
 from utils.archive_utils import perform_archive, get_archive_summary
 from gui.help_window import HelpWindow, APISetupWindow
+from gui.log_fastpath import classify_tag, is_progress_line
+
+# How often the main loop drains queued log messages into the console (ms)
+_LOG_POLL_MS = 30
+# The console keeps the last _LOG_KEEP lines, trimmed once it grows past the threshold
+_LOG_TRIM_THRESHOLD = 1100
+_LOG_KEEP = 1000
+
+# Resolved once; both are only used by the "open" buttons
+_PLATFORM = platform.system()
+_OUTPUT_DIR = os.path.abspath("data/processed")
+
+# Quick date range options: (range code, button text)
+_DATE_OPTIONS = [
+    ("all", "All Time"),
+    ("24h", "Last 24 Hours"),
+    ("7d", "Last Week"),
+    ("30d", "Last Month"),
+    ("90d", "Last 3 Months"),
+    ("1y", "Last Year")
+]
+
+# Progress details extracted from parser output in parse_and_log_message
+_FOUND_MESSAGES_RE = re.compile(r'Found approximately (\d+) messages in (.+)')
+_FRACTION_RE = re.compile(r'(\d+)/(\d+)')
+_UNIQUE_APPS_RE = re.compile(r'(\d+) unique applications')
+_MAIN_REPORT_RE = re.compile(r'📄 Main Report: (.+)')
+_ERROR_LOG_RE = re.compile(r'📄 Error Log: (.+)')
+
+# Last formatted log timestamp, reused until the clock moves to the next second
+_last_ts_sec = [-1]
+_last_ts_str = ['']
+
+def _log_timestamp():
+    """Return the current time as HH:MM:SS, formatting at most once per second"""
+    sec = int(time.time())
+    if sec != _last_ts_sec[0]:
+        _last_ts_sec[0] = sec
+        _last_ts_str[0] = time.strftime("%H:%M:%S", time.localtime(sec))
+    return _last_ts_str[0]
 
 class EmailJobParserGUI:
     def __init__(self, root):
@@ -37,6 +82,17 @@ class EmailJobParserGUI:
         self.style = ttk.Style()
         self.style.theme_use('clam')
         
+        # Fonts shared by all widgets, created once instead of per label
+        self._fonts = {
+            'title': font.Font(family="Helvetica", size=16, weight="bold"),
+            'bold': font.Font(weight="bold"),
+            'small': font.Font(size=10),
+            'tiny': font.Font(size=9),
+            'micro': font.Font(size=8),
+            'mono': ('Consolas', 9),
+            'mono_small': ('Consolas', 8),
+        }
+        
         # Variables
         self.selected_date_range = tk.StringVar(value="all")
         self.is_running = False
@@ -44,8 +100,21 @@ class EmailJobParserGUI:
         self.total_progress = 0
         self.output_file_path = None
         self.failure_log_path = None
+        self._output_dir_checked = False
+        # Descriptions of the fixed quick ranges never change, so look them up once
+        self._range_desc_cache = {value: get_date_range_description(value) for value, _ in _DATE_OPTIONS}
+        
+        # Work posted from any thread for the Tk main loop: ('log', text, tag) entries
+        # and ('parse', line, skip_console) parser output, drained on a timer
+        self._inbox = queue.SimpleQueue()
+        # Authoritative copy of the newest console entries as (text, tag) pairs;
+        # the widget is rebuilt from it whenever it grows past the trim threshold
+        self._log_ring = collections.deque(maxlen=_LOG_KEEP)
+        # Lines currently in the console, tracked here instead of asking Tk
+        self._log_line_count = 0
         
         self.setup_ui()
+        self.root.after(_LOG_POLL_MS, self._drain_inbox)
         
     def setup_ui(self):
         """Set up the main user interface"""
@@ -65,8 +134,7 @@ class EmailJobParserGUI:
         self.root.resizable(True, True)  # Enable resizing
         
         # Title
-        title_font = font.Font(family="Helvetica", size=16, weight="bold")
-        title_label = ttk.Label(main_frame, text="LinkedIn Job Application Tracker", font=title_font)
+        title_label = ttk.Label(main_frame, text="LinkedIn Job Application Tracker", font=self._fonts['title'])
         title_label.grid(row=0, column=0, pady=(0, 15), sticky=tk.W+tk.E)
         
         # Description
@@ -88,7 +156,7 @@ class EmailJobParserGUI:
         
         # Selected range display
         self.selected_label = ttk.Label(date_frame, text="Selected: All time", 
-                                       font=font.Font(weight="bold"))
+                                       font=self._fonts['bold'])
         self.selected_label.grid(row=10, column=0, pady=(10, 0), sticky=tk.W+tk.E)
         
         # Action buttons - SCALABLE
@@ -145,17 +213,17 @@ class EmailJobParserGUI:
         # Email count display
         self.email_count_var = tk.StringVar(value="")
         self.email_count_label = ttk.Label(progress_frame, textvariable=self.email_count_var, 
-                                          font=font.Font(size=10))
+                                          font=self._fonts['small'])
         self.email_count_label.grid(row=1, column=0, sticky=tk.W+tk.E, pady=(3, 0))
         
         # Progress bar - SCALABLE
-        self.progress_bar = ttk.Progressbar(progress_frame, mode='indeterminate')
+        self.progress_bar = ttk.Progressbar(progress_frame, mode='determinate', maximum=100, value=0)
         self.progress_bar.grid(row=2, column=0, sticky=tk.W+tk.E, pady=(8, 0))
         
         # Progress percentage
         self.progress_percent_var = tk.StringVar(value="")
         self.progress_percent_label = ttk.Label(progress_frame, textvariable=self.progress_percent_var,
-                                               font=font.Font(size=9))
+                                               font=self._fonts['tiny'])
         self.progress_percent_label.grid(row=3, column=0, sticky=tk.W+tk.E, pady=(3, 0))
         
         # Console Output - SCALABLE (main expanding area)
@@ -170,7 +238,7 @@ class EmailJobParserGUI:
         console_controls.columnconfigure(0, weight=1)
         
         ttk.Label(console_controls, text="Real-time processing output:", 
-                 font=font.Font(size=9)).grid(row=0, column=0, sticky=tk.W)
+                 font=self._fonts['tiny']).grid(row=0, column=0, sticky=tk.W)
         
         clear_button = ttk.Button(console_controls, text="Clear", 
                                  command=self.clear_log)
@@ -182,8 +250,9 @@ class EmailJobParserGUI:
                                                  width=50,     # Minimum width
                                                  bg='#f8f9fa', 
                                                  fg='#212529',
-                                                 font=('Consolas', 9),
-                                                 wrap=tk.WORD)
+                                                 font=self._fonts['mono'],
+                                                 wrap=tk.WORD,
+                                                 state=tk.DISABLED)  # read-only; writers enable it briefly
         self.log_text.grid(row=1, column=0, sticky=tk.W+tk.E+tk.N+tk.S)
         
         # Configure text tags for color coding
@@ -191,7 +260,7 @@ class EmailJobParserGUI:
         self.log_text.tag_configure('error', foreground='#dc3545')
         self.log_text.tag_configure('warning', foreground='#ffc107')
         self.log_text.tag_configure('info', foreground='#17a2b8')
-        self.log_text.tag_configure('timestamp', foreground='#6c757d', font=('Consolas', 8))
+        self.log_text.tag_configure('timestamp', foreground='#6c757d', font=self._fonts['mono_small'])
         
         # Add initial welcome message
         self.log_message("🚀 LinkedIn Job Application Tracker ready!", 'info')
@@ -212,18 +281,8 @@ class EmailJobParserGUI:
         for i in range(3):
             quick_frame.columnconfigure(i, weight=1)
         
-        # Date range options with descriptions
-        date_options = [
-            ("all", "All Time"),
-            ("24h", "Last 24 Hours"),
-            ("7d", "Last Week"),
-            ("30d", "Last Month"),
-            ("90d", "Last 3 Months"),
-            ("1y", "Last Year")
-        ]
-        
         # Create buttons in a responsive grid
-        for i, (value, text) in enumerate(date_options):
+        for i, (value, text) in enumerate(_DATE_OPTIONS):
             row = i // 3
             col = i % 3
             
@@ -256,7 +315,7 @@ class EmailJobParserGUI:
         
         # Format help
         help_text = "Format: YYYY-MM-DD (e.g., 2024-01-01)"
-        ttk.Label(custom_frame, text=help_text, font=font.Font(size=8), 
+        ttk.Label(custom_frame, text=help_text, font=self._fonts['micro'], 
                  foreground="gray").grid(row=1, column=0, columnspan=5, sticky=tk.W, pady=(5, 0))
     
     def update_selected_range(self):
@@ -274,7 +333,7 @@ class EmailJobParserGUI:
             except ValueError:
                 description = "Custom range (invalid dates)"
         else:
-            description = get_date_range_description(range_value)
+            description = self._range_desc_cache[range_value]
         
         self.selected_label.config(text=f"Selected: {description}")
     
@@ -292,122 +351,196 @@ class EmailJobParserGUI:
         if not message or not message.strip():
             return
             
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = _log_timestamp()
         formatted_message = f"[{timestamp}] {message}\n"
         
-        # Ensure we're on the main thread
-        if threading.current_thread() != threading.main_thread():
-            self.root.after(0, lambda l=formatted_message.strip(): self._add_log_message(l, tag))
-        else:
-            self._add_log_message(formatted_message.strip(), tag)
+        # Safe from any thread; the console is only touched by _drain_inbox
+        self._inbox.put(('log', formatted_message, tag))
+    
+    def post_output_line(self, line, skip_console=False):
+        """Queue a line of parser output for parse_and_log_message (safe from any thread)"""
+        self._inbox.put(('parse', line, skip_console))
     
-    def _add_log_message(self, formatted_message, tag):
-        """Internal method to add message to log (must be called from main thread)"""
+    def call_in_gui(self, func, *args):
+        """Queue func(*args) to run on the main thread after earlier queued messages are shown"""
+        self._inbox.put(('call', func, args))
+    
+    def _drain_inbox(self):
+        """Handle queued work and write the resulting log messages in one batch (main thread only).
+
+        'log' items are inserted as-is; log_message supplies the trailing newline.
+        """
+        args = []
         try:
-            # Ensure the message ends with a newline for proper formatting
-            if not formatted_message.endswith('\n'):
-                formatted_message += '\n'
+            # Only take what is queued now; anything posted while draining waits for the next tick
+            for _ in range(self._inbox.qsize()):
+                try:
+                    kind, text, extra = self._inbox.get_nowait()
+                except queue.Empty:
+                    break
+                if kind == 'parse':
+                    # Parser output joins this batch in order instead of going back
+                    # through log_message to the end of the inbox
+                    if not extra and text.strip():
+                        self._batch_log(args, f"[{_log_timestamp()}] {text}\n", classify_tag(text))
+                    self._update_progress(text)
+                    continue
+                if kind == 'call':
+                    # Show everything queued before the call first (it may open a dialog)
+                    if args:
+                        self._write_log(args)
+                        args = []
+                    text(*extra)
+                    continue
+                self._batch_log(args, text, extra)
             
-            # Insert the message
-            self.log_text.insert(tk.END, formatted_message, tag)
+            if args:
+                self._write_log(args)
+        finally:
+            self.root.after(_LOG_POLL_MS, self._drain_inbox)
+    
+    def _batch_log(self, args, text, tag):
+        """Add a newline-terminated line to the pending insert args and the ring buffer"""
+        args.append(text)
+        args.append(tag)
+        self._log_ring.append((text, tag))
+        self._log_line_count += text.count('\n')
+    
+    def _write_log(self, args):
+        """Insert alternating text/tag pairs into the console"""
+        try:
+            self.log_text.configure(state=tk.NORMAL)
+            try:
+                # Insert the whole batch in a single call
+                self.log_text.insert(tk.END, *args)
+                
+                # Limit log size to prevent memory issues: past the threshold, replace the
+                # widget contents with the ring buffer in one go instead of shifting lines out
+                if self._log_line_count > _LOG_TRIM_THRESHOLD:
+                    self._rebuild_log_from_ring()
+            finally:
+                self.log_text.configure(state=tk.DISABLED)
             
             # Auto-scroll to bottom
             self.log_text.see(tk.END)
             
-            # Limit log size to prevent memory issues (keep last 1000 lines)
-            line_count = int(self.log_text.index('end-1c').split('.')[0])
-            if line_count > 1000:
-                self.log_text.delete('1.0', f'{line_count-1000}.0')
-            
             # Force update for real-time display
             self.root.update_idletasks()
         except Exception as e:
             # Fallback in case of any GUI issues
             print(f"Log display error: {e}")
             
+    def _rebuild_log_from_ring(self):
+        """Replace the console contents with the entries kept in the ring buffer (widget must be editable)"""
+        args = []
+        line_count = 0
+        for text, tag in self._log_ring:
+            args.append(text)
+            args.append(tag)
+            line_count += text.count('\n')
+        self.log_text.delete('1.0', tk.END)
+        if args:
+            self.log_text.insert(tk.END, *args)
+        self._log_line_count = line_count
+    
+    def _reset_log(self):
+        """Empty the console and its ring buffer"""
+        self.log_text.configure(state=tk.NORMAL)
+        self.log_text.delete(1.0, tk.END)
+        self.log_text.configure(state=tk.DISABLED)
+        self._log_ring.clear()
+        self._log_line_count = 0
+    
     def parse_and_log_message(self, message, skip_console=False):
         """Parse message for progress information and update GUI accordingly"""
         # Determine message type and color
-        tag = ''
-        if any(word in message.lower() for word in ['error', 'failed', 'exception']):
-            tag = 'error'
-        elif any(word in message.lower() for word in ['success', 'completed', 'done', 'finished']):
-            tag = 'success'
-        elif any(word in message.lower() for word in ['warning', 'warn']):
-            tag = 'warning'
-        elif any(word in message.lower() for word in ['processing', 'found', 'fetching', 'authenticating']):
-            tag = 'info'
+        tag = classify_tag(message)
         
         # Log the message first with appropriate color (unless we're replacing)
         if not skip_console:
             self.log_message(message, tag)
         
-        # Parse for progress information
+        self._update_progress(message)
+    
+    def _update_progress(self, message):
+        """Update the progress widgets from a line of parser output"""
+        # The first handler whose markers all appear wins
         try:
-            # Look for email count patterns
-            if "Found approximately" in message and "messages in" in message:
-                # Extract email count: "Found approximately 100 messages in LinkedIn/Applied"
-                match = re.search(r'Found approximately (\d+) messages in (.+)', message)
-                if match:
-                    count = int(match.group(1))
-                    label = match.group(2)
-                    self.email_count_var.set(f"Found {count} emails in {label}")
-                    
-                    # Set up progress bar for this batch
-                    if count > 0:
-                        self.total_progress = count
-                        self.current_progress = 0
-                        self.progress_bar.config(mode='determinate', maximum=count, value=0)
-                        self.progress_percent_var.set("0%")
-            
-            # Look for processing progress patterns
-            elif "Processing Applied" in message or "Processing LinkedIn" in message:
-                # Reset progress for new processing phase
-                self.current_progress = 0
-                self.progress_bar.config(value=0)
-                self.progress_percent_var.set("0%")
-            
-            # Look for individual email processing (from tqdm or similar)
-            elif "Applied" in message and "/" in message and "emails" in message:
-                # Try to extract progress from messages like "Processing Applied email 50/100"
-                match = re.search(r'(\d+)/(\d+)', message)
-                if match:
-                    current = int(match.group(1))
-                    total = int(match.group(2))
-                    self.current_progress = current
-                    self.total_progress = total
-                    self.progress_bar.config(maximum=total, value=current)
-                    percent = int((current / total) * 100) if total > 0 else 0
-                    self.progress_percent_var.set(f"{percent}%")
-                    self.email_count_var.set(f"Processing {current}/{total} emails")
-            
-            # Look for completion messages
-            elif "Successfully built database" in message:
-                match = re.search(r'(\d+) unique applications', message)
-                if match:
-                    count = int(match.group(1))
-                    self.email_count_var.set(f"✅ Found {count} unique applications")
-                    self.progress_bar.config(value=self.progress_bar['maximum'])
-                    self.progress_percent_var.set("100%")
-            
-            # Look for final file paths
-            elif "📄 Main Report:" in message:
-                # Extract file path for the "Open Latest File" button
-                path_match = re.search(r'📄 Main Report: (.+)', message)
-                if path_match:
-                    self.output_file_path = path_match.group(1).strip()
-                    self.open_file_button.config(state=tk.NORMAL)
-            
-            elif "📄 Error Log:" in message:
-                # Extract failure log path
-                path_match = re.search(r'📄 Error Log: (.+)', message)
-                if path_match:
-                    self.failure_log_path = path_match.group(1).strip()
-                    
+            for markers, handler in self._PROGRESS_DISPATCH:
+                if all(marker in message for marker in markers):
+                    handler(self, message)
+                    break
         except Exception as e:
             # If parsing fails, just log the original message
             pass
     
+    def _on_found_messages(self, message):
+        """Set up the progress bar from "Found approximately 100 messages in LinkedIn/Applied" """
+        match = _FOUND_MESSAGES_RE.search(message)
+        if match:
+            count = int(match.group(1))
+            label = match.group(2)
+            self.email_count_var.set(f"Found {count} emails in {label}")
+            
+            # Set up progress bar for this batch
+            if count > 0:
+                self.total_progress = count
+                self.current_progress = 0
+                self.progress_bar.config(mode='determinate', maximum=count, value=0)
+                self.progress_percent_var.set("0%")
+    
+    def _on_phase_start(self, message):
+        """Reset progress for a new processing phase"""
+        self.current_progress = 0
+        self.progress_bar.config(value=0)
+        self.progress_percent_var.set("0%")
+    
+    def _on_email_fraction(self, message):
+        """Track progress from messages like "Processing Applied email 50/100" """
+        match = _FRACTION_RE.search(message)
+        if match:
+            current = int(match.group(1))
+            total = int(match.group(2))
+            self.current_progress = current
+            self.total_progress = total
+            self.progress_bar.config(maximum=total, value=current)
+            percent = int((current / total) * 100) if total > 0 else 0
+            self.progress_percent_var.set(f"{percent}%")
+            self.email_count_var.set(f"Processing {current}/{total} emails")
+    
+    def _on_database_built(self, message):
+        """Fill the progress bar once the application database is complete"""
+        match = _UNIQUE_APPS_RE.search(message)
+        if match:
+            count = int(match.group(1))
+            self.email_count_var.set(f"✅ Found {count} unique applications")
+            self.progress_bar.config(value=self.progress_bar['maximum'])
+            self.progress_percent_var.set("100%")
+    
+    def _on_main_report(self, message):
+        """Remember the report path for the "Open Latest File" button"""
+        path_match = _MAIN_REPORT_RE.search(message)
+        if path_match:
+            self.output_file_path = path_match.group(1).strip()
+            self.open_file_button.config(state=tk.NORMAL)
+    
+    def _on_error_log(self, message):
+        """Remember the failure log path"""
+        path_match = _ERROR_LOG_RE.search(message)
+        if path_match:
+            self.failure_log_path = path_match.group(1).strip()
+    
+    # (markers that must all be present, handler), checked in order
+    _PROGRESS_DISPATCH = (
+        (("Found approximately", "messages in"), _on_found_messages),
+        (("Processing Applied",), _on_phase_start),
+        (("Processing LinkedIn",), _on_phase_start),
+        (("Applied", "/", "emails"), _on_email_fraction),
+        (("Successfully built database",), _on_database_built),
+        (("📄 Main Report:",), _on_main_report),
+        (("📄 Error Log:",), _on_error_log),
+    )
+    
     def start_processing(self):
         """Start the email processing in a separate thread"""
         if self.is_running:
@@ -424,8 +557,9 @@ class EmailJobParserGUI:
         self.is_running = True
         self.run_button.config(state=tk.DISABLED)
         self.stop_button.config(state=tk.NORMAL)
-        self.progress_bar.start()
-        self.log_text.delete(1.0, tk.END)
+        # The bar stays still until the parser reports a message count; no idle animation
+        self.progress_bar.config(value=0)
+        self._reset_log()
         
         # Start processing in a separate thread
         self.processing_thread = threading.Thread(target=self.process_emails, args=(date_range,))
@@ -441,19 +575,19 @@ class EmailJobParserGUI:
     def open_output_folder(self):
         """Open the data/processed folder in the system file explorer"""
         try:
-            output_dir = os.path.abspath("data/processed")
-            if not os.path.exists(output_dir):
-                os.makedirs(output_dir, exist_ok=True)
+            if not self._output_dir_checked:
+                os.makedirs(_OUTPUT_DIR, exist_ok=True)
+                self._output_dir_checked = True
             
             # Cross-platform folder opening
-            if platform.system() == "Windows":
-                os.startfile(output_dir)
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.run(["open", output_dir])
+            if _PLATFORM == "Windows":
+                os.startfile(_OUTPUT_DIR)
+            elif _PLATFORM == "Darwin":  # macOS
+                subprocess.run(["open", _OUTPUT_DIR])
             else:  # Linux
-                subprocess.run(["xdg-open", output_dir])
+                subprocess.run(["xdg-open", _OUTPUT_DIR])
                 
-            self.log_message(f"📁 Opened output folder: {output_dir}", 'info')
+            self.log_message(f"📁 Opened output folder: {_OUTPUT_DIR}", 'info')
         except Exception as e:
             self.log_message(f"❌ Error opening folder: {e}", 'error')
             messagebox.showerror("Error", f"Could not open output folder:\n{e}")
@@ -463,9 +597,9 @@ class EmailJobParserGUI:
         try:
             if self.output_file_path and os.path.exists(self.output_file_path):
                 # Cross-platform file opening
-                if platform.system() == "Windows":
+                if _PLATFORM == "Windows":
                     os.startfile(self.output_file_path)
-                elif platform.system() == "Darwin":  # macOS
+                elif _PLATFORM == "Darwin":  # macOS
                     subprocess.run(["open", self.output_file_path])
                 else:  # Linux
                     subprocess.run(["xdg-open", self.output_file_path])
@@ -480,15 +614,28 @@ class EmailJobParserGUI:
     
     def archive_files(self):
         """Archive processed files to organized folders"""
+        self.log_message("📦 Starting archive operation...", 'info')
+        self.status_var.set("Archiving files...")
+        self.archive_button.config(state=tk.DISABLED)
+        
+        # Move the files off the GUI thread; the outcome comes back through the inbox
+        threading.Thread(target=self._do_archive, daemon=True).start()
+    
+    def _do_archive(self):
+        """Run perform_archive in the background and hand the outcome to the main thread"""
         try:
-            self.log_message("📦 Starting archive operation...", 'info')
-            self.status_var.set("Archiving files...")
-            
-            # Force GUI update to show the status
-            self.root.update_idletasks()
-            
-            # Perform the archive operation
-            success, results = perform_archive()
+            outcome, error = perform_archive(), None
+        except (KeyboardInterrupt, Exception) as e:
+            outcome, error = None, e
+        self.call_in_gui(self._finish_archive, outcome, error)
+    
+    def _finish_archive(self, outcome, error):
+        """Report the result of a background archive (main thread only)"""
+        self.archive_button.config(state=tk.NORMAL)
+        try:
+            if error is not None:
+                raise error
+            success, results = outcome
             
             if success:
                 summary = get_archive_summary(results)
@@ -570,15 +717,6 @@ class EmailJobParserGUI:
             
             self.log_message("✅ Authentication successful", 'success')
             
-            if not self.is_running:
-                return
-            
-            self.progress_var.set("Fetching Gmail labels...")
-            self.status_var.set("Fetching labels...")
-            self.log_message("📋 Fetching Gmail labels...", 'info')
-            
-            all_labels = service.users().labels().list(userId='me').execute().get('labels', [])
-            
             if not self.is_running:
                 return
             
@@ -595,33 +733,10 @@ class EmailJobParserGUI:
                     self.gui = gui
                     self.buffer = ""
                     self.last_progress_line = None
-                    self.progress_patterns = [
-                        r'Processing Applied.*?(\d+)/(\d+)',
-                        r'Processing LinkedIn.*?(\d+)/(\d+)', 
-                        r'Processing.*?(\d+%)',
-                        r'Fetching page \d+',
-                        r'Retrieved \d+ messages so far',
-                        r'Found \d+ .* emails to process',
-                        r'\d+%\|[█▉▊▋▌▍▎▏#\s]*\|',  # tqdm progress bar pattern
-                        r'Processing.*?:\s*\d+%\|',  # tqdm with description and bar
-                        r'^\s*\d+/\d+\s*\[\d+:\d+<\d+:\d+',  # tqdm format with time
-                        r'^\s*\d+it\s*\[\d+:\d+',  # tqdm iterations
-                        r'Processing.*?Messages:\s*\d+%',
-                        r'^\s*\d+%\|',  # Simple tqdm percentage with bar
-                        r'Processing Applied:\s*\d+%\|',  # tqdm with Applied description
-                        r'Processing LinkedIn/\w+:\s*\d+%\|',  # tqdm with LinkedIn labels
-                        r'^\s*\d+/\d+\s*\[\d+:\d+<\d+:\d+,\s*[\d.]+it/s\]',  # Full tqdm pattern
-                        r'^\s*\d+%\|[█▉▊▋▌▍▎▏#\s]*\|\s*\d+/\d+\s*\[',  # Complete tqdm bar
-                        r'^\s*\d+it\s*\[\d+:\d+,\s*[\d.]+it/s\]'  # tqdm iterations with rate
-                    ]
                     
-                def is_progress_update(self, text):
-                    """Check if text is a progress update that should replace the previous line"""
-                    import re
-                    for pattern in self.progress_patterns:
-                        if re.search(pattern, text):
-                            return True
-                    return False
+                # Check if text is a progress update that should replace the previous line
+                # (bound directly: substring prefilters, then one combined regex per bucket)
+                is_progress_update = staticmethod(is_progress_line)
                     
                 def write(self, text):
                     if text:
@@ -644,9 +759,6 @@ class EmailJobParserGUI:
                             if line.strip():
                                 self._process_line(line.strip())
                     
-                    # Force GUI update for real-time display
-                    self.gui.root.update_idletasks()
-                    
                 def _process_line(self, line, is_progress_update=False):
                     """Process a single line of output"""
                     # Skip empty lines
@@ -662,15 +774,15 @@ class EmailJobParserGUI:
                             if self.last_progress_line and self.last_progress_line.strip() == line.strip():
                                 return  # Skip duplicate
                             # This is a completion message - show it
-                            self.gui.root.after(0, lambda l=line: self.gui.parse_and_log_message(l))
+                            self.gui.post_output_line(line)
                         # For all other progress updates, just update the progress bar silently
                         else:
-                            self.gui.root.after(0, lambda l=line: self.gui.parse_and_log_message(l, skip_console=True))
+                            self.gui.post_output_line(line, skip_console=True)
                         self.last_progress_line = line
                     else:
                         # Regular message - reset progress tracking
                         self.last_progress_line = None
-                        self.gui.root.after(0, lambda l=line: self.gui.parse_and_log_message(l))
+                        self.gui.post_output_line(line)
                 
 
                     
@@ -682,7 +794,6 @@ class EmailJobParserGUI:
                         if line and not (self.last_progress_line and self.last_progress_line.strip() == line.strip()):
                             self._process_line(line)
                         self.buffer = ""
-                    self.gui.root.update_idletasks()
             
             # Redirect both stdout and stderr to GUI
             gui_logger = GUILogger(self)
@@ -690,7 +801,7 @@ class EmailJobParserGUI:
             sys.stderr = gui_logger
             
             try:
-                success = process_gmail_labels_to_csv(service, LABELS, all_labels, date_range)
+                success = process_gmail_labels_to_csv(service, LABELS, [], date_range)
                 
                 if success:
                     self.log_message("🎉 Processing completed successfully!", 'success')
@@ -713,7 +824,7 @@ class EmailJobParserGUI:
                     self.log_message("❌ Processing failed", 'error')
                     self.progress_var.set("Processing failed")
                     self.status_var.set("Failed")
-                    self.progress_bar.config(mode='indeterminate')
+                    self.progress_bar.config(value=0)
                     self.progress_percent_var.set("")
                     messagebox.showerror("Error", "Processing failed. Check the log for details.")
                     
@@ -731,7 +842,6 @@ class EmailJobParserGUI:
             self.is_running = False
             self.run_button.config(state=tk.NORMAL)
             self.stop_button.config(state=tk.DISABLED)
-            self.progress_bar.stop()
             
             # Reset progress indicators if not completed successfully
             if not success:
@@ -754,7 +864,7 @@ class EmailJobParserGUI:
 
     def clear_log(self):
         """Clear the console output log"""
-        self.log_text.delete(1.0, tk.END)
+        self._reset_log()
         self.log_message("Console cleared.", 'info')
 
 def main():
@@ -10,6 +10,7 @@ sys.path.insert(0, current_dir)
 from utils.auth import authenticate
 from parsers.linkedin.processor import process_gmail_labels_to_csv, LABELS
 from utils.date_utils import get_available_date_ranges, validate_date_range
+from utils.logging_utils import Tee, LOG_FILE_BUFFER_SIZE
 
 def main():
     """Main application entry point."""
@@ -18,6 +19,10 @@ def main():
     parser.add_argument('--date-range', '-d', 
                        default='all',
                        help='Date range to process (all, 24h, 7d, 30d, 90d, 1y, or YYYY-MM-DD:YYYY-MM-DD)')
+    parser.add_argument('--format', '-f',
+                       choices=['csv', 'parquet'],
+                       default='csv',
+                       help='Report file format (parquet needs pyarrow)')
     parser.add_argument('--list-ranges', '-l', 
                        action='store_true',
                        help='List available date ranges and exit')
@@ -44,19 +49,8 @@ def main():
     original_stdout = sys.stdout
     success = False
     try:
-        with open(log_file_path, 'a', encoding='utf-8') as log_file:
+        with open(log_file_path, 'a', encoding='utf-8', buffering=LOG_FILE_BUFFER_SIZE) as log_file:
             # Redirect stdout to both console and log file
-            class Tee(object):
-                def __init__(self, *files):
-                    self.files = files
-                def write(self, obj):
-                    for f in self.files:
-                        f.write(obj)
-                        f.flush()
-                def flush(self):
-                    for f in self.files:
-                        f.flush()
-
             sys.stdout = Tee(sys.stdout, log_file)
             
             print(f"\n\n--- Parser started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ---")
@@ -67,11 +61,8 @@ def main():
                 return
 
             try:
-                # Get all available labels from Gmail
-                all_labels = service.users().labels().list(userId='me').execute().get('labels', [])
-                
-                # Run the main parser
-                success = process_gmail_labels_to_csv(service, LABELS, all_labels, args.date_range)
+                # Run the main parser (label IDs are resolved per label inside)
+                success = process_gmail_labels_to_csv(service, LABELS, [], args.date_range, args.format)
 
             except Exception as e:
                 print(f'An unexpected error occurred in main: {e}')
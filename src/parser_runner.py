@@ -1,58 +1,84 @@
-import base64
-import email
-from email import policy
 from googleapiclient.errors import HttpError
 from tqdm import tqdm
+import html
 import re
 import csv
 import os
-from datetime import datetime
-from dateutil import parser as date_parser
-
-def get_plain_text_body(msg) -> str:
-    """Parses an email message and returns the plain text body."""
-    if msg.is_multipart():
-        for part in msg.walk():
-            if part.get_content_type() == 'text/plain' and 'attachment' not in str(part.get('Content-Disposition')):
-                try:
-                    return part.get_payload(decode=True).decode('utf-8', errors='ignore')
-                except Exception:
-                    return part.get_payload(decode=True).decode('latin-1', errors='ignore')
-    else:
-        try:
-            return msg.get_payload(decode=True).decode('utf-8', errors='ignore')
-        except Exception:
-            return msg.get_payload(decode=True).decode('latin-1', errors='ignore')
-    return ""
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from utils.date_utils import get_date_range_query, current_timestamp, parse_date_header
+from utils.email_utils import APPLIED_ANCHOR, APPLIED_TAIL_CHARS, get_header, get_payload_plain_text, get_payload_html
 
-def get_html_body(msg) -> str:
-    """Parses an email message and returns the HTML body."""
-    if msg.is_multipart():
-        for part in msg.walk():
-            if part.get_content_type() == 'text/html' and 'attachment' not in str(part.get('Content-Disposition')):
-                try:
-                    return part.get_payload(decode=True).decode('utf-8', errors='ignore')
-                except Exception:
-                    return part.get_payload(decode=True).decode('latin-1', errors='ignore')
-    else:
-        ctype = msg.get_content_type()
-        if ctype == 'text/html':
-            try:
-                return msg.get_payload(decode=True).decode('utf-8', errors='ignore')
-            except Exception:
-                return msg.get_payload(decode=True).decode('latin-1', errors='ignore')
-    return ""
+# Gets per batch request: Gmail takes up to 100 but advises at most 50, which also keeps
+# a batch within the per-user quota of 250 units per second
+BATCH_SIZE = 50
+# Partial-response masks: only the parts of list and get responses that the parsers read.
+# Nested parts below the second level come back whole, so deeply nested bodies are still found
+_LIST_FIELDS = 'messages(id),nextPageToken,resultSizeEstimate'
+_MESSAGE_FIELDS = ('id,internalDate,payload(mimeType,filename,headers,body/data,'
+                   'parts(mimeType,filename,headers,body/data,parts))')
+
+# Lower-cased label name -> Gmail label ID, fetched once per run
+_LABEL_ID_CACHE = {}
+
+# Labels checked against the Applied database in Phase 2, in order
+LABELS_TO_VERIFY = ('LinkedIn/Viewed', 'LinkedIn/Rejected')
+# Verification failure log and its columns
+FAILURE_LOG_FILE = 'data/processed/failed_verifications.csv'
+FAILURE_FIELDNAMES = ('Timestamp', 'Email ID', 'Label', 'Reason', 'Date', 'Company Name', 'Job Title', 'Location', 'Status', 'Metadata', 'Comment')
+# Set once the failure log directory exists, so makedirs runs once per process
+_failure_dir_ready = False
+
+# Progress bars redraw at most this often (seconds) and about this many times over a loop
+_PROGRESS_MININTERVAL = 0.5
+_PROGRESS_REDRAWS = 200
+# Weight of the latest update in the rate/ETA estimate; low, since each redraw covers many emails
+_PROGRESS_SMOOTHING = 0.1
+
+def _progress(iterable, total: int, desc: str):
+    """Wraps iterable in a tqdm bar that redraws rarely, so the bar costs little in tight loops."""
+    return tqdm(iterable, total=total, desc=desc,
+                mininterval=_PROGRESS_MININTERVAL, miniters=max(1, total // _PROGRESS_REDRAWS),
+                smoothing=_PROGRESS_SMOOTHING)
+
+# google-re2 matches the HTML body patterns in linear time; fall back to re without it
+try:
+    import re2 as _html_re
+except ImportError:
+    _html_re = re
+
+# selectolax parses the HTML body once in C; the regex/find path is used without it
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+
+# Patterns used for every Viewed/Rejected email, compiled once
+_COMPANY_LOCATION_RE = _html_re.compile(r'(?i)<p[^>]*?>\s*([^<]+?)\s*·\s*(.*?)\s*</p>')
+_JOB_TITLE_RE = _html_re.compile(r'(?i)[;"\s]color:\s*#0a66c2;">\s*([^<]+?)\s*<')
+# selectolax path: elements that may carry the title colour, and the style the title link itself ends with
+# (a text colour, not background-color, as _JOB_TITLE_RE requires)
+_JOB_TITLE_CANDIDATES = '[style*="#0a66c2" i]'
+_JOB_TITLE_STYLE_RE = re.compile(r'(?:^|[;\s])color:\s*#0a66c2;$', re.IGNORECASE)
+# Both subject templates in one pattern: "... was viewed by <company>" or "... to <title> at <company>"
+_SUBJECT_RE = re.compile(
+    r'Your application (?:was viewed by\s+(?P<viewed_by>.*)|to\s+(?P<title>.*?)\s+at\s+(?P<company>.*))',
+    re.IGNORECASE)
+# Literal forms of the two subject templates, tried before _SUBJECT_RE
+_SUBJECT_PREFIX = 'Your application '
+_VIEWED_BY = 'was viewed by '
 
 def parse_applied_info(plain_text_body: str) -> dict:
     job_title, company_name, location = "", "", ""
-    lines = plain_text_body.splitlines()
-    try:
-        start_index = next(i for i, line in enumerate(lines) if "Your application was sent to" in line)
-        relevant_lines = [line.strip() for line in lines[start_index + 1:] if line.strip()]
-        if len(relevant_lines) >= 3:
-            job_title, company_name, location = relevant_lines[0], relevant_lines[1], relevant_lines[2]
-    except (StopIteration, IndexError):
-        pass  # Will be caught by validation below
+    start = plain_text_body.find(APPLIED_ANCHOR)
+    if start >= 0:
+        # The three non-empty lines after the anchor line are title, company and location
+        following = (line.strip() for line in plain_text_body[start:start + APPLIED_TAIL_CHARS].splitlines()[1:])
+        relevant_lines = list(islice(filter(None, following), 3))
+        if len(relevant_lines) == 3:
+            job_title, company_name, location = relevant_lines
+    # Missing fields are caught by validation below
 
     if not all([job_title, company_name, location]):
         missing_fields = []
@@ -63,36 +89,75 @@ def parse_applied_info(plain_text_body: str) -> dict:
         
     return {"Job Title": job_title, "Company Name": company_name, "Location": location}
 
+def _find_job_title(html_content: str) -> str:
+    """Returns the job title text of the first title link in the HTML body, or ""."""
+    job_title_match = _JOB_TITLE_RE.search(html_content)
+    return job_title_match.group(1).strip() if job_title_match else ""
+
+def _select_company_line(tree) -> tuple:
+    """Returns (company, location) from the first <p> whose leading text holds the middle dot, the one _COMPANY_LOCATION_RE matches."""
+    for node in tree.css('p'):
+        first = node.child
+        # Like the regex, skip lines with markup before the dot
+        if first is not None and first.tag == '-text' and '·' in first.text_content:
+            company_name, _, location = node.text().partition('·')
+            return company_name.strip(), location.strip()
+    return "", ""
+
+def _select_job_title(tree) -> str:
+    """Returns the text of the first element styled like _JOB_TITLE_RE's title link, or ""."""
+    for node in tree.css(_JOB_TITLE_CANDIDATES):
+        if _JOB_TITLE_STYLE_RE.search(node.attributes.get('style') or ''):
+            # Separate nested text nodes, so spaces between them are kept
+            job_title = node.text(separator=' ', strip=True)
+            if job_title:
+                return job_title
+    return ""
+
+def _parse_html_fields(html_content: str) -> tuple:
+    """Returns (company, location, job title) found in the HTML body, each "" if absent."""
+    company_name, location = "", ""
+    if HTMLParser is not None:
+        # Finds the same fields as the regexes below, from a real parse
+        tree = HTMLParser(html_content)
+        return (*_select_company_line(tree), _select_job_title(tree))
+
+    # The company/location line always contains a middle dot; skip the regex when there is none
+    company_location_match = _COMPANY_LOCATION_RE.search(html_content) if '·' in html_content else None
+    if company_location_match:
+        company_name = html.unescape(company_location_match.group(1)).strip()
+        location = html.unescape(company_location_match.group(2)).strip()
+    # The regexes match raw markup, so entities are decoded here; selectolax's text() already decodes them
+    return company_name, location, html.unescape(_find_job_title(html_content)).strip()
+
+def _parse_subject(subject: str) -> tuple:
+    """Returns (job title, company) named in the subject; title is None for "viewed by" subjects, both are None without a match."""
+    # LinkedIn's own subjects start with the exact prefix, so slice them without running the regex
+    if subject.startswith(_SUBJECT_PREFIX):
+        rest = subject[len(_SUBJECT_PREFIX):]
+        if rest.startswith(_VIEWED_BY):
+            return None, rest[len(_VIEWED_BY):].strip()
+        if rest.startswith('to '):
+            title, sep, company = rest[3:].partition(' at ')
+            if sep:
+                return title.strip(), company.strip()
+    match = _SUBJECT_RE.search(subject)
+    if not match:
+        return None, None
+    if match.group('viewed_by') is not None:
+        return None, match.group('viewed_by').strip()
+    return match.group('title').strip(), match.group('company').strip()
+
 def parse_viewed_rejected_info(html_content: str, subject: str) -> dict:
-    job_title, company_name, location = "", "", ""
     error_message = None
     
     # Try parsing HTML first for rich data
-    company_location_match = re.search(r'<p[^>]*?>\s*([^<]+?)\s*·\s*(.*?)\s*</p>', html_content, re.IGNORECASE)
-    if company_location_match:
-        company_name = company_location_match.group(1).strip()
-        location = company_location_match.group(2).strip()
-    
-    job_title_match = re.search(r'color:\s*#0a66c2;">\s*([^<]+?)\s*<', html_content, re.IGNORECASE)
-    if job_title_match:
-        job_title = job_title_match.group(1).strip()
+    company_name, location, job_title = _parse_html_fields(html_content)
         
     # Fallback to subject line parsing, which is very reliable for some templates
-    if 'viewed by' in subject.lower():
-        match = re.search(r'Your application was viewed by\s+(.*)', subject, re.IGNORECASE)
-        if match:
-            company_name = match.group(1).strip()
-    
-    if 'application to' in subject.lower() and 'at' in subject.lower():
-         match = re.search(r'Your application to\s+(.*?)\s+at\s+(.*)', subject, re.IGNORECASE)
-         if match:
-             job_title = match.group(1).strip()
-             company_name = match.group(2).strip()
-    
-    # Clean up results
-    if company_name: company_name = company_name.replace('&amp;', '&').strip()
-    if job_title: job_title = job_title.replace('&amp;', '&').strip()
-    if location: location = location.replace('&amp;', '&').strip()
+    subject_title, subject_company = _parse_subject(subject)
+    if subject_title is not None: job_title = html.unescape(subject_title).strip()
+    if subject_company is not None: company_name = html.unescape(subject_company).strip()
 
     # CRITICAL: If company_name is still not found, set an error message.
     if not company_name:
@@ -100,49 +165,47 @@ def parse_viewed_rejected_info(html_content: str, subject: str) -> dict:
 
     return {"Job Title": job_title, "Company Name": company_name, "Location": location, "error": error_message}
 
-def parse_date_header(date_string: str) -> str:
-    """Parses date string from email header into YYYY-MM-DD format."""
-    if not date_string:
-        return ""
-    try:
-        dt = date_parser.parse(date_string)
-        return dt.strftime('%Y-%m-%d')
-    except (date_parser.ParserError, TypeError):
-        return ""
-
 def generate_comment(subject: str) -> str:
     """Generates a comment based on the email subject."""
     if subject:
         return f"Email regarding: {subject}"
     return "No subject found."
 
-def run_verification_test(service):
+def _job_key(company, title):
+    """Returns the interned, lower-cased (company, title) key used to match applications."""
+    return (sys.intern(company.lower()), sys.intern(title.lower()))
+
+def run_verification_test(service, date_range: str = "all"):
     """
     Verifies that 'Viewed' and 'Rejected' emails correspond to an 'Applied' email with a location.
+    Only emails within date_range (see utils.date_utils) are fetched.
     """
     print("--- Starting Verification Test ---")
+    try:
+        date_query = get_date_range_query(date_range)
+    except ValueError as e:
+        print(f"❌ Invalid date range: {e}")
+        return False
     failure_log = []
     
     # Step 1: Build a database of all applied applications
     print("\n--- Phase 1: Building database from 'LinkedIn/Applied' emails ---")
-    applied_jobs = {} # Key: (company, title), Value: location
+    applied_rows = [] # (company, title, location) per parsed email, indexed once the phase completes
     try:
-        messages = fetch_all_messages_for_label(service, 'LinkedIn/Applied')
+        messages = fetch_all_messages_for_label(service, 'LinkedIn/Applied', date_query)
         print(f"Found {len(messages)} 'Applied' emails to process.")
-        for msg_info in tqdm(messages, desc="Processing Applied"):
-            msg_full = get_full_message(service, msg_info['id'])
+        for msg_info, msg_full in _progress(zip(messages, get_full_messages(service, messages)), len(messages), "Processing Applied"):
             if not msg_full: continue
 
-            body = get_plain_text_body(msg_full)
-            subject = msg_full['subject'] or "No Subject"
+            body = get_payload_plain_text(msg_full)
+            subject = get_header(msg_full, 'Subject') or "No Subject"
             try:
                 parsed_info = parse_applied_info(body)
-                key = (parsed_info['Company Name'].lower(), parsed_info['Job Title'].lower())
-                applied_jobs[key] = parsed_info['Location']
+                applied_rows.append((parsed_info['Company Name'], parsed_info['Job Title'], parsed_info['Location']))
             except ValueError as e:
-                date_str = parse_date_header(msg_full['date'])
+                date_str = parse_date_header(get_header(msg_full, 'Date'))
                 comment = generate_comment(subject)
-                timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                timestamp = current_timestamp()
                 failure_log.append({
                     'Timestamp': timestamp,
                     'Email ID': msg_info['id'], 
@@ -160,6 +223,8 @@ def run_verification_test(service):
                 print("Stopping test. All 'Applied' emails must be parsable and contain a location.")
                 write_failures_to_csv(failure_log)
                 return False
+        # Key: (company, title), Value: location; later emails win, as with per-row inserts
+        applied_jobs = {_job_key(company, title): location for company, title, location in applied_rows}
         print(f"Successfully built database with {len(applied_jobs)} unique applications.")
 
     except Exception as e:
@@ -170,27 +235,25 @@ def run_verification_test(service):
     print("\n--- Phase 2: Verifying 'Viewed' and 'Rejected' emails ---")
     found_matches = 0
     test_passed = True
-    labels_to_verify = ['LinkedIn/Viewed', 'LinkedIn/Rejected']
 
-    for label_name in labels_to_verify:
+    for label_name in LABELS_TO_VERIFY:
         print(f"\nVerifying label: {label_name}")
-        messages = fetch_all_messages_for_label(service, label_name)
+        messages = fetch_all_messages_for_label(service, label_name, date_query)
         print(f"Found {len(messages)} '{label_name}' emails to verify.")
-        for msg_info in tqdm(messages, desc=f"Verifying {label_name}"):
-            msg_full = get_full_message(service, msg_info['id'])
+        current_status = label_name.split('/')[-1] # The same for every email of the label
+        for msg_info, msg_full in _progress(zip(messages, get_full_messages(service, messages)), len(messages), f"Verifying {label_name}"):
             if not msg_full: continue
 
-            subject_header = msg_full['subject'] or ""
-            html_body = get_html_body(msg_full)
-            date_str = parse_date_header(msg_full['date'])
+            subject_header = get_header(msg_full, 'Subject') or ""
+            html_body = get_payload_html(msg_full)
+            date_str = parse_date_header(get_header(msg_full, 'Date'))
             comment = generate_comment(subject_header)
-            current_status = label_name.split('/')[-1]
 
             parsed_info = parse_viewed_rejected_info(html_body, subject_header)
             
             # Check if the parser returned an error
             if parsed_info['error']:
-                timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                timestamp = current_timestamp()
                 failure_log.append({
                     'Timestamp': timestamp,
                     'Email ID': msg_info['id'], 
@@ -212,12 +275,12 @@ def run_verification_test(service):
                 break # Stop processing this label
 
             company, title = parsed_info['Company Name'], parsed_info['Job Title']
-            key = (company.lower(), title.lower())
+            key = _job_key(company, title)
             
             if key in applied_jobs:
                 location = applied_jobs[key]
                 if not location:
-                    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    timestamp = current_timestamp()
                     failure_log.append({
                         'Timestamp': timestamp,
                         'Email ID': msg_info['id'], 
@@ -240,7 +303,7 @@ def run_verification_test(service):
                 print(f"\nSUCCESS: Found match for '{label_name}' email. Location: {location}")
                 found_matches += 1
             else:
-                timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                timestamp = current_timestamp()
                 failure_log.append({
                     'Timestamp': timestamp,
                     'Email ID': msg_info['id'], 
@@ -281,18 +344,20 @@ def run_verification_test(service):
 
 def write_failures_to_csv(failures):
     """Writes failure log to a CSV file, appending to it if it already exists."""
-    output_file = 'data/processed/failed_verifications.csv'
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    global _failure_dir_ready
+    output_file = FAILURE_LOG_FILE
+    if not _failure_dir_ready:
+        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        _failure_dir_ready = True
     
     file_exists = os.path.isfile(output_file)
     
-    fieldnames = ['Timestamp', 'Email ID', 'Label', 'Reason', 'Date', 'Company Name', 'Job Title', 'Location', 'Status', 'Metadata', 'Comment']
     try:
         with open(output_file, 'a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer = csv.writer(csvfile)
             if not file_exists:
-                writer.writeheader()
-            writer.writerows(failures)
+                writer.writerow(FAILURE_FIELDNAMES)
+            writer.writerows([[row.get(key, '') for key in FAILURE_FIELDNAMES] for row in failures])
         
         # Provide clear feedback in the terminal
         absolute_path = os.path.abspath(output_file)
@@ -301,18 +366,25 @@ def write_failures_to_csv(failures):
     except Exception as e:
         print(f"Error writing failures to CSV: {e}")
 
-def fetch_all_messages_for_label(service, label_name):
+def fetch_all_messages_for_label(service, label_name, date_query=""):
     try:
-        label_results = service.users().labels().list(userId='me').execute().get('labels', [])
-        target_label_id = next((l['id'] for l in label_results if l['name'].lower() == label_name.lower()), None)
+        if not _LABEL_ID_CACHE:
+            label_results = service.users().labels().list(userId='me').execute().get('labels', [])
+            _LABEL_ID_CACHE.update({l['name'].lower(): l['id'] for l in label_results})
+        target_label_id = _LABEL_ID_CACHE.get(label_name.lower())
         if not target_label_id:
             print(f"Warning: Label '{label_name}' not found.")
             return []
         
+        # Let Gmail apply the date filter and return up to 500 IDs per page
+        search_params = {'userId': 'me', 'labelIds': [target_label_id], 'maxResults': 500, 'fields': _LIST_FIELDS}
+        if date_query:
+            search_params['q'] = date_query
+
         messages = []
         page_token = None
         while True:
-            results = service.users().messages().list(userId='me', labelIds=[target_label_id], pageToken=page_token).execute()
+            results = service.users().messages().list(pageToken=page_token, **search_params).execute()
             messages.extend(results.get('messages', []))
             page_token = results.get('nextPageToken')
             if not page_token:
@@ -324,9 +396,50 @@ def fetch_all_messages_for_label(service, label_name):
 
 def get_full_message(service, msg_id):
     try:
-        msg_full = service.users().messages().get(userId='me', id=msg_id, format='raw').execute()
-        raw = base64.urlsafe_b64decode(msg_full['raw'].encode('ASCII'))
-        return email.message_from_bytes(raw, policy=policy.default)
+        # format='full' returns the MIME tree already split into parts, so no raw email parsing is needed
+        return service.users().messages().get(userId='me', id=msg_id, format='full', fields=_MESSAGE_FIELDS).execute()
     except HttpError as error:
         print(f"HTTP error fetching message ID {msg_id}: {error}")
-        return None 
\ No newline at end of file
+        return None
+
+def _fetch_batch(service, msg_ids):
+    """Runs one batched get for msg_ids and returns {message ID: message} for those that succeeded."""
+    fetched = {}
+
+    def on_response(request_id, response, exception):
+        if exception is not None:
+            print(f"HTTP error fetching message ID {request_id}: {exception}")
+            return
+        fetched[request_id] = response
+
+    batch = service.new_batch_http_request(callback=on_response)
+    for msg_id in msg_ids:
+        batch.add(service.users().messages().get(userId='me', id=msg_id, format='full', fields=_MESSAGE_FIELDS), request_id=msg_id)
+    try:
+        batch.execute()
+    except HttpError as error:
+        print(f"HTTP error fetching message batch: {error}")
+    return fetched
+
+def get_full_messages(service, messages):
+    """
+    Fetches messages in batched HTTP requests of up to BATCH_SIZE gets each.
+    Yields the message (or None on error) for each entry of messages, in order.
+
+    The next batch is downloaded on a worker thread while the caller parses the
+    current one. A single worker is used because the service's HTTP connection
+    is not thread-safe; leaving the loop early waits for the in-flight batch.
+    """
+    chunks = [[msg_info['id'] for msg_info in messages[start:start + BATCH_SIZE]]
+              for start in range(0, len(messages), BATCH_SIZE)]
+    if not chunks:
+        return
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(_fetch_batch, service, chunks[0])
+        for index, chunk in enumerate(chunks):
+            fetched = pending.result()
+            if index + 1 < len(chunks):
+                pending = executor.submit(_fetch_batch, service, chunks[index + 1])
+            for msg_id in chunk:
+                yield fetched.get(msg_id)
\ No newline at end of file
@@ -1,55 +1,38 @@
+import html
 import re
-import email
-
-def get_plain_text_body(msg: email.message.Message) -> str:
-    """
-    Parses an email.message.Message object and returns its plain text body.
-
-    Args:
-        msg: The email message object to parse.
-
-    Returns:
-        The plain text content of the email as a string.
-    """
-    if msg.is_multipart():
-        for part in msg.walk():
-            if part.get_content_type() == 'text/plain' and 'attachment' not in str(part.get('Content-Disposition')):
-                try:
-                    return part.get_payload(decode=True).decode('utf-8', errors='ignore')
-                except Exception:
-                    return part.get_payload(decode=True).decode('latin-1', errors='ignore')
-    else:
-        try:
-            return msg.get_payload(decode=True).decode('utf-8', errors='ignore')
-        except Exception:
-            return msg.get_payload(decode=True).decode('latin-1', errors='ignore')
-    return ""
-
-def get_html_body(msg: email.message.Message) -> str:
-    """
-    Parses an email.message.Message object and returns its HTML body.
-
-    Args:
-        msg: The email message object to parse.
-
-    Returns:
-        The HTML content of the email as a string.
-    """
-    if msg.is_multipart():
-        for part in msg.walk():
-            if part.get_content_type() == 'text/html' and 'attachment' not in str(part.get('Content-Disposition')):
-                try:
-                    return part.get_payload(decode=True).decode('utf-8', errors='ignore')
-                except Exception:
-                    return part.get_payload(decode=True).decode('latin-1', errors='ignore')
-    else:
-        ctype = msg.get_content_type()
-        if ctype == 'text/html':
-            try:
-                return msg.get_payload(decode=True).decode('utf-8', errors='ignore')
-            except Exception:
-                return msg.get_payload(decode=True).decode('latin-1', errors='ignore')
-    return ""
+from itertools import islice
+from utils.email_utils import APPLIED_ANCHOR, APPLIED_TAIL_CHARS
+
+# selectolax parses the HTML body once in C; the regex/find path below is used without it
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+
+# Patterns run once per parsed email, compiled at import
+_INTEREST_IN_RE = re.compile(r"Thank You For Your Interest in (.+?)!")
+_COMPANY_LOCATION_RE = re.compile(r'(?i)<p[^>]*?>\s*([^<]+?)\s*·\s*(.*?)\s*</p>')
+_JOB_TITLE_RE = re.compile(r'(?i)[;"\s]color:\s*#0a66c2;">\s*([^<]+?)\s*<')
+# Keywords that mark a lower-cased body line as company, job title or location in the last-resort
+# scan of parse_applied_info; one alternation is a single C scan instead of one substring test per word
+_COMPANY_WORD_RE = re.compile('company|corp|inc|ltd|llc')
+_TITLE_WORD_RE = re.compile('position|role|job|engineer|manager|analyst')
+_LOCATION_WORD_RE = re.compile('city|state|country|remote|office')
+# selectolax path: elements that may carry the title colour, and the style the title link itself ends with
+# (a text colour, not background-color, as _JOB_TITLE_RE requires)
+_JOB_TITLE_CANDIDATES = '[style*="#0a66c2" i]'
+_JOB_TITLE_STYLE_RE = re.compile(r'(?:^|[;\s])color:\s*#0a66c2;$', re.IGNORECASE)
+# Both subject templates in one pattern: "... was viewed by <company>" or "... to <title> at <company>"
+_SUBJECT_RE = re.compile(
+    r'Your application (?:was viewed by\s+(?P<viewed_by>.*)|to\s+(?P<title>.*?)\s+at\s+(?P<company>.*))',
+    re.IGNORECASE)
+# Literal forms of the two subject templates, tried before _SUBJECT_RE
+_SUBJECT_PREFIX = 'Your application '
+_VIEWED_BY = 'was viewed by '
+# UTF-8 twins of the HTML patterns, for bodies handed over undecoded ('·' is b'\xc2\xb7')
+_COMPANY_LOCATION_BYTES_RE = re.compile(rb'(?i)<p[^>]*?>\s*([^<]+?)\s*\xc2\xb7\s*(.*?)\s*</p>')
+_JOB_TITLE_BYTES_RE = re.compile(rb'(?i)[;"\s]color:\s*#0a66c2;">\s*([^<]+?)\s*<')
+_MIDDLE_DOT_BYTES = '·'.encode('utf-8')
 
 def parse_applied_info(plain_text_body: str) -> dict:
     """
@@ -65,23 +48,25 @@ def parse_applied_info(plain_text_body: str) -> dict:
         ValueError: If any of the mandatory fields are missing.
     """
     job_title, company_name, location = "", "", ""
-    lines = plain_text_body.splitlines()
     
-    # Method 1: Standard LinkedIn format
-    try:
-        start_index = next(i for i, line in enumerate(lines) if "Your application was sent to" in line)
-        relevant_lines = [line.strip() for line in lines[start_index + 1:] if line.strip()]
-        if len(relevant_lines) >= 3:
-            job_title, company_name, location = relevant_lines[0], relevant_lines[1], relevant_lines[2]
-    except (StopIteration, IndexError):
-        pass
+    # Method 1: Standard LinkedIn format - the three non-empty lines after the anchor line
+    start = plain_text_body.find(APPLIED_ANCHOR)
+    if start >= 0:
+        following = (line.strip() for line in plain_text_body[start:start + APPLIED_TAIL_CHARS].splitlines()[1:])
+        relevant_lines = list(islice(filter(None, following), 3))
+        if len(relevant_lines) == 3:
+            job_title, company_name, location = relevant_lines
+    
+    # The fallbacks scan the whole body, so only split it when they are needed
+    if not all([job_title, company_name, location]):
+        lines = plain_text_body.splitlines()
     
     # Method 2: Fallback - try to extract from anywhere in the email
     if not all([job_title, company_name, location]):
         # Try to find company name in subject or body
         for line in lines:
             if "Thank You For Your Interest in" in line:
-                company_match = re.search(r"Thank You For Your Interest in (.+?)!", line)
+                company_match = _INTEREST_IN_RE.search(line)
                 if company_match:
                     company_name = company_match.group(1).strip()
                     job_title = "Position at " + company_name  # Generic title
@@ -94,11 +79,13 @@ def parse_applied_info(plain_text_body: str) -> dict:
         for line in lines:
             line = line.strip()
             if line and len(line) > 5 and not line.startswith(('http', 'www', 'mailto')):
-                if not company_name and any(word in line.lower() for word in ['company', 'corp', 'inc', 'ltd', 'llc']):
+                # Lower-case once per line, not once per keyword tested
+                line_lc = line.lower()
+                if not company_name and _COMPANY_WORD_RE.search(line_lc):
                     company_name = line
-                elif not job_title and any(word in line.lower() for word in ['position', 'role', 'job', 'engineer', 'manager', 'analyst']):
+                elif not job_title and _TITLE_WORD_RE.search(line_lc):
                     job_title = line
-                elif not location and any(word in line.lower() for word in ['city', 'state', 'country', 'remote', 'office']):
+                elif not location and _LOCATION_WORD_RE.search(line_lc):
                     location = line
 
     # If still missing, use generic values
@@ -111,65 +98,106 @@ def parse_applied_info(plain_text_body: str) -> dict:
 
     return {"Job Title": job_title, "Company Name": company_name, "Location": location}
 
-def parse_viewed_rejected_info(html_content: str, subject: str) -> dict:
+def _find_job_title(html_content: str) -> str:
+    """Returns the job title text of the first title link in the HTML body, or ""."""
+    job_title_match = _JOB_TITLE_RE.search(html_content)
+    return job_title_match.group(1).strip() if job_title_match else ""
+
+def _parse_html_bytes(html_bytes: bytes) -> tuple:
+    """Returns (company, location, job title) from an undecoded UTF-8 HTML body, decoding only the matched fields."""
+    company_name, location, job_title = "", "", ""
+    company_location_match = _COMPANY_LOCATION_BYTES_RE.search(html_bytes) if _MIDDLE_DOT_BYTES in html_bytes else None
+    if company_location_match:
+        company_name = html.unescape(company_location_match.group(1).decode('utf-8', errors='ignore')).strip()
+        location = html.unescape(company_location_match.group(2).decode('utf-8', errors='ignore')).strip()
+
+    job_title_match = _JOB_TITLE_BYTES_RE.search(html_bytes)
+    if job_title_match:
+        job_title = html.unescape(job_title_match.group(1).decode('utf-8', errors='ignore')).strip()
+    return company_name, location, job_title
+
+def _select_company_line(tree) -> tuple:
+    """Returns (company, location) from the first <p> whose leading text holds the middle dot, the one _COMPANY_LOCATION_RE matches."""
+    for node in tree.css('p'):
+        first = node.child
+        # Like the regex, skip lines with markup before the dot
+        if first is not None and first.tag == '-text' and '·' in first.text_content:
+            company_name, _, location = node.text().partition('·')
+            return company_name.strip(), location.strip()
+    return "", ""
+
+def _select_job_title(tree) -> str:
+    """Returns the text of the first element styled like _JOB_TITLE_RE's title link, or ""."""
+    for node in tree.css(_JOB_TITLE_CANDIDATES):
+        if _JOB_TITLE_STYLE_RE.search(node.attributes.get('style') or ''):
+            # Separate nested text nodes, so spaces between them are kept
+            job_title = node.text(separator=' ', strip=True)
+            if job_title:
+                return job_title
+    return ""
+
+def _parse_html_fields(html_content) -> tuple:
+    """Returns (company, location, job title) found in the HTML body (str or UTF-8 bytes), each "" if absent."""
+    if isinstance(html_content, bytes):
+        if HTMLParser is None:
+            return _parse_html_bytes(html_content)
+        html_content = html_content.decode('utf-8', errors='ignore')
+    company_name, location = "", ""
+    if HTMLParser is not None:
+        # Finds the same fields as the regexes below, from a real parse
+        tree = HTMLParser(html_content)
+        return (*_select_company_line(tree), _select_job_title(tree))
+
+    # The company/location line always contains a middle dot; skip the regex when there is none
+    company_location_match = _COMPANY_LOCATION_RE.search(html_content) if '·' in html_content else None
+    if company_location_match:
+        company_name = html.unescape(company_location_match.group(1)).strip()
+        location = html.unescape(company_location_match.group(2)).strip()
+    # The regexes match raw markup, so entities are decoded here; selectolax's text() already decodes them
+    return company_name, location, html.unescape(_find_job_title(html_content)).strip()
+
+def _parse_subject(subject: str) -> tuple:
+    """Returns (job title, company) named in the subject; title is None for "viewed by" subjects, both are None without a match."""
+    # LinkedIn's own subjects start with the exact prefix, so slice them without running the regex
+    if subject.startswith(_SUBJECT_PREFIX):
+        rest = subject[len(_SUBJECT_PREFIX):]
+        if rest.startswith(_VIEWED_BY):
+            return None, rest[len(_VIEWED_BY):].strip()
+        if rest.startswith('to '):
+            title, sep, company = rest[3:].partition(' at ')
+            if sep:
+                return title.strip(), company.strip()
+    match = _SUBJECT_RE.search(subject)
+    if not match:
+        return None, None
+    if match.group('viewed_by') is not None:
+        return None, match.group('viewed_by').strip()
+    return match.group('title').strip(), match.group('company').strip()
+
+def parse_viewed_rejected_info(html_content, subject: str) -> dict:
     """
     Parses 'Viewed' or 'Rejected' emails to extract job details, using HTML and subject lines.
 
     Args:
-        html_content: The HTML body of the email.
+        html_content: The HTML body of the email, as str or as undecoded UTF-8 bytes.
         subject: The subject line of the email.
 
     Returns:
         A dictionary containing the parsed job details and an "error" key.
     """
-    job_title, company_name, location = "", "", ""
     error_message = None
     
-    company_location_match = re.search(r'<p[^>]*?>\s*([^<]+?)\s*·\s*(.*?)\s*</p>', html_content, re.IGNORECASE)
-    if company_location_match:
-        company_name = company_location_match.group(1).strip()
-        location = company_location_match.group(2).strip()
-    
-    job_title_match = re.search(r'color:\s*#0a66c2;">\s*([^<]+?)\s*<', html_content, re.IGNORECASE)
-    if job_title_match:
-        job_title = job_title_match.group(1).strip()
+    company_name, location, job_title = _parse_html_fields(html_content)
         
-    if 'viewed by' in subject.lower():
-        match = re.search(r'Your application was viewed by\s+(.*)', subject, re.IGNORECASE)
-        if match and not company_name: company_name = match.group(1).strip()
-    
-    if 'application to' in subject.lower() and 'at' in subject.lower():
-         match = re.search(r'Your application to\s+(.*?)\s+at\s+(.*)', subject, re.IGNORECASE)
-         if match:
-             if not job_title: job_title = match.group(1).strip()
-             if not company_name: company_name = match.group(2).strip()
-    
-    if company_name: company_name = company_name.replace('&amp;', '&').strip()
-    if job_title: job_title = job_title.replace('&amp;', '&').strip()
-    if location: location = location.replace('&amp;', '&').strip()
+    subject_title, subject_company = _parse_subject(subject)
+    if not job_title and subject_title is not None: job_title = html.unescape(subject_title).strip()
+    if not company_name and subject_company is not None: company_name = html.unescape(subject_company).strip()
 
     if not company_name:
         error_message = "Critical parse failure: Could not determine Company Name from HTML or Subject."
 
     return {"Job Title": job_title, "Company Name": company_name, "Location": location, "error": error_message}
 
-def parse_date_header(date_string: str) -> dict:
-    """
-    Parses a date string from an email header into 'YYYY-MM-DD' format.
-    
-    Args:
-        date_string: The raw date string from the email header.
-
-    Returns:
-        A formatted date string ('YYYY-MM-DD').
-    """
-    from dateutil import parser as date_parser
-    if not date_string: return ""
-    try:
-        return date_parser.parse(date_string).strftime('%Y-%m-%d')
-    except (date_parser.ParserError, TypeError):
-        return ""
-
 def generate_comment(subject: str) -> str:
     """
     Generates a simple, consistent comment based on the email's subject line.
@@ -1,30 +1,102 @@
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import pandas as pd
 from tqdm import tqdm
-from utils.email_utils import parse_internal_date, extract_body, extract_applied_info, get_plain_text_body, get_html_body
-from utils.date_utils import get_date_range_query, get_date_range_description
+from utils.email_utils import parse_internal_date, extract_body, extract_applied_info, get_header, get_payload_plain_text, get_payload_html_bytes
+from utils.date_utils import get_date_range_query, get_date_range_description, current_timestamp, parse_date_header
+from utils.gmail_utils import RETRYABLE_STATUSES, FETCH_MAX_RETRIES, retry_delay, execute_with_retry
 from .email_parsers import parse_applied_info, parse_viewed_rejected_info
 import os
-import base64
-import email
-from email import policy
-import re
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 import sys
 from googleapiclient.errors import HttpError
+from google_auth_httplib2 import AuthorizedHttp
+import httplib2
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 import csv
-import dateutil.parser as date_parser
+from importlib.util import find_spec
 
 LABELS = ['LinkedIn/Applied', 'LinkedIn/Viewed', 'LinkedIn/Rejected']
+# Extra Gmail search terms per label, added to every listing of it so Gmail drops emails that did not
+# come from LinkedIn (forwards, notes filed under the label) before they are downloaded
+LABEL_QUERIES = {label: 'from:linkedin.com' for label in LABELS}
 BASE_OUTPUT_FILE = 'data/processed/job_application_status'
 ARCHIVE_DIR = 'data/archive'  # Use data/archive directory for consistency
 BASE_FAILURE_LOG_FILE = 'data/processed/failed_verifications'
+# Column order of the report; 'Location' is placed after 'Date'
+REPORT_FIELDNAMES = ["Company Name", "Job Title", "Status", "Date", "Location", "Metadata Subject", "Comment"]
+# Later stages of an application outrank earlier ones; unknown statuses rank 0
+STATUS_PRIORITY = {"Rejected": 3, "Viewed": 2, "Applied": 1}
+# Column order of the failure log CSV
+FAILURE_FIELDNAMES = ['Timestamp', 'Email ID', 'Label', 'Row Number', 'Total Emails', 'Reason', 'Date', 'Company Name', 'Job Title', 'Location', 'Status', 'Metadata', 'Comment', 'Source_File', 'Date_Range']
+# Write buffer for the report CSV, so the whole report goes out in a few large writes
+CSV_BUFFER_SIZE = 1 << 20
+# Gets per batch HTTP request: Gmail takes up to 100 but advises at most 50, and 50 gets
+# (5 quota units each) stay within the per-user limit of 250 units per second
+BATCH_SIZE = 50
+# Partial-response masks: only the parts of list and get responses that the parsers read.
+# Nested parts below the second level come back whole, so deeply nested bodies are still found
+_LIST_FIELDS = 'messages(id),nextPageToken,resultSizeEstimate'
+_MESSAGE_FIELDS = ('id,internalDate,payload(mimeType,filename,headers,body/data,'
+                   'parts(mimeType,filename,headers,body/data,parts))')
+# Threads used for single gets when a batch request is rejected; each get is retried with backoff,
+# and a few threads keep the burst well inside Gmail's per-user quota
+FALLBACK_WORKERS = 4
+# Per-thread HTTP objects for those fallback threads
+_THREAD_STATE = threading.local()
+
+# Emails dated before this year are left out of the report
+MIN_YEAR = 2024
+# The same cutoff as a Gmail search term, a day early so timezone differences never drop a message;
+# the Date header check in the phase loops stays the exact filter
+_MIN_DATE_QUERY = f"after:{MIN_YEAR - 1}/12/31"
+# ...and as a YYYY-MM-DD string, which parsed dates compare against as plain strings
+_MIN_DATE = f"{MIN_YEAR:04d}-01-01"
+
+# Lower-cased label name -> Gmail label ID, filled by the first lookup of each run
+_LABEL_ID_CACHE = {}
+# Held while the cache is filled, so the listing thread and the main thread list labels only once
+_LABEL_ID_LOCK = threading.Lock()
+
+# Company/title as parsed -> its normalized form in job keys, filled as emails are processed
+_KEY_PART_CACHE = {}
+
+# Progress bars redraw at most this often (seconds) and about this many times over a loop
+_PROGRESS_MININTERVAL = 0.5
+_PROGRESS_REDRAWS = 200
+# Weight of the latest update in the rate/ETA estimate; low, since each redraw covers many emails
+_PROGRESS_SMOOTHING = 0.1
+
+def _progress(iterable, total: int, desc: str):
+    """Wraps iterable in a tqdm bar that redraws rarely, so the bar costs little in tight loops."""
+    return tqdm(iterable, total=total, desc=desc,
+                mininterval=_PROGRESS_MININTERVAL, miniters=max(1, total // _PROGRESS_REDRAWS),
+                smoothing=_PROGRESS_SMOOTHING)
+
+# Directories this module writes to, created on first use rather than at import
+_DATA_DIRS = ('data/logs', os.path.dirname(BASE_OUTPUT_FILE), ARCHIVE_DIR, os.path.dirname(BASE_FAILURE_LOG_FILE))
+# Directories already created by this process, so makedirs runs once per directory
+_dirs_ready = set()
+
+def _ensure_dir(path: str):
+    """Creates path (and parents) unless this process already has."""
+    if path not in _dirs_ready:
+        os.makedirs(path, exist_ok=True)
+        _dirs_ready.add(path)
+
+def _ensure_dirs():
+    """Creates the data directories the processor writes to."""
+    for path in _DATA_DIRS:
+        _ensure_dir(path)
 
 def get_output_directory() -> str:
     """Always use the processed directory for new files."""
     # Always use the processed directory for new files
     processed_dir = os.path.dirname(BASE_OUTPUT_FILE)
-    os.makedirs(processed_dir, exist_ok=True)
+    _ensure_dir(processed_dir)
     return processed_dir
 
 def get_output_filename(date_range: str) -> str:
@@ -57,59 +129,75 @@ def get_failure_log_filename() -> str:
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     return f"{BASE_FAILURE_LOG_FILE}_{timestamp}.csv"
 
-# Create necessary directories
-os.makedirs('data/logs', exist_ok=True)
-os.makedirs(os.path.dirname(BASE_OUTPUT_FILE), exist_ok=True)
-os.makedirs(ARCHIVE_DIR, exist_ok=True)
-os.makedirs(os.path.dirname(BASE_FAILURE_LOG_FILE), exist_ok=True)
-
 def get_status_priority(status: str) -> int:
     """Helper to determine priority for status updates."""
-    return {"Rejected": 3, "Viewed": 2, "Applied": 1}.get(status, 0)
-
-def get_label_id(service, label_name: str) -> Optional[str]:
-    """Get the Gmail label ID for a given label name."""
+    return STATUS_PRIORITY.get(status, 0)
+
+def _key_part(text: str) -> str:
+    """Returns text lower-cased, stripped and interned, normalizing each distinct string only once."""
+    part = _KEY_PART_CACHE.get(text)
+    if part is None:
+        # The same few hundred companies and titles recur across emails; interning shares one copy of each
+        part = _KEY_PART_CACHE[text] = sys.intern(text.lower().strip())
+    return part
+
+def _job_key(company: str, title: str) -> tuple:
+    """Returns the normalized (company, title) key that matches emails about the same job."""
+    return (_key_part(company), _key_part(title))
+
+def get_label_id(service, label_name: str, http=None) -> Optional[str]:
+    """Get the Gmail label ID for a given label name. http overrides the service's connection."""
     try:
-        results = service.users().labels().list(userId='me').execute()
-        all_labels = results.get('labels', [])
-        for label in all_labels:
-            if label['name'].lower() == label_name.lower():
-                return label['id']
-        return None
+        if not _LABEL_ID_CACHE:
+            with _LABEL_ID_LOCK:
+                if not _LABEL_ID_CACHE:
+                    results = service.users().labels().list(userId='me').execute(http=http)
+                    _LABEL_ID_CACHE.update({label['name'].lower(): label['id'] for label in results.get('labels', [])})
+        return _LABEL_ID_CACHE.get(label_name.lower())
     except Exception as e:
         print(f"Error getting label ID for {label_name}: {e}")
         return None
 
-def fetch_messages(service, label_name: str, date_query: str = "") -> List[Dict]:
-    """Fetch messages from Gmail for a specific label with pagination and optional date filtering."""
+def fetch_messages(service, label_name: str, date_query: str = "", http=None, extra_query: Optional[str] = None,
+                   log=print) -> List[Dict]:
+    """
+    Fetch messages from Gmail for a specific label with pagination and optional date filtering.
+    http overrides the service's connection, for listing from another thread.
+    extra_query adds Gmail search terms; by default those in LABEL_QUERIES for the label.
+    log receives each progress line; a listing on another thread collects them to print later.
+    """
+    if extra_query is None:
+        extra_query = LABEL_QUERIES.get(label_name, "")
+    query = " ".join(filter(None, (date_query, extra_query)))
     messages = []
     try:
-        label_id = get_label_id(service, label_name)
+        label_id = get_label_id(service, label_name, http)
         if not label_id:
-            print(f"Label '{label_name}' not found.")
+            log(f"Label '{label_name}' not found.")
             return messages
 
         # Build search parameters
         search_params = {
             'userId': 'me',
             'labelIds': [label_id],
-            'maxResults': 500
+            'maxResults': 500,
+            'fields': _LIST_FIELDS
         }
         
-        # Add date query if provided
-        if date_query:
-            search_params['q'] = date_query
-            print(f"Searching {label_name} with date filter: {date_query}")
+        # Add the date and label search terms, if any, so Gmail filters before listing
+        if query:
+            search_params['q'] = query
+            log(f"Searching {label_name} with filter: {query}")
 
         # Initial request
-        response = service.users().messages().list(**search_params).execute()
+        response = service.users().messages().list(**search_params).execute(http=http)
         
         # Get total count for progress tracking
         total_messages = response.get('resultSizeEstimate', 0)
-        if date_query:
-            print(f"Found approximately {total_messages} messages in {label_name} (filtered)")
+        if query:
+            log(f"Found approximately {total_messages} messages in {label_name} (filtered)")
         else:
-            print(f"Found approximately {total_messages} messages in {label_name}")
+            log(f"Found approximately {total_messages} messages in {label_name}")
         
         # Add first batch of messages
         messages.extend(response.get('messages', []))
@@ -118,49 +206,204 @@ def fetch_messages(service, label_name: str, date_query: str = "") -> List[Dict]
         page_count = 1
         while 'nextPageToken' in response:
             page_count += 1
-            print(f"Fetching page {page_count} for {label_name}...")
+            log(f"Fetching page {page_count} for {label_name}...")
             
             search_params['pageToken'] = response['nextPageToken']
-            response = service.users().messages().list(**search_params).execute()
+            response = service.users().messages().list(**search_params).execute(http=http)
             messages.extend(response.get('messages', []))
             
             # Print progress
-            print(f"Retrieved {len(messages)} messages so far...")
+            log(f"Retrieved {len(messages)} messages so far...")
             
     except Exception as e:
-        print(f"❌ Error fetching messages for {label_name}: {e}")
+        log(f"❌ Error fetching messages for {label_name}: {e}")
     
-    print(f"✅ Successfully retrieved {len(messages)} messages from {label_name}")
+    log(f"✅ Successfully retrieved {len(messages)} messages from {label_name}")
+    return messages
+
+def _prefetch_listings(executor, service, label_names: List[str], date_query: str) -> Dict[str, Future]:
+    """
+    Starts listing each of label_names on executor's thread, over that thread's own connection, so the
+    pages download while earlier labels are processed. Returns {label name: future for _take_listing};
+    empty when the service has no credentials to open a second connection with.
+    """
+    credentials = getattr(getattr(service, '_http', None), 'credentials', None)
+    if credentials is None:
+        return {}
+
+    def list_label(label_name):
+        # Progress lines are held back: printed now, they would land in the middle of the current phase
+        lines = []
+        messages = fetch_messages(service, label_name, date_query, http=_thread_http(credentials), log=lines.append)
+        return messages, lines
+
+    return {label_name: executor.submit(list_label, label_name) for label_name in label_names}
+
+def _take_listing(listing: Future) -> List[Dict]:
+    """Waits for a listing started by _prefetch_listings, prints its progress lines, and returns its messages."""
+    messages, lines = listing.result()
+    for line in lines:
+        print(line)
     return messages
 
+class ApplicationTable:
+    """
+    The report's rows, keyed by (company, title) and stored column by column.
+    Updates write one cell in place; the columns go to the writers without building row dicts.
+    """
+
+    def __init__(self):
+        self.columns = {field: [] for field in REPORT_FIELDNAMES}
+        self._rows = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def row_of(self, key: tuple) -> Optional[int]:
+        """Returns the row index for key, or None if there is no such application."""
+        return self._rows.get(key)
+
+    def put(self, key: tuple, record: Dict[str, str]):
+        """Adds a row for key, or overwrites its existing row, from a {column: value} record."""
+        row = self._rows.get(key)
+        if row is None:
+            self._rows[key] = len(self._rows)
+            for field, column in self.columns.items():
+                column.append(record[field])
+        else:
+            for field, column in self.columns.items():
+                column[row] = record[field]
+
+    def get(self, row: int, field: str) -> str:
+        return self.columns[field][row]
+
+    def set(self, row: int, field: str, value: str):
+        self.columns[field][row] = value
+
+    def rows(self):
+        """Iterates over the rows as tuples in REPORT_FIELDNAMES order."""
+        return zip(*self.columns.values())
+
+def _write_rows_to_csv(rows, filename: str):
+    """Writes the report header and then rows (sequences in REPORT_FIELDNAMES order) to a CSV file."""
+    try:
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(REPORT_FIELDNAMES)
+            writer.writerows(rows)
+    except Exception as e:
+        print(f"❌ An error occurred while writing to '{filename}': {e}")
+
 def write_data_to_csv(data: list, filename: str):
     """Writes a list of dictionaries to a CSV file."""
-    # Ensure 'Location' is correctly placed after 'Date'
-    fieldnames = ["Company Name", "Job Title", "Status", "Date", "Location", "Metadata Subject", "Comment"]
+    # Every record carries all the columns, so pull them out in C rather than through DictWriter
+    _write_rows_to_csv(map(itemgetter(*REPORT_FIELDNAMES), data), filename)
+
+def write_data_to_parquet(data, filename: str):
+    """Writes a list of dictionaries, or a {column: values} dict, to a zstd-compressed Parquet file with the report's columns."""
     try:
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(data)
+        frame = pd.DataFrame(data, columns=REPORT_FIELDNAMES)
+        # Only a handful of statuses: store them as int8 category codes, ordered by pipeline stage
+        statuses = sorted(frame['Status'].unique(), key=get_status_priority)
+        frame['Status'] = pd.Categorical(frame['Status'], categories=statuses, ordered=True)
+        frame.to_parquet(filename, compression='zstd', index=False)
     except Exception as e:
         print(f"❌ An error occurred while writing to '{filename}': {e}")
 
+def write_report(job_applications: ApplicationTable, filename: str, output_format: str = 'csv'):
+    """Writes the report table to filename as CSV, or as Parquet when output_format is 'parquet'."""
+    if output_format == 'parquet':
+        write_data_to_parquet(job_applications.columns, filename)
+    else:
+        _write_rows_to_csv(job_applications.rows(), filename)
+
+def _checkpoint_report(job_applications: ApplicationTable, filename: str, output_format: str):
+    """Saves the report built so far, so a failure in a later label does not lose it."""
+    write_report(job_applications, filename, output_format)
+    print(f"💾 Saved {len(job_applications)} applications so far to {os.path.basename(filename)}")
+
+def _failure_row_values(failures):
+    """Yields each failure record's values in FAILURE_FIELDNAMES order, blank where a column is missing."""
+    for row in failures:
+        yield [row.get(field, '') for field in FAILURE_FIELDNAMES]
+
 def write_failures_to_csv(failures, filename: str):
     file_exists = os.path.isfile(filename)
-    fieldnames = ['Timestamp', 'Email ID', 'Label', 'Row Number', 'Total Emails', 'Reason', 'Date', 'Company Name', 'Job Title', 'Location', 'Status', 'Metadata', 'Comment', 'Source_File', 'Date_Range']
     try:
-        with open(filename, 'a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        with open(filename, 'a', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile)
             if not file_exists:
-                writer.writeheader()
-            writer.writerows(failures)
+                writer.writerow(FAILURE_FIELDNAMES)
+            writer.writerows(_failure_row_values(failures))
     except Exception as e:
         print(f"Error writing failures to CSV: {e}")
 
-def process_gmail_labels_to_csv(service, target_labels_to_process: list, all_gmail_labels: list, date_range: str = "all"):
+class FailureLog:
+    """Failure rows written to the failure CSV through one buffered handle; the file is opened by the first row."""
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.count = 0
+        self._file = None
+        self._writer = None
+        self._broken = False
+
+    def append(self, row: dict):
+        """Writes one failure row, creating the file with its header if needed."""
+        self.count += 1
+        if self._broken:
+            return
+        try:
+            if self._writer is None:
+                file_exists = os.path.isfile(self.filename)
+                # One large buffer for the whole run; rows reach the disk in big writes and on close()
+                self._file = open(self.filename, 'a', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE)
+                self._writer = csv.writer(self._file)
+                if not file_exists:
+                    self._writer.writerow(FAILURE_FIELDNAMES)
+            self._writer.writerow([row.get(field, '') for field in FAILURE_FIELDNAMES])
+        except Exception as e:
+            print(f"Error writing failures to CSV: {e}")
+            self._broken = True
+
+    def __len__(self) -> int:
+        return self.count
+
+    def close(self):
+        """Flushes and closes the failure CSV, if any row opened it."""
+        if self._file is not None:
+            self._file.close()
+            self._file = self._writer = None
+
+class ParquetFailureLog(FailureLog):
+    """Failure rows kept column by column and written to a Parquet file on close()."""
+
+    def __init__(self, filename: str):
+        super().__init__(filename)
+        self.columns = {field: [] for field in FAILURE_FIELDNAMES}
+
+    def append(self, row: dict):
+        """Adds one failure row; columns it lacks are left empty (null)."""
+        self.count += 1
+        for field, column in self.columns.items():
+            column.append(row.get(field))
+
+    def close(self):
+        """Writes the collected rows to the failure Parquet file, if there were any."""
+        if not self.columns[FAILURE_FIELDNAMES[0]]:
+            return
+        try:
+            pd.DataFrame(self.columns).to_parquet(self.filename, compression='zstd', index=False)
+        except Exception as e:
+            print(f"Error writing failures to Parquet: {e}")
+        # Rows are written once; count still reports them for the run summary
+        self.columns = {field: [] for field in FAILURE_FIELDNAMES}
+
+def process_gmail_labels_to_csv(service, target_labels_to_process: list, all_gmail_labels: list, date_range: str = "all", output_format: str = "csv"):
     """
     Fetches emails for specified labels, parses them, and consolidates into a single CSV file.
     Creates separate files for each date range with timestamps.
+    With output_format='parquet' the report and failure log are written as Parquet instead (needs pyarrow).
     """
     # --- Date Range Processing ---
     try:
@@ -173,195 +416,229 @@ def process_gmail_labels_to_csv(service, target_labels_to_process: list, all_gma
         print(f"❌ Invalid date range: {e}")
         return False
     
+    # Create necessary directories
+    _ensure_dirs()
+
     # Generate unique filenames for this date range
     output_file = get_output_filename(date_range)
+    if output_format == 'parquet':
+        # pandas imports pyarrow itself when writing; only check that it is installed
+        if find_spec('pyarrow') is None:
+            print("⚠️  pyarrow is not installed; writing the report as CSV instead.")
+            output_format = 'csv'
+        else:
+            output_file = os.path.splitext(output_file)[0] + '.parquet'
     failure_log_file = get_failure_log_filename()
+    if output_format == 'parquet':
+        failure_log_file = os.path.splitext(failure_log_file)[0] + '.parquet'
+    # Every failure row carries the same source file name; compute it once
+    source_file = os.path.basename(output_file)
     
     print(f"📁 Output file: {output_file}")
     print(f"📁 Failure log: {failure_log_file}")
 
-    job_applications = {}
-    failure_log = []
-
-    #<editor-fold desc="Phase 1: Build database from 'Applied' emails">
-    print("\n--- Phase 1: Building database from 'LinkedIn/Applied' emails ---")
-    if 'LinkedIn/Applied' in target_labels_to_process:
-        messages = fetch_messages(service, 'LinkedIn/Applied', date_query)
-        print(f"Found {len(messages)} 'Applied' emails to process.")
-        for index, msg_info in enumerate(tqdm(messages, desc="Processing Applied"), 1):
-            msg_full = get_full_message(service, msg_info['id'])
-            if not msg_full: continue
+    # Old emails are excluded by Gmail's search, so they are never listed or downloaded
+    scan_query = f"{date_query} {_MIN_DATE_QUERY}".strip()
 
-            subject = msg_full['subject'] or "No Subject"
-            date_str = parse_date_header(msg_full['date'])
-            comment = generate_comment(subject)
+    job_applications = ApplicationTable()
+    failure_log = ParquetFailureLog(failure_log_file) if output_format == 'parquet' else FailureLog(failure_log_file)
+    # Labels may have been added since the last run; look them up afresh
+    _LABEL_ID_CACHE.clear()
+    _KEY_PART_CACHE.clear()
 
-            try:
-                # Date Filter
-                if date_str and int(date_str.split('-')[0]) < 2024: continue
-
-                body = get_plain_text_body(msg_full)
-                if not body:
-                    raise ValueError("No plain text body found.")
-
-                parsed_info = parse_applied_info(body)
-                key = (parsed_info['Company Name'].lower().strip(), parsed_info['Job Title'].lower().strip())
-                job_applications[key] = {
-                    "Company Name": parsed_info['Company Name'],
-                    "Job Title": parsed_info['Job Title'],
-                    "Location": parsed_info['Location'],
-                    "Status": "Applied",
-                    "Date": date_str,
-                    "Metadata Subject": subject,
-                    "Comment": comment,
-                }
-            except Exception as e:
-                timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                failure_log.append({
-                    'Timestamp': timestamp, 'Email ID': msg_info['id'], 'Label': 'LinkedIn/Applied',
-                    'Row Number': index, 'Total Emails': len(messages), 'Reason': str(e), 
-                    'Date': date_str, 'Company Name': 'N/A', 'Job Title': 'N/A',
-                    'Location': 'N/A', 'Status': 'Applied', 'Metadata': subject, 'Comment': comment,
-                    'Source_File': os.path.basename(output_file), 'Date_Range': get_date_range_description(date_range)
-                })
-                # --- LOG FAILURE BUT CONTINUE ---
-                print(f"⚠️  WARNING: Failed to parse Applied email #{index}/{len(messages)} (ID: {msg_info['id']})")
-                print(f"   Parser Error: {e}")
-                print(f"   Continuing with remaining emails...")
-                
-                # Log the failure but don't stop processing
-                write_failures_to_csv(failure_log, failure_log_file)
-                continue
-    print(f"✅ Successfully built database with {len(job_applications)} unique applications.")
-    #</editor-fold>
-
-    #<editor-fold desc="Phase 2: Process 'Viewed' and 'Rejected' emails">
-    print("\n--- Phase 2: Processing 'Viewed' and 'Rejected' emails ---")
+    # The Viewed/Rejected listings page in on a worker thread while Phase 1 runs
     labels_to_verify = [l for l in ['LinkedIn/Viewed', 'LinkedIn/Rejected'] if l in target_labels_to_process]
+    list_executor = ThreadPoolExecutor(max_workers=1)
+    pending_listings = _prefetch_listings(list_executor, service, labels_to_verify, scan_query)
+
+    try:
+        #<editor-fold desc="Phase 1: Build database from 'Applied' emails">
+        print("\n--- Phase 1: Building database from 'LinkedIn/Applied' emails ---")
+        if 'LinkedIn/Applied' in target_labels_to_process:
+            messages = fetch_messages(service, 'LinkedIn/Applied', scan_query)
+            print(f"Found {len(messages)} 'Applied' emails to process.")
+            applied_fetch = zip(messages, get_full_messages(service, messages))
+            for index, (msg_info, (msg_full, fetch_error)) in enumerate(_progress(applied_fetch, len(messages), "Processing Applied"), 1):
+                if not msg_full:
+                    failure_log.append({
+                        'Timestamp': current_timestamp(), 'Email ID': msg_info['id'], 'Label': 'LinkedIn/Applied',
+                        'Row Number': index, 'Total Emails': len(messages),
+                        'Reason': f"Could not fetch email: {fetch_error}", 'Date': 'N/A',
+                        'Company Name': 'N/A', 'Job Title': 'N/A', 'Location': 'N/A', 'Status': 'Applied',
+                        'Metadata': 'N/A', 'Comment': 'N/A', 'Source_File': source_file, 'Date_Range': date_description
+                    })
+                    continue
 
-    for label_name in labels_to_verify:
-        messages = fetch_messages(service, label_name, date_query)
-        print(f"Found {len(messages)} '{label_name}' emails to process.")
-        for msg_info in tqdm(messages, desc=f"Processing {label_name}"):
-            msg_full = get_full_message(service, msg_info['id'])
-            if not msg_full: continue
+                # Date Filter, before any other work on the email
+                date_str = parse_date_header(get_header(msg_full, 'Date'))
+                if date_str and date_str < _MIN_DATE: continue
+
+                subject = get_header(msg_full, 'Subject') or "No Subject"
+                comment = generate_comment(subject)
+
+                try:
+                    body = get_payload_plain_text(msg_full)
+                    if not body:
+                        raise ValueError("No plain text body found.")
+
+                    parsed_info = parse_applied_info(body)
+                    key = _job_key(parsed_info['Company Name'], parsed_info['Job Title'])
+                    job_applications.put(key, {
+                        "Company Name": parsed_info['Company Name'],
+                        "Job Title": parsed_info['Job Title'],
+                        "Location": parsed_info['Location'],
+                        "Status": "Applied",
+                        "Date": date_str,
+                        "Metadata Subject": subject,
+                        "Comment": comment,
+                    })
+                except Exception as e:
+                    timestamp = current_timestamp()
+                    failure_log.append({
+                        'Timestamp': timestamp, 'Email ID': msg_info['id'], 'Label': 'LinkedIn/Applied',
+                        'Row Number': index, 'Total Emails': len(messages), 'Reason': str(e), 
+                        'Date': date_str, 'Company Name': 'N/A', 'Job Title': 'N/A',
+                        'Location': 'N/A', 'Status': 'Applied', 'Metadata': subject, 'Comment': comment,
+                        'Source_File': source_file, 'Date_Range': date_description
+                    })
+                    # --- LOG FAILURE BUT CONTINUE ---
+                    print(f"⚠️  WARNING: Failed to parse Applied email #{index}/{len(messages)} (ID: {msg_info['id']})")
+                    print(f"   Parser Error: {e}")
+                    print(f"   Continuing with remaining emails...")
+                
+                    # Log the failure but don't stop processing; the row is already in the failure CSV
+                    continue
+        print(f"✅ Successfully built database with {len(job_applications)} unique applications.")
+        if 'LinkedIn/Applied' in target_labels_to_process and labels_to_verify:
+            _checkpoint_report(job_applications, output_file, output_format)
+        #</editor-fold>
+
+        #<editor-fold desc="Phase 2: Process 'Viewed' and 'Rejected' emails">
+        print("\n--- Phase 2: Processing 'Viewed' and 'Rejected' emails ---")
+        all_time_applied_locations = None # (company, title) -> location, built on the first unmatched email
+
+        for label_name in labels_to_verify:
+            listing = pending_listings.get(label_name)
+            messages = _take_listing(listing) if listing else fetch_messages(service, label_name, scan_query)
+            print(f"Found {len(messages)} '{label_name}' emails to process.")
+            current_status = label_name.split('/')[-1] # The same for every email of the label
+            current_priority = get_status_priority(current_status)
+            label_fetch = zip(messages, get_full_messages(service, messages))
+            for msg_info, (msg_full, fetch_error) in _progress(label_fetch, len(messages), f"Processing {label_name}"):
+                if not msg_full:
+                    failure_log.append({
+                        'Timestamp': current_timestamp(), 'Email ID': msg_info['id'], 'Label': label_name,
+                        'Reason': f"Could not fetch email: {fetch_error}", 'Date': 'N/A',
+                        'Company Name': 'N/A', 'Job Title': 'N/A', 'Location': 'N/A', 'Status': current_status,
+                        'Metadata': 'N/A', 'Comment': 'N/A', 'Source_File': source_file, 'Date_Range': date_description
+                    })
+                    continue
 
-            subject = msg_full['subject'] or ""
-            date_str = parse_date_header(msg_full['date'])
-            comment = generate_comment(subject)
-            current_status = label_name.split('/')[-1]
-            parsed_info = {} # Ensure parsed_info exists
+                # Date Filter, before any other work on the email
+                date_str = parse_date_header(get_header(msg_full, 'Date'))
+                if date_str and date_str < _MIN_DATE: continue
 
-            try:
-                # Date Filter
-                if date_str and int(date_str.split('-')[0]) < 2024: continue
+                subject = get_header(msg_full, 'Subject') or ""
+                parsed_info = {} # Ensure parsed_info exists
 
-                html_body = get_html_body(msg_full)
-                parsed_info = parse_viewed_rejected_info(html_body, subject)
+                try:
+                    # Left as bytes; the parser decodes only the fields it extracts
+                    html_body = get_payload_html_bytes(msg_full)
+                    parsed_info = parse_viewed_rejected_info(html_body, subject)
 
-                if parsed_info.get('error'):
-                    raise ValueError(parsed_info['error'])
+                    if parsed_info.get('error'):
+                        raise ValueError(parsed_info['error'])
 
-                company = parsed_info['Company Name']
-                title = parsed_info['Job Title']
-                location = parsed_info['Location']
-                key = (company.lower().strip(), title.lower().strip())
+                    company = parsed_info['Company Name']
+                    title = parsed_info['Job Title']
+                    location = parsed_info['Location']
+                    key = _job_key(company, title)
 
-                # Matching logic
-                existing_record = job_applications.get(key)
+                    # Matching logic
+                    existing_row = job_applications.row_of(key)
                 
-                if not existing_record:
-                    # If an application has no prior 'Applied' record, we'll create a new one.
-                    # Try to get better location info by searching for Applied emails across all time
-                    better_location = location
+                    if existing_row is None:
+                        # If an application has no prior 'Applied' record, we'll create a new one.
+                        # Try to get better location info by searching for Applied emails across all time
+                        better_location = location
                     
-                    # If location is missing or generic, try to find the original Applied email
-                    if not location or location in ['Not Found', 'Location not specified', '']:
-                        try:
-                            # Search for Applied emails with same company/title across all time
-                            applied_messages = fetch_messages(service, 'LinkedIn/Applied', "")
-                            for applied_msg_info in applied_messages:
-                                applied_msg_full = get_full_message(service, applied_msg_info['id'])
-                                if not applied_msg_full:
-                                    continue
-                                
-                                applied_body = get_plain_text_body(applied_msg_full)
-                                if applied_body:
-                                    try:
-                                        applied_parsed = parse_applied_info(applied_body)
-                                        applied_key = (applied_parsed['Company Name'].lower().strip(), 
-                                                     applied_parsed['Job Title'].lower().strip())
-                                        
-                                        # If we found a matching Applied email, use its location
-                                        if applied_key == key and applied_parsed.get('Location'):
-                                            better_location = applied_parsed['Location']
-                                            print(f"✅ Found matching Applied email location: {better_location}")
-                                            break
-                                    except:
-                                        continue
-                        except Exception as e:
-                            print(f"⚠️ Could not search for Applied email location: {e}")
+                        # If location is missing or generic, try to find the original Applied email
+                        if not location or location in ['Not Found', 'Location not specified', '']:
+                            try:
+                                # Search for Applied emails with same company/title across all time,
+                                # indexing them on the first miss and reusing that for later ones
+                                if all_time_applied_locations is None:
+                                    all_time_applied_locations = index_applied_locations(service)
+                            
+                                # If we found a matching Applied email, use its location
+                                if key in all_time_applied_locations:
+                                    better_location = all_time_applied_locations[key]
+                                    print(f"✅ Found matching Applied email location: {better_location}")
+                            except Exception as e:
+                                print(f"⚠️ Could not search for Applied email location: {e}")
                     
-                    # Log warning for unmatched records
-                    if current_status == 'Viewed':
-                        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        failure_reason = f"Unmatched 'Viewed' email. Added to main report, but a matching 'Applied' record was not found in the selected date range. Location: {better_location or 'Not Found'}"
-                        failure_log.append({
-                            'Timestamp': timestamp, 'Email ID': msg_info['id'], 'Label': label_name,
-                            'Reason': failure_reason, 'Date': date_str, 
-                            'Company Name': company, 'Job Title': title, 'Location': better_location or 'Not Found',
-                            'Status': current_status, 'Metadata': subject, 'Comment': comment,
-                            'Source_File': os.path.basename(output_file), 'Date_Range': get_date_range_description(date_range)
-                        })
+                        # Log warning for unmatched records
+                        if current_status == 'Viewed':
+                            timestamp = current_timestamp()
+                            failure_reason = f"Unmatched 'Viewed' email. Added to main report, but a matching 'Applied' record was not found in the selected date range. Location: {better_location or 'Not Found'}"
+                            failure_log.append({
+                                'Timestamp': timestamp, 'Email ID': msg_info['id'], 'Label': label_name,
+                                'Reason': failure_reason, 'Date': date_str, 
+                                'Company Name': company, 'Job Title': title, 'Location': better_location or 'Not Found',
+                                'Status': current_status, 'Metadata': subject, 'Comment': generate_comment(subject),
+                                'Source_File': source_file, 'Date_Range': date_description
+                            })
                     
-                    # Add the new record for 'Viewed' or 'Rejected' with better location
-                    job_applications[key] = {
-                        "Company Name": company, 
-                        "Job Title": title, 
-                        "Location": better_location or "Location not found in date range", 
-                        "Status": current_status,
-                        "Date": date_str, 
-                        "Metadata Subject": subject, 
-                        "Comment": f"{current_status} email found without matching Applied record in date range"
-                    }
-                    continue
+                        # Add the new record for 'Viewed' or 'Rejected' with better location
+                        job_applications.put(key, {
+                            "Company Name": company, 
+                            "Job Title": title, 
+                            "Location": better_location or "Location not found in date range", 
+                            "Status": current_status,
+                            "Date": date_str, 
+                            "Metadata Subject": subject, 
+                            "Comment": f"{current_status} email found without matching Applied record in date range"
+                        })
+                        continue
 
-                # Update existing record - PRESERVE ORIGINAL LOCATION
-                if get_status_priority(current_status) > get_status_priority(existing_record['Status']):
-                    original_comment = existing_record.get('Comment', '')
-                    original_location = existing_record.get('Location', '')  # Preserve original location
+                    # Update existing record - PRESERVE ORIGINAL LOCATION
+                    if current_priority > STATUS_PRIORITY.get(job_applications.get(existing_row, 'Status'), 0):
+                        original_comment = job_applications.get(existing_row, 'Comment')
+                        original_location = job_applications.get(existing_row, 'Location')  # Preserve original location
                     
-                    # Only update status-related fields, preserve location from Applied email
-                    existing_record['Status'] = current_status
-                    existing_record['Date'] = date_str
-                    existing_record['Metadata Subject'] = subject
-                    existing_record['Comment'] = f"Status updated to {current_status}. Original comment: {original_comment}"
+                        # Only update status-related fields, preserve location from Applied email
+                        job_applications.set(existing_row, 'Status', current_status)
+                        job_applications.set(existing_row, 'Date', date_str)
+                        job_applications.set(existing_row, 'Metadata Subject', subject)
+                        job_applications.set(existing_row, 'Comment', f"Status updated to {current_status}. Original comment: {original_comment}")
                     
-                    # Keep the original location from Applied email, only fill if it was missing
-                    if not original_location and location:
-                        existing_record['Location'] = location
-                    else:
-                        existing_record['Location'] = original_location  # Preserve Applied email location
-
-            except Exception as e:
-                timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                failure_log.append({
-                    'Timestamp': timestamp, 'Email ID': msg_info['id'], 'Label': label_name,
-                    'Reason': str(e), 'Date': date_str, 
-                    'Company Name': parsed_info.get('Company Name', 'Parse Failed'),
-                    'Job Title': parsed_info.get('Job Title', 'Parse Failed'), 
-                    'Location': parsed_info.get('Location', 'Parse Failed'),
-                    'Status': current_status, 'Metadata': subject, 'Comment': comment,
-                    'Source_File': os.path.basename(output_file), 'Date_Range': get_date_range_description(date_range)
-                })
-    #</editor-fold>
+                        # Keep the original location from Applied email, only fill if it was missing
+                        if not original_location and location:
+                            job_applications.set(existing_row, 'Location', location)
+
+                except Exception as e:
+                    timestamp = current_timestamp()
+                    failure_log.append({
+                        'Timestamp': timestamp, 'Email ID': msg_info['id'], 'Label': label_name,
+                        'Reason': str(e), 'Date': date_str, 
+                        'Company Name': parsed_info.get('Company Name', 'Parse Failed'),
+                        'Job Title': parsed_info.get('Job Title', 'Parse Failed'), 
+                        'Location': parsed_info.get('Location', 'Parse Failed'),
+                        'Status': current_status, 'Metadata': subject, 'Comment': generate_comment(subject),
+                        'Source_File': source_file, 'Date_Range': date_description
+                    })
+            # The last label's rows are written by the final output below
+            if label_name != labels_to_verify[-1]:
+                _checkpoint_report(job_applications, output_file, output_format)
+        #</editor-fold>
+    finally:
+        # Also on an error: stop the listing thread (dropping listings not yet started) and save the failures so far
+        list_executor.shutdown(cancel_futures=True)
+        failure_log.close()
 
     # --- Final Output ---
-    if failure_log:
-        write_failures_to_csv(failure_log, failure_log_file)
     
-    final_data_list = list(job_applications.values())
-    write_data_to_csv(final_data_list, output_file)
+    write_report(job_applications, output_file, output_format)
     
     print(f"\n\n==================== SCRIPT COMPLETE ====================")
     if not failure_log:
@@ -380,36 +657,114 @@ def process_gmail_labels_to_csv(service, target_labels_to_process: list, all_gma
     
     return True
 
-def get_full_message(service, msg_id):
-    try:
-        msg_full = service.users().messages().get(userId='me', id=msg_id, format='raw').execute()
-        raw = base64.urlsafe_b64decode(msg_full['raw'].encode('ASCII'))
-        return email.message_from_bytes(raw, policy=policy.default)
-    except HttpError as error:
-        print(f"HTTP error fetching message ID {msg_id}: {error}")
-        return None
-
-def parse_date_header(date_string: str) -> str:
-    """Parses date string from email header into YYYY-MM-DD format."""
-    if not date_string:
-        return ""
-    try:
-        # The dateutil parser is very robust and handles most common formats
-        dt = date_parser.parse(date_string)
-        return dt.strftime('%Y-%m-%d')
-    except (date_parser.ParserError, TypeError):
-        # Fallback for formats that parse might miss, e.g., with non-standard timezone names
-        # Example: "Thu, 9 Nov 2023 15:53:11 +0000 (UTC)"
-        match = re.search(r'\d+\s+\w+\s+\d{4}', date_string)
-        if match:
+def index_applied_locations(service) -> Dict[tuple, str]:
+    """Maps each (company, title) key to the location in its newest all-time 'Applied' email."""
+    applied_messages = fetch_messages(service, 'LinkedIn/Applied', "")
+    locations = {}
+    for applied_msg_full, _ in get_full_messages(service, applied_messages):
+        if not applied_msg_full:
+            continue
+        
+        applied_body = get_payload_plain_text(applied_msg_full)
+        if applied_body:
             try:
-                # Re-try parsing just the core date part
-                dt = date_parser.parse(match.group(0))
-                return dt.strftime('%Y-%m-%d')
-            except (date_parser.ParserError, TypeError):
-                return "" # Could not parse even the fallback
-        return ""
+                applied_parsed = parse_applied_info(applied_body)
+            except:
+                continue
+            applied_key = _job_key(applied_parsed['Company Name'], applied_parsed['Job Title'])
+            # Messages come newest first; keep the first location seen for each job
+            if applied_parsed.get('Location') and applied_key not in locations:
+                locations[applied_key] = applied_parsed['Location']
+    return locations
+
+def _fetch_batch(service, msg_ids: List[str]) -> Tuple[Dict[str, Dict], Dict[str, str]]:
+    """
+    Runs batched gets for msg_ids, sending rate-limited and server-error items again after a backoff.
+    Returns ({message ID: message}, {message ID: error} for the gets that still failed).
+    """
+    fetched, failed = {}, {}
+    pending = msg_ids
+    for attempt in range(FETCH_MAX_RETRIES + 1):
+        retry, delays = [], [0.0]
+
+        def on_response(request_id, response, exception):
+            if exception is None:
+                fetched[request_id] = response
+            elif (attempt < FETCH_MAX_RETRIES and isinstance(exception, HttpError)
+                  and exception.resp.status in RETRYABLE_STATUSES):
+                retry.append(request_id)
+                delays.append(retry_delay(exception, attempt))
+            else:
+                failed[request_id] = str(exception)
+
+        batch = service.new_batch_http_request(callback=on_response)
+        for msg_id in pending:
+            batch.add(service.users().messages().get(userId='me', id=msg_id, format='full', fields=_MESSAGE_FIELDS), request_id=msg_id)
+        try:
+            batch.execute()
+        except HttpError as error:
+            print(f"HTTP error fetching message batch: {error}")
+            print(f"Falling back to {FALLBACK_WORKERS} concurrent single requests for this batch...")
+            rest = [msg_id for msg_id in pending if msg_id not in fetched and msg_id not in failed]
+            rest_fetched, rest_failed = _fetch_concurrently(service, rest)
+            fetched.update(rest_fetched)
+            failed.update(rest_failed)
+            break
+        if not retry:
+            break
+        time.sleep(max(delays))
+        pending = retry
+    return fetched, failed
+
+def _thread_http(credentials):
+    """Returns the calling thread's own authorized HTTP object, creating it on first use."""
+    http = getattr(_THREAD_STATE, 'http', None)
+    if http is None:
+        http = _THREAD_STATE.http = AuthorizedHttp(credentials, http=httplib2.Http())
+    return http
+
+def _fetch_concurrently(service, msg_ids: List[str]) -> Tuple[Dict[str, Dict], Dict[str, str]]:
+    """
+    Fetches msg_ids with individual, retried gets spread over FALLBACK_WORKERS threads.
+    Returns ({message ID: message}, {message ID: error} for the gets that still failed).
+    """
+    # httplib2 connections are not thread-safe, so each worker needs its own authorized HTTP object;
+    # without credentials to build them from, fetch one at a time on the shared connection
+    credentials = getattr(getattr(service, '_http', None), 'credentials', None)
+
+    def fetch(msg_id):
+        request = service.users().messages().get(userId='me', id=msg_id, format='full', fields=_MESSAGE_FIELDS)
+        try:
+            return execute_with_retry(request, http=_thread_http(credentials) if credentials else None), None
+        except HttpError as error:
+            return None, str(error)
 
+    if credentials is None:
+        results = map(fetch, msg_ids)
+    else:
+        with ThreadPoolExecutor(max_workers=FALLBACK_WORKERS) as executor:
+            results = list(executor.map(fetch, msg_ids))
+    fetched, failed = {}, {}
+    for msg_id, (msg, error) in zip(msg_ids, results):
+        if msg:
+            fetched[msg_id] = msg
+        else:
+            failed[msg_id] = error
+    return fetched, failed
+
+def get_full_messages(service, messages: List[Dict]):
+    """
+    Fetches messages in batched HTTP requests of up to BATCH_SIZE gets each.
+    Yields (message, None), or (None, error) if it could not be fetched, for each entry of messages, in order.
+    """
+    for start in range(0, len(messages), BATCH_SIZE):
+        chunk = [msg_info['id'] for msg_info in messages[start:start + BATCH_SIZE]]
+        fetched, failed = _fetch_batch(service, chunk)
+        for msg_id in chunk:
+            yield fetched.get(msg_id), failed.get(msg_id)
+
+# Threads repeat subjects; identical subjects then share one comment string across rows
+@lru_cache(maxsize=4096)
 def generate_comment(subject: str) -> str:
     """Generates a comment based on email subject line keywords."""
     if subject:
@@ -421,17 +776,17 @@ def parse_messages(service, label_name: str) -> List[Dict]:
     # Use the full LinkedIn label name
     full_label = f"LinkedIn/{label_name}" if not label_name.startswith('LinkedIn/') else label_name
     print(f"\n📥 Parsing label: {label_name}")
+    _ensure_dirs()
     messages = fetch_messages(service, full_label, "")
     parsed_rows = []
     
-    for msg_meta in tqdm(messages, desc=f"{label_name} Messages"):
+    for msg_meta in _progress(messages, len(messages), f"{label_name} Messages"):
         try:
-            msg = service.users().messages().get(userId='me', id=msg_meta['id'], format='full').execute()
-            payload = msg['payload']
-            headers = {h['name']: h['value'] for h in payload.get('headers', [])}
-            subject = headers.get('Subject', '')
+            msg = service.users().messages().get(userId='me', id=msg_meta['id'], format='full', fields=_MESSAGE_FIELDS).execute()
+            # Only the subject is needed from the headers; don't build a dict of all of them
+            subject = get_header(msg, 'Subject') or ''
             date = parse_internal_date(msg['internalDate'])
-            body = extract_body(payload)
+            body = extract_body(msg['payload'])
             snippet = body[:300]
 
             if full_label == 'LinkedIn/Applied':
@@ -465,48 +820,8 @@ def parse_messages(service, label_name: str) -> List[Dict]:
 def save_to_excel(applied_rows: List[Dict], viewed_rows: List[Dict], rejected_rows: List[Dict]):
     """Save parsed data to CSV file with separate files for each status."""
     # Save each status to its own CSV file
+    _ensure_dirs()
     pd.DataFrame(applied_rows).to_csv('data/processed/Applied.csv', index=False)
     pd.DataFrame(viewed_rows).to_csv('data/processed/Viewed.csv', index=False)
     pd.DataFrame(rejected_rows).to_csv('data/processed/Rejected.csv', index=False)
     print(f"\n✅ Exported to data/processed/")
-
-def parse_html_for_job_info(html_content: str) -> dict:
-    """
-    Parses HTML content (from 'show original') to extract Job Title, Company Name, and Location.
-    This is for 'Viewed' and 'Rejected' emails where the plain text is insufficient.
-    """
-    job_title = ""
-    company_name = ""
-    location = ""
-
-    # Regex for Job Title - looks for text within <a> tag with specific styling/structure
-    # This pattern is robust to HTML entities and non-breaking spaces.
-    job_title_match = re.search(
-        r'line-height:\s*1\.25;\s*color:\s*#0a66c2;">\s*(.*?)(?:</a>|</td)',
-        html_content, re.DOTALL | re.IGNORECASE
-    )
-    if job_title_match:
-        job_title = job_title_match.group(1).strip()
-        job_title = job_title.replace('&amp;', '&').replace('&nbsp;', ' ').replace('=C2=A0', ' ')
-        job_title = re.sub(r'\s+', ' ', job_title).strip() # Consolidate multiple spaces
-
-    # Regex for Company Name and Location - looks for text within <p> tag with specific class, separated by &middot;
-    company_location_match = re.search(
-        r'<p\s+class=3D"text-system-gray-100\s+text-sm\s+leading-\[20px\]"[^>]*?>\s*(.*?)\s*&m=iddot;\s*(.*?)\s*</p>',
-        html_content, re.DOTALL | re.IGNORECASE
-    )
-    
-    if company_location_match:
-        company_name = company_location_match.group(1).strip()
-        location = company_location_match.group(2).strip()
-        company_name = company_name.replace('&amp;', '&').replace('&nbsp;', ' ').replace('=C2=A0', ' ')
-        location = location.replace('&amp;', '&').replace('&nbsp;', ' ').replace('=C2=A0', ' ')
-        company_name = re.sub(r'\s+', ' ', company_name).strip()
-        location = re.sub(r'\s+', ' ', location).strip()
-
-    # Don't raise errors here, let the calling function decide how to handle missing data
-    return {
-        "Job Title": job_title,
-        "Company Name": company_name,
-        "Location": location
-    } 
\ No newline at end of file
@@ -5,30 +5,77 @@ Archive Utilities for LinkedIn Job Application Tracker
 This module provides functionality to archive processed files into organized folders.
 """
 
+import logging
 import os
 import shutil
-import glob
+import sys
+from logging.handlers import MemoryHandler
 from datetime import datetime
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
-def get_unique_filename(destination_path: str) -> str:
+# Reports and failure logs may be written as CSV or as Parquet
+REPORT_EXTENSIONS = (".csv", ".parquet")
+
+# Progress lines buffered before being written out together, rather than one write per file
+_LOG_BUFFER_LINES = 100
+
+class _StdoutHandler(logging.StreamHandler):
+    """StreamHandler that writes to sys.stdout as it is at emit time, so redirected output still gets the lines."""
+
+    def emit(self, record):
+        self.stream = sys.stdout
+        super().emit(record)
+
+# Archive progress goes to stdout like the rest of the app's output, in blocks of lines;
+# errors and the end of perform_archive flush whatever is pending
+_log = logging.getLogger(__name__)
+_log.setLevel(logging.INFO)
+_log.propagate = False
+_stdout_handler = _StdoutHandler()
+_stdout_handler.setFormatter(logging.Formatter('%(message)s'))
+_log_handler = MemoryHandler(_LOG_BUFFER_LINES, flushLevel=logging.ERROR, target=_stdout_handler)
+_log.addHandler(_log_handler)
+
+def list_directory_names(dir_path: str) -> set:
+    """
+    Snapshot the names in a directory for get_unique_filename.
+    
+    Args:
+        dir_path: Directory to list
+        
+    Returns:
+        Set of the entry names, case-normalized for the platform (empty if the directory is missing)
+    """
+    try:
+        return {os.path.normcase(name) for name in os.listdir(dir_path)}
+    except FileNotFoundError:
+        return set()
+
+def get_unique_filename(destination_path: str, existing_names: Optional[set] = None) -> str:
     """
     Generate a unique filename if the destination already exists.
     Adds (1), (2), etc. suffix before the file extension.
     
+    Collisions are checked against a single snapshot of the directory rather than
+    one filesystem call per candidate name.
+    
     Args:
         destination_path: The original destination path
+        existing_names: Snapshot from list_directory_names for the destination's
+            directory; taken here if not given
         
     Returns:
         A unique destination path
     """
-    if not os.path.exists(destination_path):
-        return destination_path
-    
     # Split the path into directory, name, and extension
     dir_path = os.path.dirname(destination_path)
     filename = os.path.basename(destination_path)
     
+    if existing_names is None:
+        existing_names = list_directory_names(dir_path or '.')
+    if os.path.normcase(filename) not in existing_names:
+        return destination_path
+    
     # Split filename into name and extension
     if '.' in filename:
         name, ext = os.path.splitext(filename)
@@ -37,12 +84,52 @@ def get_unique_filename(destination_path: str) -> str:
     
     # Find the next available number
     counter = 1
-    while True:
-        new_filename = f"{name} ({counter}){ext}"
-        new_path = os.path.join(dir_path, new_filename)
-        if not os.path.exists(new_path):
-            return new_path
+    while os.path.normcase(f"{name} ({counter}){ext}") in existing_names:
         counter += 1
+    return os.path.join(dir_path, f"{name} ({counter}){ext}")
+
+def move_file(source_path: str, destination_path: str):
+    """
+    Move a file, with a single rename when source and destination share a filesystem.
+    
+    Args:
+        source_path: File to move
+        destination_path: Where to move it
+    """
+    try:
+        os.replace(source_path, destination_path)
+    except OSError:
+        # Different filesystem (or drive): let shutil copy and delete
+        shutil.move(source_path, destination_path)
+
+def copy_file(source_path: str, destination_path: str):
+    """
+    Copy a file's contents, letting the kernel share the data blocks where the filesystem can.
+    
+    On Linux, copy_file_range lets copy-on-write filesystems (btrfs, XFS) clone the
+    file without reading it; elsewhere, if the call is refused, or if it stops before
+    the whole file is copied, shutil.copyfile is used.
+    
+    Args:
+        source_path: File to copy
+        destination_path: Where to write the copy
+    """
+    copy_file_range = getattr(os, 'copy_file_range', None)
+    if copy_file_range is not None:
+        try:
+            with open(source_path, 'rb') as source, open(destination_path, 'wb') as destination:
+                remaining = os.fstat(source.fileno()).st_size
+                while remaining > 0:
+                    copied = copy_file_range(source.fileno(), destination.fileno(), remaining)
+                    if not copied:
+                        break
+                    remaining -= copied
+            if remaining <= 0:
+                return
+            # Some filesystems (e.g. procfs, some FUSE mounts) report 0 bytes copied: copy the ordinary way
+        except OSError:
+            pass  # e.g. unsupported by this kernel or filesystem pair: copy the ordinary way
+    shutil.copyfile(source_path, destination_path)
 
 def create_archive_structure(base_archive_dir: str = "data/archive") -> dict:
     """
@@ -69,7 +156,7 @@ def create_archive_structure(base_archive_dir: str = "data/archive") -> dict:
     for dir_name, dir_path in archive_dirs.items():
         try:
             os.makedirs(dir_path, exist_ok=True)
-            print(f"✅ Created/verified directory: {dir_path}")
+            _log.info(f"✅ Created/verified directory: {dir_path}")
         except PermissionError as e:
             raise PermissionError(f"Permission denied creating {dir_name} directory '{dir_path}': {e}")
         except OSError as e:
@@ -104,48 +191,50 @@ def get_files_to_archive(processed_dir: str = "data/processed") -> dict:
     try:
         for check_dir in directories_to_check:
             if not os.path.exists(check_dir):
-                print(f"⚠️ Directory does not exist: {check_dir}")
+                _log.info(f"⚠️ Directory does not exist: {check_dir}")
                 continue
             
-            print(f"🔍 Checking directory: {check_dir}")
+            _log.info(f"🔍 Checking directory: {check_dir}")
             
-            # Find job application status files
+            # Find job application status and failed verification files in one listing
             try:
-                job_app_pattern = os.path.join(check_dir, "job_application_status_*.csv")
-                dir_job_files = glob.glob(job_app_pattern)
+                dir_job_files, dir_failed_files = [], []
+                with os.scandir(check_dir) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if name.startswith("job_application_status_") and name.endswith(REPORT_EXTENSIONS):
+                            if entry.is_file():
+                                dir_job_files.append(entry.path)
+                        elif name.startswith("failed_verifications_") and name.endswith(REPORT_EXTENSIONS):
+                            if entry.is_file():
+                                dir_failed_files.append(entry.path)
                 files['job_applications'].extend(dir_job_files)
-                if dir_job_files:
-                    print(f"📋 Found {len(dir_job_files)} job application files in {check_dir}")
-            except Exception as e:
-                print(f"⚠️ Error searching for job application files in {check_dir}: {e}")
-            
-            # Find failed verification files
-            try:
-                failed_pattern = os.path.join(check_dir, "failed_verifications_*.csv")
-                dir_failed_files = glob.glob(failed_pattern)
                 files['failed_verifications'].extend(dir_failed_files)
+                if dir_job_files:
+                    _log.info(f"📋 Found {len(dir_job_files)} job application files in {check_dir}")
                 if dir_failed_files:
-                    print(f"❌ Found {len(dir_failed_files)} failed verification files in {check_dir}")
+                    _log.info(f"❌ Found {len(dir_failed_files)} failed verification files in {check_dir}")
             except Exception as e:
-                print(f"⚠️ Error searching for failed verification files in {check_dir}: {e}")
+                _log.warning(f"⚠️ Error searching for report files in {check_dir}: {e}")
             
             # Find log files (only check data/logs directory for the processed_dir)
             if check_dir == processed_dir:
                 try:
                     logs_dir = "data/logs"
                     if os.path.exists(logs_dir):
-                        log_pattern = os.path.join(logs_dir, "*.log")
-                        dir_log_files = glob.glob(log_pattern)
+                        with os.scandir(logs_dir) as entries:
+                            dir_log_files = [entry.path for entry in entries
+                                             if entry.name.endswith(".log") and not entry.name.startswith(".") and entry.is_file()]
                         files['logs'].extend(dir_log_files)
                         if dir_log_files:
-                            print(f"📝 Found {len(dir_log_files)} log files in {logs_dir}")
+                            _log.info(f"📝 Found {len(dir_log_files)} log files in {logs_dir}")
                     else:
-                        print(f"⚠️ Logs directory does not exist: {logs_dir}")
+                        _log.info(f"⚠️ Logs directory does not exist: {logs_dir}")
                 except Exception as e:
-                    print(f"⚠️ Error searching for log files: {e}")
+                    _log.warning(f"⚠️ Error searching for log files: {e}")
         
         # Print summary
-        print(f"📊 Total files found: {len(files['job_applications'])} job applications, {len(files['failed_verifications'])} failed verifications, {len(files['logs'])} logs")
+        _log.info(f"📊 Total files found: {len(files['job_applications'])} job applications, {len(files['failed_verifications'])} failed verifications, {len(files['logs'])} logs")
         
     except OSError as e:
         raise OSError(f"Failed to access processed directory '{processed_dir}': {e}")
@@ -154,6 +243,48 @@ def get_files_to_archive(processed_dir: str = "data/processed") -> dict:
     
     return files
 
+def _archive_one(file_path: str, destination: str, existing_names: set, results: dict, category: str, copy: bool = False):
+    """
+    Move (or copy) one file into the archive under a unique name and record the outcome.
+    
+    Args:
+        file_path: File to archive
+        destination: Preferred destination path; numbered if the name is taken
+        existing_names: Snapshot of the destination directory's names, updated here
+        results: The archive_files results dictionary
+        category: Results key of the file's category
+        copy: Copy instead of moving, leaving the original in place
+    """
+    action = "copying" if copy else "moving"
+    try:
+        if not os.path.exists(file_path):
+            results['errors'].append(f"Source file not found: {file_path}")
+            return
+        
+        # Get unique filename if destination already exists
+        unique_destination = get_unique_filename(destination, existing_names)
+        unique_filename = os.path.basename(unique_destination)
+        
+        if copy:
+            # Contents only; the archived name already records when it was taken
+            copy_file(file_path, unique_destination)
+        else:
+            move_file(file_path, unique_destination)
+        existing_names.add(os.path.normcase(unique_filename))
+        results[category]['files'].append(unique_filename)
+        results[category]['count'] += 1
+        _log.info(f"✅ Archived: {unique_filename}" if copy else f"✅ Archived and deleted original: {unique_filename}")
+    
+    except OSError as e:
+        # Also covers PermissionError and shutil.Error
+        error_msg = f"OS error {action} {file_path}: {e}"
+        results['errors'].append(error_msg)
+        _log.error(f"❌ {error_msg}")
+    except Exception as e:
+        error_msg = f"Unexpected error {action} {file_path}: {e}"
+        results['errors'].append(error_msg)
+        _log.error(f"❌ {error_msg}")
+
 def archive_files(files_to_archive: dict, archive_dirs: dict) -> dict:
     """
     Archive files to their respective directories.
@@ -173,120 +304,26 @@ def archive_files(files_to_archive: dict, archive_dirs: dict) -> dict:
     }
     
     # Archive job application files
-    print(f"📋 Archiving {len(files_to_archive['job_applications'])} job application files...")
+    _log.info(f"📋 Archiving {len(files_to_archive['job_applications'])} job application files...")
+    existing_names = list_directory_names(archive_dirs['job_applications'])
     for file_path in files_to_archive['job_applications']:
-        try:
-            if not os.path.exists(file_path):
-                results['errors'].append(f"Source file not found: {file_path}")
-                continue
-                
-            filename = os.path.basename(file_path)
-            destination = os.path.join(archive_dirs['job_applications'], filename)
-            
-            # Get unique filename if destination already exists
-            unique_destination = get_unique_filename(destination)
-            unique_filename = os.path.basename(unique_destination)
-            
-            # Perform the move operation
-            shutil.move(file_path, unique_destination)
-            results['job_applications']['files'].append(unique_filename)
-            results['job_applications']['count'] += 1
-            print(f"✅ Archived and deleted original: {unique_filename}")
-            
-        except PermissionError as e:
-            error_msg = f"Permission denied moving {file_path}: {e}"
-            results['errors'].append(error_msg)
-            print(f"❌ {error_msg}")
-        except shutil.Error as e:
-            error_msg = f"File operation error moving {file_path}: {e}"
-            results['errors'].append(error_msg)
-            print(f"❌ {error_msg}")
-        except OSError as e:
-            error_msg = f"OS error moving {file_path}: {e}"
-            results['errors'].append(error_msg)
-            print(f"❌ {error_msg}")
-        except Exception as e:
-            error_msg = f"Unexpected error moving {file_path}: {e}"
-            results['errors'].append(error_msg)
-            print(f"❌ {error_msg}")
+        destination = os.path.join(archive_dirs['job_applications'], os.path.basename(file_path))
+        _archive_one(file_path, destination, existing_names, results, 'job_applications')
     
     # Archive failed verification files
-    print(f"❌ Archiving {len(files_to_archive['failed_verifications'])} failed verification files...")
+    _log.info(f"❌ Archiving {len(files_to_archive['failed_verifications'])} failed verification files...")
+    existing_names = list_directory_names(archive_dirs['failed_verifications'])
     for file_path in files_to_archive['failed_verifications']:
-        try:
-            if not os.path.exists(file_path):
-                results['errors'].append(f"Source file not found: {file_path}")
-                continue
-                
-            filename = os.path.basename(file_path)
-            destination = os.path.join(archive_dirs['failed_verifications'], filename)
-            
-            # Get unique filename if destination already exists
-            unique_destination = get_unique_filename(destination)
-            unique_filename = os.path.basename(unique_destination)
-            
-            # Perform the move operation
-            shutil.move(file_path, unique_destination)
-            results['failed_verifications']['files'].append(unique_filename)
-            results['failed_verifications']['count'] += 1
-            print(f"✅ Archived and deleted original: {unique_filename}")
-            
-        except PermissionError as e:
-            error_msg = f"Permission denied moving {file_path}: {e}"
-            results['errors'].append(error_msg)
-            print(f"❌ {error_msg}")
-        except shutil.Error as e:
-            error_msg = f"File operation error moving {file_path}: {e}"
-            results['errors'].append(error_msg)
-            print(f"❌ {error_msg}")
-        except OSError as e:
-            error_msg = f"OS error moving {file_path}: {e}"
-            results['errors'].append(error_msg)
-            print(f"❌ {error_msg}")
-        except Exception as e:
-            error_msg = f"Unexpected error moving {file_path}: {e}"
-            results['errors'].append(error_msg)
-            print(f"❌ {error_msg}")
+        destination = os.path.join(archive_dirs['failed_verifications'], os.path.basename(file_path))
+        _archive_one(file_path, destination, existing_names, results, 'failed_verifications')
     
     # Archive log files (copy, don't move, to keep current logs accessible)
-    print(f"📝 Archiving {len(files_to_archive['logs'])} log files...")
+    _log.info(f"📝 Archiving {len(files_to_archive['logs'])} log files...")
+    existing_names = list_directory_names(archive_dirs['logs'])
     for file_path in files_to_archive['logs']:
-        try:
-            if not os.path.exists(file_path):
-                results['errors'].append(f"Source file not found: {file_path}")
-                continue
-                
-            filename = os.path.basename(file_path)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            archived_filename = f"{timestamp}_{filename}"
-            destination = os.path.join(archive_dirs['logs'], archived_filename)
-            
-            # Get unique filename if destination already exists (unlikely with timestamp, but safe)
-            unique_destination = get_unique_filename(destination)
-            unique_filename = os.path.basename(unique_destination)
-            
-            # Perform the copy operation
-            shutil.copy2(file_path, unique_destination)
-            results['logs']['files'].append(unique_filename)
-            results['logs']['count'] += 1
-            print(f"✅ Archived: {unique_filename}")
-            
-        except PermissionError as e:
-            error_msg = f"Permission denied copying {file_path}: {e}"
-            results['errors'].append(error_msg)
-            print(f"❌ {error_msg}")
-        except shutil.Error as e:
-            error_msg = f"File operation error copying {file_path}: {e}"
-            results['errors'].append(error_msg)
-            print(f"❌ {error_msg}")
-        except OSError as e:
-            error_msg = f"OS error copying {file_path}: {e}"
-            results['errors'].append(error_msg)
-            print(f"❌ {error_msg}")
-        except Exception as e:
-            error_msg = f"Unexpected error copying {file_path}: {e}"
-            results['errors'].append(error_msg)
-            print(f"❌ {error_msg}")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        destination = os.path.join(archive_dirs['logs'], f"{timestamp}_{os.path.basename(file_path)}")
+        _archive_one(file_path, destination, existing_names, results, 'logs', copy=True)
     
     return results
 
@@ -297,39 +334,46 @@ def perform_archive() -> Tuple[bool, dict]:
     Returns:
         Tuple of (success, results_dict)
     """
-    print("🗂️ Starting archive operation...")
+    try:
+        return _perform_archive()
+    finally:
+        _log_handler.flush()
+
+def _perform_archive() -> Tuple[bool, dict]:
+    """Body of perform_archive, whose buffered progress output is flushed by the caller."""
+    _log.info("🗂️ Starting archive operation...")
     
     try:
         # Create archive structure
-        print("📁 Creating archive directory structure...")
+        _log.info("📁 Creating archive directory structure...")
         try:
             archive_dirs = create_archive_structure()
-            print("✅ Archive directory structure created successfully")
+            _log.info("✅ Archive directory structure created successfully")
         except PermissionError as e:
             error_msg = f"Permission denied creating archive directories: {e}"
-            print(f"❌ {error_msg}")
+            _log.error(f"❌ {error_msg}")
             return False, {'message': error_msg, 'error_type': 'permission_error'}
         except OSError as e:
             error_msg = f"OS error creating archive directories: {e}"
-            print(f"❌ {error_msg}")
+            _log.error(f"❌ {error_msg}")
             return False, {'message': error_msg, 'error_type': 'os_error'}
         except Exception as e:
             error_msg = f"Unexpected error creating archive directories: {e}"
-            print(f"❌ {error_msg}")
+            _log.error(f"❌ {error_msg}")
             return False, {'message': error_msg, 'error_type': 'unexpected_error'}
         
         # Get files to archive
-        print("🔍 Searching for files to archive...")
+        _log.info("🔍 Searching for files to archive...")
         try:
             files_to_archive = get_files_to_archive()
-            print("✅ File search completed")
+            _log.info("✅ File search completed")
         except OSError as e:
             error_msg = f"OS error searching for files: {e}"
-            print(f"❌ {error_msg}")
+            _log.error(f"❌ {error_msg}")
             return False, {'message': error_msg, 'error_type': 'os_error'}
         except Exception as e:
             error_msg = f"Unexpected error searching for files: {e}"
-            print(f"❌ {error_msg}")
+            _log.error(f"❌ {error_msg}")
             return False, {'message': error_msg, 'error_type': 'unexpected_error'}
         
         # Check if there are any files to archive
@@ -339,19 +383,19 @@ def perform_archive() -> Tuple[bool, dict]:
         
         if total_files == 0:
             message = 'No files found to archive'
-            print(f"⚠️ {message}")
+            _log.info(f"⚠️ {message}")
             return False, {'message': message, 'error_type': 'no_files'}
         
-        print(f"📊 Found {total_files} total files to archive")
+        _log.info(f"📊 Found {total_files} total files to archive")
         
         # Archive the files
-        print("🗂️ Starting file archiving process...")
+        _log.info("🗂️ Starting file archiving process...")
         try:
             results = archive_files(files_to_archive, archive_dirs)
-            print("✅ File archiving process completed")
+            _log.info("✅ File archiving process completed")
         except Exception as e:
             error_msg = f"Error during file archiving: {e}"
-            print(f"❌ {error_msg}")
+            _log.error(f"❌ {error_msg}")
             return False, {'message': error_msg, 'error_type': 'archiving_error'}
         
         # Add summary information
@@ -365,24 +409,24 @@ def perform_archive() -> Tuple[bool, dict]:
         has_errors = len(results['errors']) > 0
         
         if files_archived and not has_errors:
-            print(f"🎉 Archive operation completed successfully! {results['total_archived']} files archived.")
+            _log.info(f"🎉 Archive operation completed successfully! {results['total_archived']} files archived.")
             success = True
         elif files_archived and has_errors:
-            print(f"⚠️ Archive operation completed with warnings. {results['total_archived']} files archived, {len(results['errors'])} errors.")
+            _log.warning(f"⚠️ Archive operation completed with warnings. {results['total_archived']} files archived, {len(results['errors'])} errors.")
             success = True  # Partial success - some files were archived
         else:
-            print(f"❌ Archive operation failed. No files were archived. {len(results['errors'])} errors.")
+            _log.error(f"❌ Archive operation failed. No files were archived. {len(results['errors'])} errors.")
             success = False
         
         return success, results
         
     except KeyboardInterrupt:
         error_msg = "Archive operation cancelled by user"
-        print(f"⏹ {error_msg}")
+        _log.info(f"⏹ {error_msg}")
         return False, {'message': error_msg, 'error_type': 'user_cancelled'}
     except Exception as e:
         error_msg = f'Archive operation failed with unexpected error: {e}'
-        print(f"❌ {error_msg}")
+        _log.error(f"❌ {error_msg}")
         return False, {'message': error_msg, 'error_type': 'unexpected_error'}
 
 def get_archive_summary(results: dict) -> str:
@@ -21,6 +21,10 @@ SCOPES = [
 CREDENTIALS_PATH = os.getenv('CREDENTIALS_PATH', 'credentials.json')
 TOKEN_PATH = os.getenv('TOKEN_PATH', 'token.json')
 
+# The Gmail service built by authenticate() and its credentials, reused while those stay valid
+_service_cache = None
+_service_credentials = None
+
 def get_credentials() -> Credentials:
     """
     Manages the OAuth 2.0 authentication flow for the Gmail API.
@@ -80,7 +84,9 @@ def authenticate():
     The main authentication function called by the application.
 
     It retrieves valid credentials and uses them to build and return an
-    authenticated Gmail API service object.
+    authenticated Gmail API service object. The service is kept and returned
+    again by later calls until its credentials are no longer valid, so repeat
+    runs skip reading the token file and building the client.
 
     Returns:
         A Google API service object for interacting with the Gmail API.
@@ -88,8 +94,14 @@ def authenticate():
     Raises:
         Exception: If the authentication process fails for any reason.
     """
+    global _service_cache, _service_credentials
+    if _service_cache is not None and _service_credentials.valid:
+        return _service_cache
     try:
         creds = get_credentials()
-        return build('gmail', 'v1', credentials=creds)
+        # The discovery document bundled with the client library is used; no fetch at startup
+        _service_cache = build('gmail', 'v1', credentials=creds, static_discovery=True)
+        _service_credentials = creds
+        return _service_cache
     except Exception as e:
         raise Exception(f"Authentication failed: {str(e)}") 
\ No newline at end of file
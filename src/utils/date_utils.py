@@ -6,8 +6,106 @@ It supports common date range presets and custom date ranges.
 """
 
 from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import Optional, Tuple
 import re
+import time
+
+# Preset date range codes -> days back from now
+_PRESET_DAYS = {
+    '24h': 1, '1d': 1,
+    '7d': 7, '1w': 7,
+    '30d': 30, '1m': 30,
+    '90d': 90, '3m': 90,
+    '1y': 365,
+}
+
+# Human-readable descriptions of the preset codes
+_PRESET_DESCRIPTIONS = {
+    '24h': 'Last 24 hours',
+    '1d': 'Last 24 hours',
+    '7d': 'Last 7 days',
+    '1w': 'Last week',
+    '30d': 'Last 30 days',
+    '1m': 'Last month',
+    '90d': 'Last 90 days',
+    '3m': 'Last 3 months',
+    '1y': 'Last year'
+}
+
+# The "9 Nov 2023" core of a Date header that RFC 5322 parsing rejected, and its strptime format
+_DATE_CORE_RE = re.compile(r'\d+\s+\w+\s+\d{4}')
+_DATE_CORE_FORMAT = '%d %b %Y'
+
+# dateutil is only needed for the odd non-RFC 5322 Date header, so it is imported on first use
+_date_parser = None
+
+# Last formatted timestamp, reused until the clock moves to the next second
+_last_stamp = [-1, '']
+
+def current_timestamp() -> str:
+    """
+    Get the current local time as 'YYYY-MM-DD HH:MM:SS'.
+    
+    The string is formatted at most once per second, so it is cheap to call
+    for every row of a log.
+    
+    Returns:
+        Formatted timestamp string
+    """
+    sec = int(time.time())
+    if sec != _last_stamp[0]:
+        _last_stamp[0] = sec
+        _last_stamp[1] = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sec))
+    return _last_stamp[1]
+
+def _get_date_parser():
+    """Imports dateutil's parser the first time it is needed and returns it."""
+    global _date_parser
+    if _date_parser is None:
+        from dateutil import parser
+        _date_parser = parser
+    return _date_parser
+
+# Messages from one template often carry identical Date headers
+@lru_cache(maxsize=2048)
+def parse_date_header(date_string: str) -> str:
+    """
+    Parse an email Date header into 'YYYY-MM-DD' format.
+    
+    RFC 5322 headers are read by the stdlib; others fall back to their
+    "9 Nov 2023" core and then to dateutil.
+    
+    Args:
+        date_string: The raw Date header value
+    
+    Returns:
+        Formatted date string, or '' if it cannot be parsed
+    """
+    if not date_string:
+        return ""
+    try:
+        # Date headers are almost always RFC 5322, which the stdlib parses far faster
+        dt = parsedate_to_datetime(date_string)
+        return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+    except (TypeError, ValueError):
+        pass
+    # Most of the rest still carry a "9 Nov 2023" core around an odd time or zone, e.g. a
+    # non-standard timezone name; read just that with one strptime
+    match = _DATE_CORE_RE.search(date_string)
+    if match:
+        try:
+            return datetime.strptime(match.group(0), _DATE_CORE_FORMAT).strftime('%Y-%m-%d')
+        except ValueError:
+            pass
+    date_parser = _get_date_parser()
+    try:
+        # The dateutil parser is very robust and handles most other formats
+        dt = date_parser.parse(date_string)
+        return dt.strftime('%Y-%m-%d')
+    except (date_parser.ParserError, TypeError, OverflowError):
+        return "" # Could not parse even the fallback
 
 def get_date_range_query(date_range: str) -> str:
     """
@@ -28,36 +126,15 @@ def get_date_range_query(date_range: str) -> str:
         return _parse_custom_date_range(date_range)
     
     # Handle preset date ranges
-    date_range = date_range.lower()
-    now = datetime.now()
-    
-    if date_range in ['24h', '1d']:
-        # Last 24 hours
-        start_date = now - timedelta(days=1)
-        return f"after:{start_date.strftime('%Y/%m/%d')}"
-    
-    elif date_range in ['7d', '1w']:
-        # Last 7 days
-        start_date = now - timedelta(days=7)
-        return f"after:{start_date.strftime('%Y/%m/%d')}"
-    
-    elif date_range in ['30d', '1m']:
-        # Last 30 days
-        start_date = now - timedelta(days=30)
-        return f"after:{start_date.strftime('%Y/%m/%d')}"
-    
-    elif date_range in ['90d', '3m']:
-        # Last 90 days
-        start_date = now - timedelta(days=90)
-        return f"after:{start_date.strftime('%Y/%m/%d')}"
-    
-    elif date_range == '1y':
-        # Last year
-        start_date = now - timedelta(days=365)
-        return f"after:{start_date.strftime('%Y/%m/%d')}"
-    
-    else:
+    days = _PRESET_DAYS.get(date_range.lower())
+    if days is None:
         raise ValueError(f"Unknown date range: {date_range}")
+    start_date = datetime.now() - timedelta(days=days)
+    return f"after:{_gmail_date(start_date)}"
+
+def _gmail_date(d) -> str:
+    """Format a date or datetime as Gmail's YYYY/MM/DD search date, without strftime."""
+    return f"{d.year:04d}/{d.month:02d}/{d.day:02d}"
 
 def _parse_custom_date_range(date_range: str) -> str:
     """
@@ -69,26 +146,20 @@ def _parse_custom_date_range(date_range: str) -> str:
     Returns:
         Gmail search query string
     """
+    start_str, end_str = date_range.split(':')
+    
+    # Validate date format
     try:
-        start_str, end_str = date_range.split(':')
-        
-        # Validate date format
         start_date = datetime.strptime(start_str, '%Y-%m-%d')
         end_date = datetime.strptime(end_str, '%Y-%m-%d')
-        
-        if start_date > end_date:
-            raise ValueError("Start date must be before end date")
-        
-        # Convert to Gmail search format
-        start_gmail = start_date.strftime('%Y/%m/%d')
-        end_gmail = end_date.strftime('%Y/%m/%d')
-        
-        return f"after:{start_gmail} before:{end_gmail}"
-    
-    except ValueError as e:
-        if "time data" in str(e):
-            raise ValueError(f"Invalid date format. Use YYYY-MM-DD:YYYY-MM-DD format")
-        raise
+    except ValueError:
+        raise ValueError(f"Invalid date format. Use YYYY-MM-DD:YYYY-MM-DD format")
+    
+    if start_date > end_date:
+        raise ValueError("Start date must be before end date")
+    
+    # Convert to Gmail search format
+    return f"after:{_gmail_date(start_date)} before:{_gmail_date(end_date)}"
 
 def get_date_range_description(date_range: str) -> str:
     """
@@ -108,19 +179,7 @@ def get_date_range_description(date_range: str) -> str:
         return f'From {start_str} to {end_str}'
     
     date_range = date_range.lower()
-    descriptions = {
-        '24h': 'Last 24 hours',
-        '1d': 'Last 24 hours',
-        '7d': 'Last 7 days',
-        '1w': 'Last week',
-        '30d': 'Last 30 days',
-        '1m': 'Last month',
-        '90d': 'Last 90 days',
-        '3m': 'Last 3 months',
-        '1y': 'Last year'
-    }
-    
-    return descriptions.get(date_range, f'Unknown range: {date_range}')
+    return _PRESET_DESCRIPTIONS.get(date_range, f'Unknown range: {date_range}')
 
 def validate_date_range(date_range: str) -> bool:
     """
@@ -2,39 +2,73 @@
 Gmail API Email Utilities
 
 This module provides utilities for working with Gmail API responses and email parsing.
-It handles both raw Gmail API responses and parsed email messages.
+It reads format='full' Gmail API message resources without MIME parsing.
 
 Key Components:
 1. Gmail API Response Processing
    - extract_body: Processes raw Gmail API payload
+   - extract_html_body: The HTML counterpart of extract_body
    - parse_internal_date: Converts Gmail's internal timestamp
+   - get_header, get_payload_plain_text, get_payload_html: Read headers and
+     bodies straight from a format='full' message, without MIME parsing
+   - get_payload_html_bytes: The HTML body left as UTF-8 bytes
 
-2. Email Message Parsing
-   - get_plain_text_body: Extracts plain text from EmailMessage
-   - get_html_body: Extracts HTML content from EmailMessage
-
-3. LinkedIn-specific Parsing
+2. LinkedIn-specific Parsing
    - parse_applied_email_body: Parses LinkedIn application emails
-   - parse_html_for_job_info: Extracts job details from LinkedIn HTML
+   - parse_html_for_job_info: Extracts job details from LinkedIn HTML,
+     with selectolax CSS selectors when it is installed
    - extract_applied_info: Simplified LinkedIn application info extraction
 """
 
-import base64
 import re
-from datetime import datetime
-from typing import Dict, Tuple
-from email.message import EmailMessage
+import time
+from typing import Dict, Optional, Tuple
+from itertools import islice
+from html import unescape as _unescape
+import quopri
+
+# pybase64 decodes with SIMD kernels (picked at runtime, scalar on older CPUs); same API as the stdlib
+try:
+    from pybase64 import urlsafe_b64decode
+except ImportError:
+    from base64 import urlsafe_b64decode
+
+# selectolax finds the job fields with CSS selectors on a real parse; the regexes are used without it
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+
+# Line that precedes the job details in LinkedIn "Applied" emails
+APPLIED_ANCHOR = "Your application was sent to"
+# The job details sit within a few lines of the anchor; never split more than this
+APPLIED_TAIL_CHARS = 2048
+# The anchor at the start of a line, in any case
+_APPLIED_ANCHOR_LINE_RE = re.compile(r'^[^\S\n]*your application was sent to', re.IGNORECASE | re.MULTILINE)
+# Runs of whitespace in extracted HTML text, including decoded and quoted-printable (=C2=A0) non-breaking spaces
+_WHITESPACE_RUN_RE = re.compile(r'(?:\s|=C2=A0)+')
+# LinkedIn job title link and "company · location" paragraph in the HTML body, compiled once
+_HTML_JOB_TITLE_RE = re.compile(r'line-height:\s*1\.25;\s*color:\s*#0a66c2;">\s*(.*?)(?:</a>|</td)', re.DOTALL | re.IGNORECASE)
+_HTML_COMPANY_LOCATION_RE = re.compile(
+    r'<p\s+class=3D"text-system-gray-100\s+text-sm\s+leading-\[20px\]"[^>]*?>\s*(.*?)\s*&m=iddot;\s*(.*?)\s*</p>',
+    re.DOTALL | re.IGNORECASE)
+
+# Declared charsets (and no charset at all) that a part's bytes are decoded as UTF-8 for
+_UTF8_READABLE_CHARSETS = frozenset({None, 'utf-8', 'utf8', 'us-ascii', 'ascii'})
+# charset parameter of a Content-Type header value
+_CHARSET_PARAM_RE = re.compile(r'charset\s*=\s*"?([^";\s]+)', re.IGNORECASE)
 
 # === Gmail API Response Processing ===
 
 def parse_internal_date(internal_date: str) -> str:
     """Convert Gmail internal date to YYYY-MM-DD format, filtering out dates before 2004."""
     try:
-        dt = datetime.fromtimestamp(int(internal_date) / 1000)
+        # Whole seconds in local time, as fromtimestamp gave, without building a datetime or calling strftime
+        t = time.localtime(int(internal_date) // 1000)
         # Check if year is 2004 or later
-        if dt.year < 2004:
+        if t.tm_year < 2004:
             return ""
-        return dt.strftime('%Y-%m-%d')
+        return f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
     except:
         return ""
 
@@ -48,55 +82,97 @@ def extract_body(payload: Dict) -> str:
     Returns:
         str: Decoded email body content
     """
-    if 'parts' in payload:
-        for part in payload['parts']:
-            if part['mimeType'] == 'text/plain':
-                data = part['body'].get('data', '')
-                if data:
-                    return base64.urlsafe_b64decode(data).decode('utf-8', errors='ignore')
-    elif 'body' in payload and payload['body'].get('data'):
-        return base64.urlsafe_b64decode(payload['body']['data']).decode('utf-8', errors='ignore')
-    return ''
-
-# === Email Message Parsing ===
-
-def get_plain_text_body(msg: EmailMessage) -> str:
-    """Extract plain text body from email message."""
-    if msg.is_multipart():
-        for part in msg.walk():
-            ctype = part.get_content_type()
-            cdispo = str(part.get('Content-Disposition'))
-            if ctype == 'text/plain' and 'attachment' not in cdispo:
-                try:
-                    return part.get_payload(decode=True).decode('utf-8', errors='ignore')
-                except:
-                    return part.get_payload(decode=True).decode('latin-1', errors='ignore')
-    else:
-        try:
-            return msg.get_payload(decode=True).decode('utf-8', errors='ignore')
-        except:
-            return msg.get_payload(decode=True).decode('latin-1', errors='ignore')
-    return ""
-
-def get_html_body(msg: EmailMessage) -> str:
-    """Extract HTML body from email message."""
-    if msg.is_multipart():
-        for part in msg.walk():
-            ctype = part.get_content_type()
-            cdispo = str(part.get('Content-Disposition'))
-            if ctype == 'text/html' and 'attachment' not in cdispo:
-                try:
-                    return part.get_payload(decode=True).decode('utf-8', errors='ignore')
-                except:
-                    return part.get_payload(decode=True).decode('latin-1', errors='ignore')
-    else:
-        ctype = msg.get_content_type()
-        if ctype == 'text/html':
-            try:
-                return msg.get_payload(decode=True).decode('utf-8', errors='ignore')
-            except:
-                return msg.get_payload(decode=True).decode('latin-1', errors='ignore')
-    return ""
+    if 'parts' not in payload:
+        # Single-part message: return its body whatever the type
+        return _decode_part_body(payload)
+    # Search nested multiparts too (e.g. text/plain inside multipart/alternative inside multipart/mixed),
+    # decoding only the part found
+    return _find_part_body(payload, 'text/plain')
+
+def _decode_payload(payload: bytes, charset: Optional[str]) -> str:
+    """Decode a part's body bytes with its declared charset; ASCII, undeclared and unknown charsets are read as UTF-8."""
+    if charset in _UTF8_READABLE_CHARSETS:
+        charset = 'utf-8'
+    try:
+        return payload.decode(charset, errors='ignore')
+    except LookupError:
+        return payload.decode('utf-8', errors='ignore')
+
+def _part_charset(part: Dict) -> Optional[str]:
+    """The lower-cased charset of a Gmail API message part's Content-Type header, or None."""
+    for header in part.get('headers', ()):
+        if header['name'].lower() == 'content-type':
+            match = _CHARSET_PARAM_RE.search(header['value'])
+            return match.group(1).lower() if match else None
+    return None
+
+def _decode_part_body(part: Dict) -> str:
+    """Decode the base64url body data of one Gmail API message part with its declared charset."""
+    data = part.get('body', {}).get('data')
+    return _decode_payload(urlsafe_b64decode(data), _part_charset(part)) if data else ''
+
+def _find_part(part: Dict, mime_type: str) -> Optional[Dict]:
+    """Depth-first search of a Gmail API payload for the first non-attachment part of mime_type that has body data."""
+    if part.get('mimeType') == mime_type and not part.get('filename') and part.get('body', {}).get('data'):
+        return part
+    for child in part.get('parts', ()):
+        found = _find_part(child, mime_type)
+        if found is not None:
+            return found
+    return None
+
+def _find_part_body(part: Dict, mime_type: str) -> str:
+    """Depth-first search of a Gmail API payload for the first non-attachment part of mime_type, decoded."""
+    found = _find_part(part, mime_type)
+    return _decode_part_body(found) if found is not None else ''
+
+def extract_html_body(payload: Dict) -> str:
+    """
+    Extract and decode the HTML body from Gmail API payload.
+    
+    Args:
+        payload (Dict): Raw Gmail API message payload
+    
+    Returns:
+        str: Decoded HTML of the first text/html part, or '' if there is none
+    """
+    return _find_part_body(payload, 'text/html')
+
+def get_header(msg: Dict, name: str) -> Optional[str]:
+    """
+    Look up a header of a Gmail API message (format='full') by name.
+    
+    Args:
+        msg (Dict): Gmail API message resource
+        name (str): Header name, matched case-insensitively
+    
+    Returns:
+        Optional[str]: Header value, or None if the header is absent
+    """
+    name = name.lower()
+    for header in msg['payload'].get('headers', ()):
+        if header['name'].lower() == name:
+            return header['value']
+    return None
+
+def get_payload_plain_text(msg: Dict) -> str:
+    """Extract the plain text body from a Gmail API message (format='full')."""
+    # Single-part messages return their body whatever the type
+    return extract_body(msg['payload'])
+
+def get_payload_html(msg: Dict) -> str:
+    """Extract the HTML body from a Gmail API message (format='full')."""
+    return _find_part_body(msg['payload'], 'text/html')
+
+def get_payload_html_bytes(msg: Dict) -> bytes:
+    """Extract the HTML body from a Gmail API message (format='full') as undecoded UTF-8 bytes."""
+    part = _find_part(msg['payload'], 'text/html')
+    if part is None:
+        return b''
+    raw = urlsafe_b64decode(part['body']['data'])
+    charset = _part_charset(part)
+    # Bodies in another charset are re-encoded, so callers can always read the bytes as UTF-8
+    return raw if charset in _UTF8_READABLE_CHARSETS else _decode_payload(raw, charset).encode('utf-8')
 
 # === LinkedIn-specific Parsing ===
 
@@ -106,25 +182,13 @@ def parse_applied_email_body(plain_text_body: str) -> dict:
     company_name = ""
     location = ""
 
-    lines = plain_text_body.splitlines()
-    
-    start_index = -1
-    for i, line in enumerate(lines):
-        if "Your application was sent to" in line:
-            start_index = i
-            break
-    
-    if start_index == -1:
+    start = plain_text_body.find(APPLIED_ANCHOR)
+    if start == -1:
         raise ValueError("Anchor phrase 'Your application was sent to' not found in plain text body.")
 
-    # Find the next 3 non-empty lines after the anchor
-    relevant_lines = []
-    current_index = start_index + 1
-    while len(relevant_lines) < 3 and current_index < len(lines):
-        line = lines[current_index].strip()
-        if line:
-            relevant_lines.append(line)
-        current_index += 1
+    # Find the next 3 non-empty lines after the anchor, splitting only the text just past it
+    following = (line.strip() for line in plain_text_body[start:start + APPLIED_TAIL_CHARS].splitlines()[1:])
+    relevant_lines = list(islice(filter(None, following), 3))
     
     if len(relevant_lines) >= 3:
         job_title = relevant_lines[0].strip()
@@ -144,35 +208,57 @@ def parse_applied_email_body(plain_text_body: str) -> dict:
         "Location": location
     }
 
+def _clean_html_text(text: str) -> str:
+    """Decode HTML entities and quoted-printable non-breaking spaces, then collapse whitespace."""
+    return _WHITESPACE_RUN_RE.sub(' ', _unescape(text)).strip()
+
+def _select_job_info(html_content: str) -> Tuple[str, str, str]:
+    """
+    Find the job fields in LinkedIn HTML with CSS selectors (requires selectolax).
+    
+    Args:
+        html_content (str): HTML body, optionally still quoted-printable as in 'show original'
+    
+    Returns:
+        Tuple[str, str, str]: (job title, company name, location), each "" if not found
+    """
+    if '=3D' in html_content:
+        html_content = quopri.decodestring(html_content.encode('utf-8')).decode('utf-8', errors='ignore')
+    tree = HTMLParser(html_content)
+    job_title, company_name, location = "", "", ""
+
+    title_node = tree.css_first('a[style*="line-height: 1.25"][style*="#0a66c2"]')
+    if title_node is not None:
+        job_title = ' '.join(title_node.text().split())
+
+    # The "company · location" line
+    line_node = tree.css_first('p.text-system-gray-100.text-sm')
+    if line_node is not None:
+        company, sep, place = line_node.text().partition('·')
+        if sep:
+            company_name, location = ' '.join(company.split()), ' '.join(place.split())
+    return job_title, company_name, location
+
 def parse_html_for_job_info(html_content: str) -> dict:
     """Extract job info from HTML content."""
     job_title = ""
     company_name = ""
     location = ""
 
-    # Regex for Job Title
-    job_title_match = re.search(
-        r'line-height:\s*1\.25;\s*color:\s*#0a66c2;">\s*(.*?)(?:</a>|</td)',
-        html_content, re.DOTALL | re.IGNORECASE
-    )
+    if HTMLParser is not None:
+        job_title, company_name, location = _select_job_info(html_content)
+
+    # Regex for Job Title, if the selectors found none
+    job_title_match = _HTML_JOB_TITLE_RE.search(html_content) if not job_title else None
     if job_title_match:
-        job_title = job_title_match.group(1).strip()
-        job_title = job_title.replace('&amp;', '&').replace('&nbsp;', ' ').replace('=C2=A0', ' ')
-        job_title = re.sub(r'\s+', ' ', job_title).strip()
+        job_title = _clean_html_text(job_title_match.group(1))
 
     # Regex for Company Name and Location
-    company_location_match = re.search(
-        r'<p\s+class=3D"text-system-gray-100\s+text-sm\s+leading-\[20px\]"[^>]*?>\s*(.*?)\s*&m=iddot;\s*(.*?)\s*</p>',
-        html_content, re.DOTALL | re.IGNORECASE
-    )
+    company_location_match = _HTML_COMPANY_LOCATION_RE.search(html_content) if not company_name else None
     
     if company_location_match:
-        company_name = company_location_match.group(1).strip()
-        location = company_location_match.group(2).strip()
-        company_name = company_name.replace('&amp;', '&').replace('&nbsp;', ' ').replace('=C2=A0', ' ')
-        location = location.replace('&amp;', '&').replace('&nbsp;', ' ').replace('=C2=A0', ' ')
-        company_name = re.sub(r'\s+', ' ', company_name).strip()
-        location = re.sub(r'\s+', ' ', location).strip()
+        company_name = _clean_html_text(company_location_match.group(1))
+        location = _clean_html_text(company_location_match.group(2))
 
     return {
         "Job Title": job_title,
@@ -191,14 +277,16 @@ def extract_applied_info(body: str) -> Tuple[str, str, str]:
     Returns:
         Tuple[str, str, str]: (company, title, location)
     """
-    lines = [line.strip() for line in body.splitlines() if line.strip()]
     company, title, location = '', '', ''
-    for i, line in enumerate(lines):
-        if line.lower().startswith("your application was sent to"):
-            company = line.split("to")[-1].strip()
-            title = lines[i + 1] if i + 1 < len(lines) else ''
-            location = lines[i + 2] if i + 2 < len(lines) else ''
-            if 'remote' in location.lower():
-                location += ' (Remote)'
-            break
-    return company, title, location 
\ No newline at end of file
+    # Find the anchor line in C, then split only the text just past it
+    match = _APPLIED_ANCHOR_LINE_RE.search(body)
+    if match:
+        line_end = body.find('\n', match.start())
+        if line_end < 0:
+            line_end = len(body)
+        company = body[match.start():line_end].split("to")[-1].strip()
+        following = (line.strip() for line in body[line_end + 1:line_end + 1 + APPLIED_TAIL_CHARS].splitlines())
+        title, location = (list(islice(filter(None, following), 2)) + ['', ''])[:2]
+        if 'remote' in location.lower():
+            location += ' (Remote)'
+    return company, title, location
@@ -2,6 +2,13 @@ import os
 import csv
 from datetime import datetime
 
+# Write buffer for report CSVs, so a report goes out in a few large writes
+_CSV_BUFFER_SIZE = 1 << 20
+
+# Fixed report and failure-log columns, in output order
+REPORT_FIELDNAMES = ("Company Name", "Job Title", "Status", "Date", "Location", "Metadata Subject", "Comment")
+FAILURE_FIELDNAMES = ('Timestamp', 'Email ID', 'Label', 'Reason', 'Date', 'Company Name', 'Job Title', 'Location', 'Status', 'Metadata', 'Comment')
+
 def write_data_to_csv(data: list, filename: str):
     """
     Writes a list of dictionaries to a CSV file.
@@ -12,12 +19,13 @@ def write_data_to_csv(data: list, filename: str):
         data: A list of dictionaries, where each dictionary represents a row.
         filename: The path to the output CSV file.
     """
-    fieldnames = ["Company Name", "Job Title", "Status", "Date", "Location", "Metadata Subject", "Comment"]
+    fieldnames = REPORT_FIELDNAMES
     try:
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction='ignore')
-            writer.writeheader()
-            writer.writerows(data)
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            # Fixed columns only: extra keys are ignored and missing ones left blank, as DictWriter did
+            writer.writerows([[row.get(key, '') for key in fieldnames] for row in data])
     except Exception as e:
         print(f"❌ An error occurred while writing to '{filename}': {e}")
 
@@ -32,13 +40,13 @@ def write_failures_to_csv(failures: list, filename: str):
         filename: The path to the failure log file.
     """
     file_exists = os.path.isfile(filename)
-    fieldnames = ['Timestamp', 'Email ID', 'Label', 'Reason', 'Date', 'Company Name', 'Job Title', 'Location', 'Status', 'Metadata', 'Comment']
     try:
-        with open(filename, 'a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        with open(filename, 'a', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile)
             if not file_exists:
-                writer.writeheader()
-            writer.writerows(failures)
+                writer.writerow(FAILURE_FIELDNAMES)
+            # Values in column order with csv.writer, as DictWriter would write them but without its per-row dict handling
+            writer.writerows([[row.get(key, '') for key in FAILURE_FIELDNAMES] for row in failures])
     except Exception as e:
         print(f"Error writing failures to CSV: {e}")
 
@@ -58,9 +66,10 @@ def archive_report(output_file: str, archive_dir: str) -> str:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             archive_file_name = f"job_application_status_{timestamp}.csv"
             archive_path = os.path.join(archive_dir, archive_file_name)
-            os.rename(output_file, archive_path)
+            # os.replace also overwrites an existing destination on Windows, where os.rename fails
+            os.replace(output_file, archive_path)
             print(f"🗄️ Previous output file archived.")
-            return os.path.abspath(archive_path)
+            return archive_path if os.path.isabs(archive_path) else os.path.abspath(archive_path)
         except Exception as e:
             print(f"⚠️ Warning: Could not archive old output file. It will be overwritten. Error: {e}")
     return None 
\ No newline at end of file
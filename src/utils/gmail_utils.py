@@ -1,10 +1,29 @@
-import base64
-import email
-from email import policy
-from email.message import EmailMessage
+import threading
+import time
+import weakref
 from typing import List, Dict, Optional
 from googleapiclient.errors import HttpError
 
+# Lower-cased label name -> label ID for each service object, listed once per service
+_LABEL_ID_CACHE = weakref.WeakKeyDictionary()
+# Held while a service's labels are listed, so concurrent lookups list them only once
+_LABEL_ID_LOCK = threading.Lock()
+
+# Partial-response masks: message IDs from list calls, and for format='full' gets
+# the labels, headers and body data, down to the second level of parts
+_LIST_FIELDS = 'messages(id),nextPageToken,resultSizeEstimate'
+_FULL_MESSAGE_FIELDS = ('id,internalDate,labelIds,payload(mimeType,filename,headers,body/data,'
+                        'parts(mimeType,filename,headers,body/data,parts))')
+
+_FULL_GET_PARAMS = {'format': 'full', 'fields': _FULL_MESSAGE_FIELDS}
+
+# Statuses of gets that are worth sending again (rate limit, server errors)
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Times those gets are re-sent, waiting FETCH_RETRY_DELAY seconds, doubled after each try,
+# unless the response says how long to wait (Retry-After)
+FETCH_MAX_RETRIES = 3
+FETCH_RETRY_DELAY = 1.0
+
 def get_label_id(service, label_name: str) -> Optional[str]:
     """
     Retrieves the Gmail Label ID for a given human-readable label name.
@@ -17,17 +36,20 @@ def get_label_id(service, label_name: str) -> Optional[str]:
         The ID of the label, or None if not found.
     """
     try:
-        results = service.users().labels().list(userId='me').execute()
-        all_labels = results.get('labels', [])
-        for label in all_labels:
-            if label['name'].lower() == label_name.lower():
-                return label['id']
-        return None
+        label_ids = _LABEL_ID_CACHE.get(service)
+        if label_ids is None:
+            with _LABEL_ID_LOCK:
+                label_ids = _LABEL_ID_CACHE.get(service)
+                if label_ids is None:
+                    results = service.users().labels().list(userId='me').execute()
+                    label_ids = {label['name'].lower(): label['id'] for label in results.get('labels', [])}
+                    _LABEL_ID_CACHE[service] = label_ids
+        return label_ids.get(label_name.lower())
     except Exception as e:
         print(f"Error getting label ID for {label_name}: {e}")
         return None
 
-def fetch_messages(service, label_name: str, date_query: str = "") -> List[Dict]:
+def fetch_messages(service, label_name: str, date_query: str = "", extra_query: str = "") -> List[Dict]:
     """
     Fetches all message IDs from Gmail for a specific label, handling pagination.
 
@@ -35,6 +57,8 @@ def fetch_messages(service, label_name: str, date_query: str = "") -> List[Dict]
         service: The authenticated Gmail API service object.
         label_name: The name of the Gmail label to fetch emails from.
         date_query: Optional Gmail search query for date filtering (e.g., "after:2024/01/01")
+        extra_query: Optional further Gmail search terms (e.g., "from:linkedin.com"), so emails
+            that would be discarded are never listed or downloaded
 
     Returns:
         A list of message dictionaries, each containing an 'id'.
@@ -50,18 +74,20 @@ def fetch_messages(service, label_name: str, date_query: str = "") -> List[Dict]
         search_params = {
             'userId': 'me',
             'labelIds': [label_id],
-            'maxResults': 500
+            'maxResults': 500,
+            'fields': _LIST_FIELDS
         }
         
-        # Add date query if provided
-        if date_query:
-            search_params['q'] = date_query
-            print(f"Searching {label_name} with date filter: {date_query}")
+        # Add the date and extra search terms, if any, so Gmail filters before listing
+        query = " ".join(filter(None, (date_query, extra_query)))
+        if query:
+            search_params['q'] = query
+            print(f"Searching {label_name} with filter: {query}")
 
         response = service.users().messages().list(**search_params).execute()
         
         total_messages = response.get('resultSizeEstimate', 0)
-        if date_query:
+        if query:
             print(f"Found approximately {total_messages} messages in {label_name} (filtered)")
         else:
             print(f"Found approximately {total_messages} messages in {label_name}")
@@ -81,24 +107,41 @@ def fetch_messages(service, label_name: str, date_query: str = "") -> List[Dict]
     print(f"✅ Successfully retrieved {len(messages)} messages from {label_name}")
     return messages
 
-def get_full_message(service, msg_id: str) -> Optional[EmailMessage]:
+def retry_delay(error: HttpError, attempt: int) -> float:
+    """Seconds to wait before retrying a failed get: the server's Retry-After if it sent one, else exponential backoff."""
+    try:
+        return float(error.resp.get('retry-after'))
+    except (AttributeError, TypeError, ValueError):
+        return FETCH_RETRY_DELAY * 2 ** attempt
+
+def execute_with_retry(request, http=None):
+    """Executes request (on http if given), retrying rate-limit and server errors up to FETCH_MAX_RETRIES times."""
+    for attempt in range(FETCH_MAX_RETRIES + 1):
+        try:
+            return request.execute(http=http)
+        except HttpError as error:
+            if attempt == FETCH_MAX_RETRIES or error.resp.status not in RETRYABLE_STATUSES:
+                raise
+            time.sleep(retry_delay(error, attempt))
+
+def get_full_message(service, msg_id: str) -> Optional[Dict]:
     """
-    Retrieves a single, complete email message by its ID.
+    Retrieves a single email message by its ID.
     
-    The message is fetched in 'raw' format and decoded into a standard
-    Python email.message.Message object for easy parsing.
+    The message is fetched in 'full' format, so Gmail returns it already split
+    into MIME parts; read it with extract_body / extract_html_body on its
+    'payload', or get_header, instead of decoding and reparsing the raw message.
 
     Args:
         service: The authenticated Gmail API service object.
         msg_id: The ID of the message to retrieve.
 
     Returns:
-        An email.message.Message object, or None if an error occurs.
+        The Gmail API message resource (id, internalDate, labelIds, payload), or None if an error occurs.
     """
     try:
-        msg_full = service.users().messages().get(userId='me', id=msg_id, format='raw').execute()
-        raw = base64.urlsafe_b64decode(msg_full['raw'].encode('ASCII'))
-        return email.message_from_bytes(raw, policy=policy.default)
+        request = service.users().messages().get(userId='me', id=msg_id, **_FULL_GET_PARAMS)
+        return execute_with_retry(request)
     except HttpError as error:
         print(f"HTTP error fetching message ID {msg_id}: {error}")
-        return None 
\ No newline at end of file
+        return None
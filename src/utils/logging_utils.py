@@ -1,7 +1,46 @@
 import sys
 import os
+import time
 from datetime import datetime
 
+# Write buffer for the run log; it is flushed at most every LOG_FLUSH_INTERVAL seconds and on close
+LOG_FILE_BUFFER_SIZE = 1 << 16
+LOG_FLUSH_INTERVAL = 0.5
+
+class Tee(object):
+    """
+    Writes to a console stream and one or more log files at once.
+
+    The console is flushed whenever a line is complete, so output (and any
+    reader of it, such as the GUI) sees each line as it is printed. The log
+    files are flushed with a completed line only if LOG_FLUSH_INTERVAL seconds
+    have passed since they were last flushed; closing them writes out the rest.
+    """
+    def __init__(self, console, *files):
+        """Initializes the Tee with the console stream and the log files."""
+        self.console = console
+        self.files = files
+        self._last_flush = time.monotonic()
+    def write(self, obj):
+        """Writes the given text to the console and every log file."""
+        self.console.write(obj)
+        for f in self.files:
+            f.write(obj)
+        # print() writes the text and the newline separately; act once per line, not per fragment
+        if '\n' in obj:
+            self.console.flush()
+            now = time.monotonic()
+            if now - self._last_flush >= LOG_FLUSH_INTERVAL:
+                self._flush_files(now)
+    def flush(self):
+        """Flushes the console and all log files."""
+        self.console.flush()
+        self._flush_files(time.monotonic())
+    def _flush_files(self, now):
+        for f in self.files:
+            f.flush()
+        self._last_flush = now
+
 def setup_logging(log_file_path="data/logs/parser_run.log"):
     """
     Sets up logging to redirect stdout to both the console and a log file.
@@ -14,22 +53,7 @@ def setup_logging(log_file_path="data/logs/parser_run.log"):
     """
     os.makedirs(os.path.dirname(log_file_path), exist_ok=True)
     original_stdout = sys.stdout
-    log_file = open(log_file_path, 'a', encoding='utf-8')
-
-    class Tee(object):
-        """A helper class to redirect stdout to multiple file-like objects."""
-        def __init__(self, *files):
-            """Initializes the Tee object with one or more file targets."""
-            self.files = files
-        def write(self, obj):
-            """Writes the given object to all registered files."""
-            for f in self.files:
-                f.write(obj)
-                f.flush()
-        def flush(self):
-            """Flushes all registered files."""
-            for f in self.files:
-                f.flush()
+    log_file = open(log_file_path, 'a', encoding='utf-8', buffering=LOG_FILE_BUFFER_SIZE)
 
     sys.stdout = Tee(original_stdout, log_file)
     print(f"\n\n--- Parser started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ---")
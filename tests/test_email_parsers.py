@@ -0,0 +1,43 @@
+import os
+import sys
+
+import pytest
+
+# The app imports its modules from src/, as main.py sets up
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from parsers.linkedin import email_parsers
+
+# A Viewed/Rejected body in LinkedIn's markup, with the decoys the selectolax path must skip:
+# a brand-coloured button, a background-colour link and a middle-dot line with markup before the dot
+LINKEDIN_HTML = '''<html><body><table><tr><td>
+<a href="https://www.linkedin.com/comm/jobs/view/1" style="display: inline-block; background-color: #0a66c2; color: #ffffff;">View job</a>
+<p class="text-md"><b>Note</b> · not this line</p>
+<a href="https://www.linkedin.com/comm/jobs/view/123" style="font-size: 16px; line-height: 1.25; color: #0a66c2;">Senior Data Engineer, R&amp;D</a>
+<p class="text-system-gray-100 text-sm leading-[20px]">AT&amp;T · Dallas, TX (Hybrid)</p>
+<a style="background-color: #0a66c2;">Apply</a>
+</td></tr></table></body></html>'''
+
+EXPECTED = ('AT&T', 'Dallas, TX (Hybrid)', 'Senior Data Engineer, R&D')
+
+
+@pytest.fixture
+def regex_only(monkeypatch):
+    monkeypatch.setattr(email_parsers, 'HTMLParser', None)
+
+
+@pytest.mark.parametrize('body', [LINKEDIN_HTML, LINKEDIN_HTML.encode('utf-8')], ids=['str', 'bytes'])
+def test_regex_path(regex_only, body):
+    assert email_parsers._parse_html_fields(body) == EXPECTED
+
+
+@pytest.mark.parametrize('body', [LINKEDIN_HTML, LINKEDIN_HTML.encode('utf-8')], ids=['str', 'bytes'])
+def test_selectolax_path_matches_regex_path(body):
+    pytest.importorskip('selectolax')
+    assert email_parsers._parse_html_fields(body) == EXPECTED
+
+
+def test_selectolax_title_keeps_spaces_between_nested_text():
+    pytest.importorskip('selectolax')
+    body = '<a style="line-height: 1.25; color: #0a66c2;">Senior <b>Data</b> Engineer</a>'
+    assert email_parsers._parse_html_fields(body)[2] == 'Senior Data Engineer'